@@ -9,11 +9,17 @@ ROLE : Modélise une ou plusieurs traces GPX provenant d'un récepteur GPS
        Possibilité d'afficher certaines caractéristiques d'une trace GPX (Altitude Min Max, Duree et Vitesse moyenne du parcours,
        Nombre de points, Longueur 2D et 3D du parcours)
 
-EMPLOI : Bibliothèque de 3 classes : Point, Segment, Relief
+EMPLOI : Bibliothèque de 8 classes : Point, PointVue, Segment, SegmentColonnaire, Relief, CacheTraces, Catalogue, 
+                                     TracesBinaires
          Classe Point : Définition d'un objet Point par ses caractéristiques Longitude, Latitude, Elevation, Heure de relevé
+         Classe PointVue : Point léger lisant ses caractéristiques dans les colonnes d'un SegmentColonnaire
          Classe Segment : Liste d'objets Points ; Propose les services d'affichage des caractéristiques d'une trace GPX
+         Classe SegmentColonnaire : Segment stocké en colonnes (tableaux numpy) pour les traces volumineuses
          Classe Relief : Ensemble de Segments ; Propose les services de génération d'un MNT et d'affichage 3D du relief 
                          à partir d'un dossier de trace(s) GPX
+         Classe CacheTraces : Cache disque des points lus dans des fichiers GPX, pour ne pas les relire à chaque MNT
+         Classe Catalogue : Index SQLite des métadonnées (emprise, période, activité...) d'une archive de fichiers GPX
+         Classe TracesBinaires : Conteneur binaire de traces converties depuis le GPX, chargé sans analyse ni recopie
          Voir Fichier Test : PyGPXRelief_test.py à la racine de ce fichier
        
 AUTEURS  : GBODJO Yawogan Jean Eudes (gyawog@yahoo.fr) && FATOU Sylla (syllakine42@yahoo.fr)
@@ -26,18 +32,51 @@ VERSION : 0.1 (06/11/2017)
 
 from math import sqrt, pi, cos
 import gpxpy
+from gpxpy import gpxfield
+from gpxpy.gpx import GPXException
 import glob
 import os
+import hashlib
+import tempfile
+import sqlite3
+import gzip
+import bz2
+import lzma
+import zipfile
+import struct
+import mmap
+import shutil
+import sys
+import operator
+import io
+import asyncio
+import numpy as np
 import scipy as sp
 from scipy.interpolate import griddata
+from scipy.spatial import cKDTree
 #from osgeo import gdal, osr, gdal_array
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d.axes3d import Axes3D
 import random
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+import time
+import calendar
+from datetime import datetime
+from xml.etree import ElementTree
+from array import array
 
 # Variables Constantes utilisées
 
 RAYON_TERRE = float(6371000) # rayon moyen de la Terre en mètres
+NATURE_TRACE = 0 # nature (colonne int8) d'un point de trace (balise trkpt)
+NATURE_ROUTE = 1 # nature d'un point de route (balise rtept)
+NATURE_WAYPOINT = 2 # nature d'un waypoint (balise wpt)
+NATURES_POINTS = {'trkpt':NATURE_TRACE,'rtept':NATURE_ROUTE,'wpt':NATURE_WAYPOINT} # balises GPX des points lus par la lecture au fil de l'eau
+NATURES_RELIEF = (NATURE_TRACE,NATURE_WAYPOINT) # natures des points interpolés par Relief (une route est prévue, non relevée)
+TEMPS_ABSENT = np.iinfo(np.int64).min # valeur de la colonne des temps (int64) d'un point sans heure de relevé
+CHAMPS_GPX = ('longitude','latitude','elevation','time') # seuls champs gpxpy analysés par Segment.lire_fichier_GPX
+DECOMPRESSEURS = {'.gz':gzip.open,'.bz2':bz2.open,'.xz':lzma.open} # fichiers GPX compressés lus sans décompression sur disque
 
 # Définition des differentes classes de la bibliothèque
 
@@ -45,37 +84,53 @@ class Point(object) :
     """
     ROLE : Définir un point avec ses coordonnées géographiques (Longitude, Latitude, Altitude) et son heure de relevé
            Et Calculer les distances 2D et 3D par rapport à un autre point
+           Le point porte aussi sa nature (point de trace, de route ou waypoint) et les rangs de sa trace et de son tronçon
     ATTRIBUTS : 
         __longitude : float
         __latitude : float
         __elevation :float
-        __heure :  str
+        __instant : float (instant de relevé en secondes depuis le 01/01/1970 UTC, None si absent)
+        __nature : int
+        __trace : int
+        __troncon : int
     SERVICES :
-        def __init__(outSelf,inLon,inLat,inAlt,inHeure):
+        def __init__(outSelf,inLon,inLat,inAlt,inHeure,inNature=NATURE_TRACE,inTrace=0,inTroncon=0):
         def __str__(inSelf): #return str
         def __repr__(inSelf): #return str 
         def longitude (inSelf): #return float
         def latitude (inSelf): #return float
         def elevation (inSelf): #return float
+        def heure (inSelf): #return str
+        def instant (inSelf): #return float
+        def nature (inSelf): #return int
+        def trace (inSelf): #return int
+        def troncon (inSelf): #return int
         def distance2D (inSelf): #return float
         def distance3D (inSelf): #return float  
     """
     
-    def __init__(outSelf,inLon,inLat,inAlt,inHeure):
+    def __init__(outSelf,inLon,inLat,inAlt,inHeure,inNature=NATURE_TRACE,inTrace=0,inTroncon=0):
         """
         Initialisation de la classe Point avec :
         ENTREES : 
             inLon : float #longitude
             inLat : float #latitude
-            inAlt : float #elevation
-            inHeure : str #heure
+            inAlt : float #elevation (None si absente : NaN)
+            inHeure : instant de relevé : float (secondes depuis le 01/01/1970 UTC), datetime (heure GPX lue par gpxpy, 
+                      UTC si sans fuseau), str "10:20:14" (heure sans date, comptée depuis 0h0'0") ou None si absent
+            inNature : int #nature du point : NATURE_TRACE (par défaut), NATURE_ROUTE ou NATURE_WAYPOINT
+            inTrace : int #rang de la trace (ou de la route) du point dans son fichier GPX, -1 pour un waypoint
+            inTroncon : int #rang du tronçon (trkseg) du point dans sa trace, -1 pour un waypoint
         """
         object.__init__(outSelf) # appel du constructeur de la classe Object
         # définition des attributs Longitude, Latitude, Elevation et Heure du Point
         outSelf.__longitude=float(inLon)
         outSelf.__latitude=float(inLat)
-        outSelf.__elevation=float(inAlt)
-        outSelf.__heure=str(inHeure)
+        outSelf.__elevation=float('nan') if inAlt is None else float(inAlt)
+        outSelf.__instant=_instant_releve(inHeure)
+        outSelf.__nature=int(inNature)
+        outSelf.__trace=int(inTrace)
+        outSelf.__troncon=int(inTroncon)
         
     def __str__(inSelf): #return str
         """
@@ -83,7 +138,7 @@ class Point(object) :
         composée de sa Longitude, Latitude, son Elevation et l'Heure de relevé
         """
         return "Longitude : " + str(inSelf.__longitude) + "\n Latitude : " + str(inSelf.__latitude)+\
-               "\n Elevation : " + str(inSelf.__elevation)+ "\n Heure de relevé : " + str(inSelf.__heure)
+               "\n Elevation : " + str(inSelf.__elevation)+ "\n Heure de relevé : " + str(inSelf.heure())
     
     def __repr__(inSelf): #return str 
         
@@ -113,9 +168,34 @@ class Point(object) :
     
     def heure (inSelf): #return str
         """
-        Retourne l'heure de relevé du point 
+        Retourne l'heure de relevé du point ("10:20:14", UTC) pour l'affichage ; None si le point n'a pas d'heure.
+        Les calculs (durées, vitesses) utilisent l'instant de relevé
         """
-        return inSelf.__heure
+        return _instant_en_heure(inSelf.__instant)
+    
+    def instant (inSelf): #return float
+        """
+        Retourne l'instant de relevé du point en secondes depuis le 01/01/1970 (UTC) ; None si le point n'a pas d'heure
+        """
+        return inSelf.__instant
+    
+    def nature (inSelf): #return int
+        """
+        Retourne la nature du point : NATURE_TRACE, NATURE_ROUTE ou NATURE_WAYPOINT
+        """
+        return inSelf.__nature
+    
+    def trace (inSelf): #return int
+        """
+        Retourne le rang de la trace (ou de la route) du point dans son fichier GPX, -1 pour un waypoint
+        """
+        return inSelf.__trace
+    
+    def troncon (inSelf): #return int
+        """
+        Retourne le rang du tronçon (trkseg) du point dans sa trace, -1 pour un waypoint
+        """
+        return inSelf.__troncon
     
     def distance2D (inSelf, inAutrePoint) : #return float
         """
@@ -154,43 +234,160 @@ class Point(object) :
                                                       # calcul des écarts aux carrés entre longitudes et latitudes
         return dist3D
 
+class PointVue(Point) :
+    """
+    ROLE : Vue légère sur le point de rang donné d'un objet SegmentColonnaire. 
+           Les caractéristiques (Longitude, Latitude, Elevation, Heure) ne sont pas copiées : 
+           elles sont lues à la demande dans les colonnes du segment. 
+           Tous les services de la classe Point (distance2D, distance3D...) restent disponibles.
+    ATTRIBUTS :
+        __segment : SegmentColonnaire
+        __rang : int
+    SERVICES :
+        def __init__(outSelf,inSegment,inRang):
+        def __repr__(inSelf): #return str
+        def longitude (inSelf): #return float
+        def latitude (inSelf): #return float
+        def elevation (inSelf): #return float
+        def instant (inSelf): #return float
+        def nature (inSelf): #return int
+        def trace (inSelf): #return int
+        def troncon (inSelf): #return int
+    """
+    
+    def __init__(outSelf,inSegment,inRang):
+        """
+        Initialisation de la classe PointVue avec :
+        ENTREES : 
+            inSegment : SegmentColonnaire #segment contenant le point
+            inRang : int #rang du point dans le segment
+        """
+        object.__init__(outSelf) # le constructeur de la classe Point n'est pas appelé : aucune valeur n'est copiée
+        outSelf.__segment=inSegment
+        outSelf.__rang=inRang
+    
+    def __repr__(inSelf): #return str
+        """
+        Chaîne pour affichage de débogage
+        """
+        return str({'longitude':inSelf.longitude(),'latitude':inSelf.latitude(),
+                    'elevation':inSelf.elevation(),'heure':inSelf.heure(),'nature':inSelf.nature()})
+    
+    def longitude (inSelf): #return float
+        """
+        Retourne la longitude du point
+        """
+        return float(inSelf.__segment.colonnes()[0][inSelf.__rang])
+    
+    def latitude (inSelf): #return float
+        """
+        Retourne la latitude du point
+        """
+        return float(inSelf.__segment.colonnes()[1][inSelf.__rang])
+    
+    def elevation (inSelf): #return float
+        """
+        Retourne l'elevation du point
+        """
+        return float(inSelf.__segment.colonnes()[2][inSelf.__rang])
+    
+    def instant (inSelf): #return float
+        """
+        Retourne l'instant de relevé du point en secondes depuis le 01/01/1970 (UTC) ; None si le point n'a pas d'heure
+        """
+        temps=inSelf.__segment.colonnes()[3][inSelf.__rang]
+        if temps==TEMPS_ABSENT:
+            return None
+        return temps/1000.
+    
+    def nature (inSelf): #return int
+        """
+        Retourne la nature du point : NATURE_TRACE, NATURE_ROUTE ou NATURE_WAYPOINT
+        """
+        return int(inSelf.__segment.types()[0][inSelf.__rang])
+    
+    def trace (inSelf): #return int
+        """
+        Retourne le rang de la trace (ou de la route) du point dans son fichier GPX, -1 pour un waypoint
+        """
+        return int(inSelf.__segment.types()[1][inSelf.__rang])
+    
+    def troncon (inSelf): #return int
+        """
+        Retourne le rang du tronçon (trkseg) du point dans sa trace, -1 pour un waypoint
+        """
+        return int(inSelf.__segment.types()[2][inSelf.__rang])
+    
+    # Les services de la classe Point (__str__, heure, distance2D, distance3D) lisent directement ses attributs privés :
+    # ils sont redirigés ici vers les colonnes du segment
+    _Point__longitude=property(longitude)
+    _Point__latitude=property(latitude)
+    _Point__elevation=property(elevation)
+    _Point__instant=property(instant)
+    _Point__nature=property(nature)
+    _Point__trace=property(trace)
+    _Point__troncon=property(troncon)
+
 class Segment(list):
     """
     ROLE : Définir un segment qui est l'équivalent d'une liste de plusieurs Points.
            Dans la liste, le Point est un tuple (Longitude, Latitude, Elevation, Heure)
+           Les caractéristiques (longueurs, dénivelés, durée...) ne portent que sur les points du parcours, choisis par 
+           un masque sur la colonne des natures : les points de trace, ou les points de route si le segment n'a pas de 
+           trace (une route prévue n'est pas mêlée au parcours relevé). Les waypoints en sont toujours exclus
+           Les caractéristiques calculées sont mémorisées (__cache) jusqu'à la prochaine modification des points
+           En mode incrémental (suivi en direct), les totaux (longueurs, dénivelés, altitudes extrêmes, instants
+           de début et de fin) sont tenus à jour à chaque point ajouté en fin de segment, en O(1)
     ATTRIBUTS :
         __nom : str
-        __longueur2D : float
-        __longueur3D : float
-        __altMini : float
-        __altMaxi : float
-        __denivele_ascendant : float
-        __denivele_descendant : float
-        __duree : float
+        __incremental : bool
+        __cache : dict (colonnes, totaux et résumé mémorisés, vidé à chaque modification du segment)
     SERVICES :
-        def __init__(outSelf,inNom='Randonnée')
+        def __init__(outSelf,inNom='Randonnée',inIncremental=False)
         def __str__() : str
         def __repr__ : str
-        def lire_fichier_GPX(ioSelf,inNomFichierGPX) 
+        def lire_fichier_GPX(ioSelf,inNomFichierGPX,inFlux=False,inChamps=CHAMPS_GPX) 
         def ajouter_point(ioSelf, inPoint)
+        def append, extend, insert, pop, remove, clear, sort, reverse, __setitem__, __delitem__, __iadd__, __imul__ 
+            (services de la classe list, qui vident en plus le cache)
         def nom(inSelf) : str
+        def incremental(inSelf) : bool
         def nbre_points(inSelf) : int
-        def longueur2D(inSelf) : float
-        def longueur3D(inSelf) : float
+        def colonnes(inSelf) : tuple de numpy array
+        def types(inSelf) : tuple de numpy array
+        def masque(inSelf,inNatures=None,inTrace=None,inTroncon=None) : numpy array
+        def distances_cumulees(inSelf,inHaversine=False) : numpy array
+        def longueur2D(inSelf,inHaversine=False) : float
+        def longueur3D(inSelf,inHaversine=False) : float
         def altMini(inSelf) : float
         def altMaxi(inSelf) : float
         def denivele_ascendant(inSelf) : float
         def denivele_descendant(inSelf) : float
-        def duree(inSelf) : float
+        def instants(inSelf) : numpy array
+        def rang_instant(inSelf,inInstant) : int
+        def duree(inSelf) : str
         def vitesse_moyenne(inSelf) : float
+        def vitesses(inSelf,inHaversine=False) : numpy array
+        def donnees_mouvement(inSelf,inSeuilArret=1.0,inHaversine=False) : dict
+        def simplifier(inSelf,inTolerance=10.) : numpy array
+        def reechantillonner(inSelf,inPasMetres=None,inPasSecondes=None) : SegmentColonnaire
+        def plus_proches_points(inSelf,inLongitudes,inLatitudes,inK=1) : tuple de numpy array
+        def points_dans_rayon(inSelf,inLongitudes,inLatitudes,inRayon) : numpy array ou list
+        def resume(inSelf) : dict
     """
     
-    def __init__(outSelf,inNom='Randonnée'):
+    def __init__(outSelf,inNom='Randonnée',inIncremental=False):
         """
-        Initialisation de la Classe Segment avec l'ENTREE inNom (Randonnée par défaut) : nom du segment
+        Initialisation de la Classe Segment avec :
+        ENTREES :
+            inNom : (par défaut Randonnée) nom du segment
+            inIncremental : Variable booléenne. Si True, les totaux du segment sont mis à jour à chaque point ajouté 
+                            (ajouter_point, append, extend) au lieu d'être recalculés sur tout le segment. Par défaut False
         """
         list.__init__(outSelf) # initialisation de la classe list dont hérite la classe Segment
         outSelf.__nom=str(inNom) # ajout d'un attribut pour le Nom du Segment
+        outSelf.__incremental=bool(inIncremental)
+        outSelf.__cache={} # ajout d'un attribut mémorisant les calculs sur les points
 
     def __str__(inSelf): # return str
         """
@@ -204,16 +401,30 @@ class Segment(list):
         """
         return str(inSelf.__dict__)
     
-    def lire_fichier_GPX(ioSelf,inNomFichierGPX):
+    def lire_fichier_GPX(ioSelf,inNomFichierGPX,inFlux=False,inChamps=CHAMPS_GPX):
         """
         PROCEDURE permettant de lire un fichier GPX à partir de la bibliothèque gpxpy
-        et le Chargement des Points (Longitude, Latitude, Elevation, Heure) dans l'objet de type Segment
+        et le Chargement des Points (Longitude, Latitude, Elevation, Heure) dans l'objet de type Segment : 
+        points de trace, de route et waypoints, chacun avec sa nature et les rangs de sa trace et de son tronçon
         
-        ENTREE:
-            inNomFichierGPX : str # Chemin d'accès au fichier GPX à lire
+        ENTREES:
+            inNomFichierGPX : str # Chemin d'accès au fichier GPX à lire, éventuellement compressé (.gz, .bz2, .xz) 
+                              # ou contenu dans une archive zip (chemin archive.zip/membre.gpx), voir _ouvrir_fichier_GPX
+            inFlux : Variable booléenne. Si sa valeur est True, le fichier est lu au fil de l'eau (fonction _lire_points_GPX)
+                     sans construire l'objet GPX complet de gpxpy : la mémoire consommée ne dépend plus de la taille du fichier.
+                     Les points sont alors ajoutés dans l'ordre du document. Par défaut False (lecture gpxpy)
+            inChamps : Noms des champs gpxpy analysés en lecture gpxpy (par défaut CHAMPS_GPX : longitude, latitude, 
+                       élévation et heure) ; les autres champs, extensions comprises, sont ignorés par l'analyseur. 
+                       None pour analyser tous les champs
         """
-        gpx_file = open(inNomFichierGPX, 'r') # Ouverture du fichier GPX en mode Lecture 'read'
-        gpx = gpxpy.parse(gpx_file) # analyse du fichier GPX et récupération de son contenu dans la variable gpx
+        if inFlux:
+            # Lecture au fil de l'eau : chaque point est ajouté dès qu'il est lu puis libéré par le générateur
+            for lon,lat,ele,instant,nature,trace,troncon in _lire_points_GPX(inNomFichierGPX):
+                ioSelf.append(Point(lon,lat,ele,instant,nature,trace,troncon))
+            return
+        
+        gpx_file = _ouvrir_fichier_GPX(inNomFichierGPX) # Ouverture du fichier GPX en mode Lecture binaire : l'analyseur XML décode lui-même le fichier
+        gpx = gpxpy.parse(gpx_file,fields=inChamps) # analyse du fichier GPX et récupération de son contenu dans la variable gpx
         
         # Triple Boucle permettant l'accès aux Tracks puis segments puis points du fichier GPX
         for rangTrack in range(len(gpx.tracks)): # Parcours des Tracks
@@ -225,20 +436,164 @@ class Segment(list):
                 for point in lstTrackPoints : # Parcours de la liste des Points pour chaque segment 
                     # Définition d'un objet de type Point qu'on va ajouter à l'objet Segment
                     # Les attributs de l'objet Point défini sont récupérés sur le point du fichier GPX lu
-                    objetPoint=Point(point.longitude,point.latitude,point.elevation,point.time.strftime("%H:%M:%S"))# L'Heure est sous forme d'objet Datetime et nécessite une 
-                                                    # conversion en str par la méthode strftime de la classe datetime.datetime
+                    objetPoint=Point(point.longitude,point.latitude,point.elevation,point.time,
+                                     NATURE_TRACE,rangTrack,rangSeg)# L'Heure est sous forme d'objet Datetime, 
+                                                    # convertie par la classe Point en instant (secondes depuis le 01/01/1970)
                     ioSelf.append(objetPoint) 
+        # Gestion du cas des Routes (points prévus, souvent sans heure ni altitude)
+        for rangRoute,route in enumerate(gpx.routes): # Parcours des Routes
+            for point in route.points:
+                ioSelf.append(Point(point.longitude,point.latitude,point.elevation,point.time,NATURE_ROUTE,rangRoute,0))
         # Gestion du cas des Waypoints
         # Boucle permettant l'accès aux waypoints eventuels contenus dans le fichier GPX
         for rang,waypoint in enumerate(gpx.waypoints): # Parcours de la liste des Waypoints
             # Pour chaque waypoint dans cette liste, on ajoute à l'Objet Segment sa Longitude, Latitude,son Elevation 
             # et l'heure de relevé
-            objetPoint=Point(waypoint.longitude,waypoint.latitude,waypoint.elevation,waypoint.time.strftime("%H:%M:%S"))
-            ioSelf.append(objetPoint) # L'Heure est sous forme d'objet Datetime et nécessite une 
-                                                    # conversion en str par la méthode strftime de la classe datetime.datetime
+            objetPoint=Point(waypoint.longitude,waypoint.latitude,waypoint.elevation,waypoint.time,NATURE_WAYPOINT,-1,-1)
+            ioSelf.append(objetPoint) # L'Heure est sous forme d'objet Datetime, convertie en instant par la classe Point
             
         gpx_file.close() #fermeture du fichier GPX
     
+    # Services de modification de la classe list : ils vident en plus le cache des calculs mémorisés
+    def _invalider(ioSelf):
+        """
+        PROCEDURE vidant le cache des calculs mémorisés ; appelée après toute modification des points du segment
+        """
+        ioSelf.__cache.clear()
+    
+    def _totaux(inSelf): # return dict
+        """
+        Retourne les totaux mémorisés du segment (None s'ils ne le sont pas)
+        """
+        return inSelf.__cache.get('totaux')
+    
+    def _prolonger_totaux(ioSelf,inTotaux,inColonnes,inNatures):
+        """
+        PROCEDURE appelée après l'ajout de points en fin de segment : en mode incrémental, les totaux inTotaux 
+        mémorisés avant l'ajout sont mis à jour avec les seuls points ajoutés puis de nouveau mémorisés. 
+        Sans totaux mémorisés (segment modifié autrement que par des ajouts), ils seront recalculés 
+        sur tout le segment au prochain résumé.
+        ENTREES :
+            inTotaux : dict # totaux mémorisés avant l'ajout (méthode _totaux)
+            inColonnes : tuple (longitudes, latitudes, élévations, temps) des points ajoutés
+            inNatures : natures des points ajoutés : seuls les points de trace sont comptés. Tant que le segment n'a 
+                        pas de point de trace, l'ajout de points de route conduit au recalcul au prochain résumé
+        """
+        if not ioSelf.__incremental:
+            return
+        nbreAjoutes=len(inColonnes[0])
+        if inTotaux is None:
+            if len(ioSelf)>nbreAjoutes: # des points antérieurs n'ont pas de totaux : recalcul au prochain résumé
+                return
+            inTotaux=_totaux_colonnes(np.empty(0),np.empty(0),np.empty(0),np.empty(0,dtype=np.int64))
+        if nbreAjoutes==1: # cas du suivi en direct : mise à jour en O(1)
+            if inNatures[0]==NATURE_TRACE:
+                _ajouter_aux_totaux(inTotaux,*[colonne[0] for colonne in inColonnes])
+        elif nbreAjoutes>1:
+            traces=np.asarray(inNatures)==NATURE_TRACE
+            if not traces.all(): # les points de route et waypoints ajoutés sont écartés
+                inColonnes=[np.asarray(colonne)[traces] for colonne in inColonnes]
+            if len(inColonnes[0]):
+                _fusionner_totaux(inTotaux,*inColonnes)
+        if inTotaux['nbre_points']==0 and NATURE_ROUTE in inNatures:
+            return # segment sans trace : le parcours est fait des points de route, recalculé au prochain résumé
+        ioSelf.__cache['totaux']=inTotaux
+    
+    def append(ioSelf,inPoint):
+        """
+        Ajoute l'objet Point inPoint à la fin du segment
+        """
+        totaux=ioSelf._totaux()
+        list.append(ioSelf,inPoint)
+        ioSelf._invalider()
+        if ioSelf.__incremental:
+            ioSelf._prolonger_totaux(totaux,([inPoint.longitude()],[inPoint.latitude()],
+                                             [inPoint.elevation()],[_temps_du_point(inPoint)]),[inPoint.nature()])
+    
+    def extend(ioSelf,inPoints):
+        """
+        Ajoute les objets Points de inPoints à la fin du segment
+        """
+        totaux=ioSelf._totaux()
+        points=list(inPoints)
+        list.extend(ioSelf,points)
+        ioSelf._invalider()
+        if ioSelf.__incremental:
+            ioSelf._prolonger_totaux(totaux,_colonnes_des_points(points),_types_des_points(points)[0])
+    
+    def insert(ioSelf,inRang,inPoint):
+        """
+        Insère l'objet Point inPoint avant le rang inRang
+        """
+        list.insert(ioSelf,inRang,inPoint)
+        ioSelf._invalider()
+    
+    def pop(ioSelf,inRang=-1):
+        """
+        Retire et retourne le point de rang inRang (par défaut le dernier)
+        """
+        point=list.pop(ioSelf,inRang)
+        ioSelf._invalider()
+        return point
+    
+    def remove(ioSelf,inPoint):
+        """
+        Retire l'objet Point inPoint du segment
+        """
+        list.remove(ioSelf,inPoint)
+        ioSelf._invalider()
+    
+    def clear(ioSelf):
+        """
+        Supprime tous les points du segment
+        """
+        list.clear(ioSelf)
+        ioSelf._invalider()
+    
+    def sort(ioSelf,*args,**kwargs):
+        """
+        Trie les points du segment (voir list.sort)
+        """
+        list.sort(ioSelf,*args,**kwargs)
+        ioSelf._invalider()
+    
+    def reverse(ioSelf):
+        """
+        Inverse l'ordre des points du segment
+        """
+        list.reverse(ioSelf)
+        ioSelf._invalider()
+    
+    def __setitem__(ioSelf,inRang,inPoint):
+        """
+        Remplace le point (ou la tranche de points) inRang
+        """
+        list.__setitem__(ioSelf,inRang,inPoint)
+        ioSelf._invalider()
+    
+    def __delitem__(ioSelf,inRang):
+        """
+        Supprime le point (ou la tranche de points) inRang
+        """
+        list.__delitem__(ioSelf,inRang)
+        ioSelf._invalider()
+    
+    def __iadd__(ioSelf,inPoints):
+        """
+        Opérateur += : ajout des points inPoints à la fin du segment
+        """
+        list.__iadd__(ioSelf,inPoints)
+        ioSelf._invalider()
+        return ioSelf
+    
+    def __imul__(ioSelf,inNombre):
+        """
+        Opérateur *= : répétition des points du segment
+        """
+        list.__imul__(ioSelf,inNombre)
+        ioSelf._invalider()
+        return ioSelf
+    
     def ajouter_point(ioSelf,inPoint):
         """
         PROCEDURE permettant d'Ajouter un point à l'objet Segment
@@ -255,357 +610,1183 @@ class Segment(list):
         """
         return inSelf.__nom
     
+    def incremental(inSelf): # return bool
+        """
+        Retourne True si les totaux du segment sont mis à jour à chaque point ajouté (mode incrémental)
+        """
+        return inSelf.__incremental
+    
     def nbre_points(inSelf): #return int
         """
-        Retourne le nombre de points contenus de l'objet Segment (longueur)
+        Retourne le nombre de points contenus de l'objet Segment (longueur), waypoints et points hors du parcours 
+        compris : il diffère de resume()['nbre_points'], qui ne compte que les points du parcours
         """
         return len(inSelf)
     
-    def longueur2D(inSelf): # return float
+    def colonnes(inSelf): # return tuple de numpy array
+        """
+        Retourne les caractéristiques des points de l'objet Segment sous forme de colonnes numpy :
+        (longitudes, latitudes, élévations) en float64 et temps en int64 (millisecondes, voir _temps_du_point)
+        """
+        if 'colonnes' not in inSelf.__cache: # les colonnes sont construites une seule fois jusqu'à la prochaine modification
+            inSelf.__cache['colonnes']=_colonnes_des_points(inSelf)
+        return inSelf.__cache['colonnes']
+    
+    def types(inSelf): # return tuple de numpy array
+        """
+        Retourne les colonnes décrivant le type des points de l'objet Segment : natures (int8 : NATURE_TRACE, 
+        NATURE_ROUTE ou NATURE_WAYPOINT), rangs des traces et rangs des tronçons (int32, -1 pour un waypoint)
+        """
+        if 'types' not in inSelf.__cache:
+            inSelf.__cache['types']=_types_des_points(inSelf)
+        return inSelf.__cache['types']
+    
+    def masque(inSelf,inNatures=None,inTrace=None,inTroncon=None): # return numpy array
+        """
+        Retourne le masque (tableau de booléens) des points du segment ayant l'une des natures inNatures (par défaut 
+        None : points du parcours) et, si fournis, appartenant à la trace de rang inTrace et au tronçon de rang inTroncon.
+        Exemple : segment.colonnes()[2][segment.masque((NATURE_WAYPOINT,))] donne les altitudes des waypoints
+        """
+        natures,traces,troncons=inSelf.types()
+        if inNatures is None:
+            inNatures=inSelf._natures_parcours()
+        masque=np.isin(natures,inNatures)
+        if inTrace is not None:
+            masque&=traces==inTrace
+        if inTroncon is not None:
+            masque&=troncons==inTroncon
+        return masque
+    
+    def _natures_parcours(inSelf): # return tuple
+        """
+        Retourne les natures des points du parcours : (NATURE_TRACE,), ou (NATURE_ROUTE,) si le segment n'a pas de 
+        point de trace mais a des points de route
+        """
+        natures=inSelf.types()[0]
+        if not (natures==NATURE_TRACE).any() and (natures==NATURE_ROUTE).any():
+            return (NATURE_ROUTE,)
+        return (NATURE_TRACE,)
+    
+    def _colonnes_parcours(inSelf): # return tuple de numpy array
+        """
+        Retourne les colonnes des seuls points du parcours (voir _natures_parcours), sans recopie si tous les points 
+        du segment en font partie
+        """
+        if 'parcours' not in inSelf.__cache:
+            colonnes=inSelf.colonnes()
+            masque=inSelf.masque()
+            inSelf.__cache['parcours']=colonnes if masque.all() else tuple(colonne[masque] for colonne in colonnes)
+        return inSelf.__cache['parcours']
+    
+    def distances_cumulees(inSelf,inHaversine=False): # return numpy array
+        """
+        Retourne pour chaque point du parcours (waypoints exclus) la distance 2D parcourue depuis le premier point (en mètres)
+        ENTREE :
+            inHaversine : Variable booléenne. Si True, distances calculées par la formule de haversine
+                          au lieu de l'approximation équirectangulaire de Point.distance2D (par défaut False)
+        """
+        longitudes,latitudes=inSelf._colonnes_parcours()[:2]
+        ecarts=_ecarts_haversine(longitudes,latitudes) if inHaversine else _ecarts_2D(longitudes,latitudes)
+        return _cumul(ecarts)
+    
+    def longueur2D(inSelf,inHaversine=False): # return float
         """
         Calcul la Somme des distances 2D 2 à 2 entre les points de l'objet Segment 
+        ENTREE :
+            inHaversine : Variable booléenne. Si True, distances calculées par la formule de haversine (par défaut False)
         """
-        inSelf.__longueur2D=0. # initialisation de la variable longueur2D à 0
-        # Boucle sur l'objet Segment qui récupère à chaque fois 2 points successifs 
-        for rangPoint in range(1,len(inSelf)): # parcours des points de l'objet Segment
-            # récupération des attributs du point rangPoint-1 et définition d'un objet Point correspondant
-            # indices : 0 Longitude, 1 Latitude, 2 Elevation, 3 Heure
-            pointInitial=inSelf[rangPoint-1]
-            # récupération des attributs du point suivant (rangPoint) et définition d'un objet Point correspondant
-            pointSuivant=inSelf[rangPoint]
-            # Calcul de la longueur 2D = ancienne valeur + distance 2D entre 2 objets Points définis
-            inSelf.__longueur2D+=pointInitial.distance2D(pointSuivant)
-        
-        return round(inSelf.__longueur2D*0.001,2) # conversion en km et arrondissement à 2 chiffres après la virgule
+        if inHaversine:
+            longitudes,latitudes=inSelf._colonnes_parcours()[:2]
+            return round(float(_ecarts_haversine(longitudes,latitudes).sum())*0.001,2)
+        return inSelf.resume()['longueur2D']
     
-    def longueur3D(inSelf): # return float
+    def longueur3D(inSelf,inHaversine=False): # return float
         """
         Calcul la Somme des distances 3D 2 à 2 entre les points de l'objet Segment 
+        ENTREE :
+            inHaversine : Variable booléenne. Si True, distances 2D calculées par la formule de haversine (par défaut False)
         """
-        inSelf.__longueur3D=0. # initialisation de la variable longueur3D à 0
-        for rangPoint in range(1,len(inSelf)): # parcours des points de l'objet Segment
-            # récupération des attributs du point rangPoint-1 et définition d'un objet Point correspondant
-            # indices : 0 Longitude, 1 Latitude, 2 Elevation, 3 Heure
-            pointInitial=inSelf[rangPoint-1]
-            # récupération des attributs du point suivant (rangPoint) et définition d'un objet Point correspondant
-            pointSuivant=inSelf[rangPoint]
-            # Calcul de la longueur 3D  = ancienne valeur + distance 3D entre les 2 objets Points définis
-            inSelf.__longueur3D+=pointInitial.distance3D(pointSuivant)
-        
-        return round(inSelf.__longueur3D*0.001,2) # conversion en km et arrondissement à 2 chiffres après la virgule
+        if inHaversine:
+            longitudes,latitudes,elevations=inSelf._colonnes_parcours()[:3]
+            return round(float(_ecarts_3D(_ecarts_haversine(longitudes,latitudes),elevations).sum())*0.001,2)
+        return inSelf.resume()['longueur3D']
     
     def altMini(inSelf): # return float
         """
         Retourne l'altitude Minimale de l'Objet Segment
         """
-        # indice 2 : Altitude
-        inSelf.__altMini=inSelf[0].elevation() # initialisation de l'attribut altMini avec l'altitude du premier point de l'objet Segment
-        for rangPoint in range(len(inSelf)): # parcours des points de l'objet Segment
-            if inSelf[rangPoint].elevation() < inSelf.__altMini: # recherche d'une valeur d'altitude inférieure à celle de départ
-                inSelf.__altMini=inSelf[rangPoint].elevation() # si une valeur inférieure à celle de départ est trouvée on l'affecte à 
-                                                      # l'attribut altMini  
-        return round(inSelf.__altMini,2)
+        return inSelf.resume()['altMini']
     
     def altMaxi(inSelf): # return float
         """
         Retourne l'altitude Maximale de l'Objet Segment
         """
-        # indice 2 : Altitude
-        inSelf.__altMaxi=inSelf[0].elevation() # initialisation de l'attribut altMini avec l'altitude du premier point de l'objet Segment
-        for rangPoint in range(len(inSelf)): # parcours des points de l'objet Segment
-            if inSelf[rangPoint].elevation()  > inSelf.__altMaxi: # recherche d'une valeur d'altitude supérieure à celle de départ
-                inSelf.__altMaxi=inSelf[rangPoint].elevation() # si une valeur supérieure à celle de départ est trouvée on l'affecte à 
-                                                      # l'attribut altMaxi      
-        return round(inSelf.__altMaxi,2)
+        return inSelf.resume()['altMaxi']
     
     def denivele_ascendant(inSelf): # return float
         """
         Calcule le denivelé ascendant (somme des écarts d'altitudes positives)
         """
-        inSelf.__denivele_ascendant=0. # initialisation de l'attribut denivele_ascendant à 0
-        for rangPoint in range(1,len(inSelf)): # parcours des points de l'objet Segment
-            # calcul de la différence d'altitude entre 2 points successifs de l'objet Segment
-            # si positive, on l'ajoute à l'ancienne valeur de l'attribut denivele_ascendant
-            # indice 2 : Altitude
-            if inSelf[rangPoint].elevation() -inSelf[rangPoint-1].elevation()  > 0 : 
-                inSelf.__denivele_ascendant+=inSelf[rangPoint].elevation() -inSelf[rangPoint-1].elevation() 
-        
-        return round(inSelf.__denivele_ascendant,2)
-        
+        return inSelf.resume()['denivele_ascendant']
     
     def denivele_descendant(inSelf): # return float
         """
         Calcule le denivelé descendant (somme des écarts d'altitudes négatives)
         """
-        inSelf.__denivele_descendant=0. # initialisation de l'attribut denivele_descendant à 0
-        for rangPoint in range(1,len(inSelf)): # parcours des points de l'objet Segment
-            # calcul de la différence d'altitude entre 2 points successifs de l'objet Segment
-            # si négative, on l'ajoute à l'ancienne valeur de l'attribut denivele_ascendant
-            # indice 2 : Altitude
-            if inSelf[rangPoint].elevation() -inSelf[rangPoint-1].elevation()  < 0 :
-                inSelf.__denivele_descendant+=inSelf[rangPoint].elevation() -inSelf[rangPoint-1].elevation() 
-        
-        return round(inSelf.__denivele_descendant,2)
+        return inSelf.resume()['denivele_descendant']
         
+    def instants(inSelf): # return numpy array
+        """
+        Retourne les instants de relevé des points de l'objet Segment en secondes depuis le 01/01/1970 (UTC), 
+        en float64 (NaN si le point n'a pas d'heure)
+        """
+        temps=inSelf.colonnes()[3]
+        instants=temps/1000.
+        instants[temps==TEMPS_ABSENT]=np.nan
+        return instants
+    
+    def rang_instant(inSelf,inInstant): # return int
+        """
+        Retourne le rang du dernier point relevé à l'instant inInstant ou avant (recherche dichotomique dans la colonne 
+        des temps, les points étant dans l'ordre chronologique) ; None si aucun point n'a été relevé avant inInstant.
+        Les points sans heure sont ignorés
+        ENTREE :
+            inInstant : float # secondes depuis le 01/01/1970 (UTC)
+        """
+        temps=inSelf.colonnes()[3]
+        rangs=np.flatnonzero(temps!=TEMPS_ABSENT) # rangs des points ayant une heure
+        position=int(np.searchsorted(temps[rangs],int(round(inInstant*1000)),side='right'))-1
+        return None if position<0 else int(rangs[position])
+    
     def duree(inSelf): # return str
         """
         Calcule la durée de cheminement d'un segment 
-        Heure point final - Heure point initial
+        Instant du point final - Instant du point initial (dates comprises : un parcours de plusieurs jours ou 
+        passant minuit est compté correctement)
         """
-        # indice 3 : Heure
-        # Heure de debut (Point initial d'indice 0)
-        debutRandonnee=_instant_en_secondes(inSelf[0].heure()) # Conversion en secondes avec la fonction  _instant_en_secondes
-        # Heure de fin (Point final d'indice -1)
-        finRandonnee=_instant_en_secondes(inSelf[-1].heure()) # Conversion en secondes avec la fonction  _instant_en_secondes
-        # Calcul de la durée
-        inSelf.__duree=finRandonnee-debutRandonnee 
-        
-        return _instant_en_chaine(inSelf.__duree) # affichage en chaine de caractères heures:minutes:secondes
+        return inSelf.resume()['duree'] # affichage en chaine de caractères heures:minutes:secondes
     
     def vitesse_moyenne(inSelf): # return float
         """
         Calcule la vitesse moyenne du parcours d'un segment
         vitesse_moyenne=distance2D/duree
         """
-        return round((inSelf.__longueur2D*0.001)/(inSelf.__duree/3600),2) # vitesse moyenne en km/h (*0.001/3600)
-                                                                          # arrondissement à 2 chiffres après virgule
-
-class Relief(object):
-    """
-    ROLE : Génère un Modèle Numérique de Terrain Raster en format (ASII ou TIF) et 
-           Affiche en 2D et 3D le Relief d'une zone géographique par interpolation 
-           de points (longitude, latitude, elevation) provenant de traces GPX de cette zone.
+        return inSelf.resume()['vitesse_moyenne'] # vitesse moyenne en km/h
     
-    ATTRIBUTS :
-        __nom : str 
-        __taille_pixel : float
-        __coordonnees_points : scipy array (Tableau de n lignes et 3 colonnes correspoondant aux longitudes, latitudes et altitudes 
-                               des points provenant de traces GPX
-        __altitudes_interpolees : scipy array (Tableau des altitudes interpolées)
-        __longitudes_croisements : scipy array (Longitudes aux croisements de la grille d'interpolation)
-        __latitudes_croisements : scipy array (Latitudes aux croisements de la grille d'interpolation)
+    def vitesses(inSelf,inHaversine=False): # return numpy array
+        """
+        Retourne la vitesse (km/h) entre chaque point du parcours et le suivant (longueur nbre_points-1), distance 3D 
+        (2D si une altitude manque) sur durée ; NaN si l'un des deux points n'a pas d'heure, si la durée est négative 
+        ou si les deux points sont dans deux tronçons différents (saut entre tronçons de trace), 0 si la durée est nulle
+        ENTREE :
+            inHaversine : Variable booléenne. Si True, distances 2D calculées par la formule de haversine (par défaut False)
+        """
+        return inSelf._intervalles(inHaversine)[2].copy() # copie : le tableau mémorisé ne peut pas être modifié par l'appelant
     
-    SERVICES :
-        __init__(outSelf,inNom='Relief_Randonnee',inTaillePixel=0.001) 
-        __str__(inSelf) : str
-        __repr__(inSelf) : str
-        lire_dossier_GPX(outSelf,inNomDossierGPX)
-        generer_mnt(outSelf,inMethod,inFormat) 
-        afficher_relief(inSelf,inSave)
+    def _intervalles(inSelf,inHaversine=False): # return tuple de numpy array
+        """
+        Retourne les distances (m), durées (s) et vitesses (km/h) entre points successifs du parcours 
+        (voir _vitesses_colonnes), mémorisées jusqu'à la prochaine modification des points
+        """
+        cle=('intervalles',bool(inHaversine))
+        if cle not in inSelf.__cache:
+            masque=inSelf.masque()
+            traces,troncons=[colonne[masque] for colonne in inSelf.types()[1:]]
+            inSelf.__cache[cle]=_vitesses_colonnes(*inSelf._colonnes_parcours(),inHaversine=inHaversine,
+                                                   inTraces=traces,inTroncons=troncons)
+        return inSelf.__cache[cle]
     
-    """
-    def __init__(outSelf,inNom='Relief_Randonnee',inTaillePixel=0.001):
+    def donnees_mouvement(inSelf,inSeuilArret=1.0,inHaversine=False): # return dict
         """
-        Initialisation de la classe Relief 
-        ENTREES : 
-            inNom : (par défaut Relief_Randonnée) nom à attribuer à la grille Raster (MNT) à générer et 
-                    l'affichage 3D qui sera éventuellement sauvegardée.
-            inTaillePixel : Taille des cellules de la grille Raster (MNT) qui sera générée par interpolation. 
-                            Par défaut 0.001°(100m)
+        Analyse les temps de mouvement et d'arrêt du parcours : un intervalle entre deux points successifs est à 
+        l'arrêt si sa vitesse ne dépasse pas inSeuilArret (km/h). Retourne temps_mouvement et temps_arret (s), 
+        duree_mouvement (str), distance_mouvement et distance_arret (km), vitesse_moyenne_mouvement (km/h, distance 
+        en mouvement sur temps de mouvement) et vitesse_maxi (km/h, sans les valeurs aberrantes : voir 
+        _donnees_mouvement). Les sauts entre deux tronçons de trace (GPS éteint puis rallumé ailleurs) ne sont comptés 
+        ni en mouvement ni à l'arrêt. Les valeurs non calculables valent None
+        ENTREES :
+            inSeuilArret : float # vitesse d'arrêt en km/h (par défaut 1 km/h, comme gpxpy)
+            inHaversine : Variable booléenne. Si True, distances 2D calculées par la formule de haversine (par défaut False)
         """
-        object.__init__(outSelf) # Initialisation de la classe object dont hérite la classe Relief
-        outSelf.__nom=str(inNom) # Ajout d'un attribut nom pour la Classe Relief
-        outSelf.__taille_pixel=float(inTaillePixel)
-        
-    def __str__(inSelf): # return str
+        mouvement=_donnees_mouvement(*inSelf._intervalles(inHaversine),inSeuilArret=inSeuilArret)
+        temps=mouvement['temps_mouvement']
+        return {'temps_mouvement':temps,
+                'temps_arret':mouvement['temps_arret'],
+                'duree_mouvement':_instant_en_chaine(temps),
+                'distance_mouvement':round(mouvement['distance_mouvement']*0.001,2),
+                'distance_arret':round(mouvement['distance_arret']*0.001,2),
+                'vitesse_moyenne_mouvement':round(mouvement['distance_mouvement']*3.6/temps,2) if temps else None,
+                'vitesse_maxi':None if mouvement['vitesse_maxi'] is None else round(mouvement['vitesse_maxi'],2)}
+    
+    def simplifier(inSelf,inTolerance=10.): # return numpy array
         """
-        Chaîne d'affichage standard de la classe Relief
+        Simplifie le parcours par l'algorithme de Douglas-Peucker (voir _masque_douglas_peucker), chaque tronçon 
+        de trace étant simplifié séparément. Retourne le masque (numpy array de booléens, un par point du segment) 
+        des points à conserver : les points hors du parcours (waypoints) sont toujours conservés. 
+        Le segment n'est pas modifié : segment[masque] (SegmentColonnaire) en donne la version simplifiée
+        ENTREE :
+            inTolerance : float # écart maximal en mètres entre le parcours simplifié et les points écartés (par défaut 10 m, comme gpxpy)
         """
-        return inSelf.__nom
+        if inTolerance<0:
+            raise ValueError("Tolérance de simplification négative : "+str(inTolerance))
+        parcours=inSelf.masque()
+        conserves=~parcours
+        rangs=np.flatnonzero(parcours)
+        if len(rangs):
+            longitudes,latitudes=inSelf._colonnes_parcours()[:2]
+            debuts,fins=_bornes_troncons(*[colonne[rangs] for colonne in inSelf.types()[1:]])
+            conserves[rangs]=_masque_douglas_peucker(*_projection_locale(longitudes,latitudes),inTolerance,debuts,fins)
+        return conserves
     
-    def __repr__(inSelf): # return str
+    def reechantillonner(inSelf,inPasMetres=None,inPasSecondes=None): # return SegmentColonnaire
         """
-        Chaîne d'affichage de débogage
+        Retourne un nouvel objet SegmentColonnaire dont le parcours est rééchantillonné à pas constant, en distance 
+        (inPasMetres) ou en temps (inPasSecondes), chaque tronçon de trace de son premier à son dernier point : 
+        longitudes, latitudes, élévations et temps sont interpolés linéairement (voir _reechantillonner_troncon). 
+        Les points hors du parcours (waypoints) suivent, inchangés. Le segment n'est pas modifié
+        ENTREES (une seule des deux) :
+            inPasMetres : float # distance 2D en mètres entre points successifs
+            inPasSecondes : float # durée en secondes entre points successifs (les points sans heure sont ignorés)
         """
-        return str(inSelf.__dict__)
+        if (inPasMetres is None)==(inPasSecondes is None):
+            raise ValueError("Rééchantillonnage : un pas en mètres ou en secondes doit être donné (et un seul)")
+        pas=inPasMetres if inPasSecondes is None else inPasSecondes
+        if not pas>0:
+            raise ValueError("Pas de rééchantillonnage non positif : "+str(pas))
+        colonnes=_reechantillonner_colonnes(inSelf.colonnes(),inSelf.types(),inSelf._natures_parcours(),pas,
+                                            inPasSecondes is not None)
+        segment=SegmentColonnaire(inSelf.nom(),inSelf.incremental())
+        segment.extend_colonnes(*colonnes)
+        return segment
     
-    def lire_dossier_GPX(outSelf,inNomDossierGPX):
+    def _index(inSelf): # return tuple
         """
-        PROCEDURE permettant de lire un par un, des fichiers GPX contenus dans un dossier 
-        (à partir de la bibliothèque gpxpy) et de charger les points qu'ils contiennent 
-        dans l'attribut __coordonnees_points de type tableau (scipy.array)
-        
-        ENTREE:
-            inNomDossierGPX : # str Chemin d'accès à un répertoire contenant un ou plusieurs fichiers GPX
-        """ 
-        # liste des fichiers GPX contenus dans le dossier d'entrée
-        lstFichiers=glob.glob(inNomDossierGPX+'/*gpx')  # Appel à la bibliothèque glob
-        # Initialisation de quelques variables de type list
-        coord_x=list() # Liste qui va contenir l'ensemble des longitudes des points
-        coord_y=list() # Liste qui va contenir l'ensemble des latitudes des points
-        coord_z=list() # Liste qui va contenir l'ensemble des altitudes des points
-        
-        # Boucle parcourant la liste des fichiers GPX
-        for fichier in lstFichiers:
-            # Pour chaque fichier on définit un objet de type Segment 
-            # et on fait appel à sa méthode lire_fichier_GPX
-            segment=Segment()
-            segment.lire_fichier_GPX(fichier)
-            # Puis on stocke les coordonnées (x,y,z) des points contenus dans cet objet dans les listes correspondantes 
-            # (coord_x coord_y, coord_z) avec à chaque fois une extension (extend) de leur contenu et non un ajout (append)
-            coord_x.extend([point.longitude() for point in segment]) # Boucle interne sur le segment pour récupérer à chaque point sa longitude
-            coord_y.extend([point.latitude() for point in segment]) # Boucle interne sur le segment pour récupérer à chaque point sa latitude
-            coord_z.extend([point.elevation() for point in segment]) # Boucle interne sur le segment pour récupérer à chaque point son altitude
-            
-        # Création d'un attribut de type tableau (scipy.array) de type float à 3 colonnes et d'un nombre de lignes équivalent 
-        # à longueur des listes de coordonnées
-        outSelf.__coordonnees_points=sp.empty((len(coord_x),3),dtype=float)
-        # Remplissage du tableau avec les listes
-        outSelf.__coordonnees_points[:,0]=coord_x # les longitudes en indice 0
-        outSelf.__coordonnees_points[:,1]=coord_y # les latitudes en indice 1
-        outSelf.__coordonnees_points[:,2]=coord_z # les altitudes en indice 2
+        Retourne l'index spatial des points du parcours (voir _index_spatial), construit à la première recherche 
+        et mémorisé jusqu'à la prochaine modification des points
+        """
+        if 'index' not in inSelf.__cache:
+            longitudes,latitudes=inSelf._colonnes_parcours()[:2]
+            inSelf.__cache['index']=_index_spatial(longitudes,latitudes,np.flatnonzero(inSelf.masque()))
+        return inSelf.__cache['index']
     
-    def generer_mnt(ioSelf,inMethod='nearest',inFormat='GeoTiff'):
+    def plus_proches_points(inSelf,inLongitudes,inLatitudes,inK=1): # return tuple
         """
-        PROCEDURE qui permet d'interpoler les altitudes des points stockés dans l'atrribut __coordonnees_points
-        pour créer une grille raster en GeoTiff ou ASCII exploitable sous logiciel SIG. Elle fait appel à la méthode 
-        griddata de 
-        
+        Recherche les inK points du parcours les plus proches d'une ou plusieurs positions (par exemple celles de 
+        participants), par un index spatial (arbre kd) construit une seule fois. Retourne (distances en mètres, 
+        rangs des points dans le segment) : voir _plus_proches
         ENTREES :
-            inMethod = Méthode d'interpolation. Par défaut la méthode du plus proche voisiin ('nearest'); 
-                       Autre option l'interpolation linéaire ('linear')
-            inFormat = Format de création de la grille raster (MNT). Par défaut du GeoTiff ('GeoTiff'). Autre option ASCII ('ASCII')
+            inLongitudes, inLatitudes : float ou tableaux de float # positions en degrés
+            inK : int # nombre de points recherchés par position (par défaut 1)
         """
-        # Création de la grille d'interpolation de données
-        # 1-Calcul des coordonnées (longitudes et latitudes) aux croisements de la grille (de pas l'attribut __taille_pixel)
-        xi=sp.arange(min(ioSelf.__coordonnees_points[:,0]),max(ioSelf.__coordonnees_points[:,0]),ioSelf.__taille_pixel) # Calcul des longitudes
-        yi=sp.arange(min(ioSelf.__coordonnees_points[:,1]),max(ioSelf.__coordonnees_points[:,1]),ioSelf.__taille_pixel) # Calcul des latitudes
-        # 2-Création de la grille proprement dite avec les coordonnées correspondantes
-        ioSelf.__longitudes_croisements,ioSelf.__latitudes_croisements = sp.meshgrid(xi,yi) # Récupération des coordonnées de la grille en tant qu'attributs de la classe Relief
-        
-        # Récupération de listes de longitudes (indice 0), latitudes (indice 1) et altitudes (indice 2) requises pour l'interpolation
-        x=ioSelf.__coordonnees_points[:,0] # Longitudes
-        y=ioSelf.__coordonnees_points[:,1] # Latitudes
-        z=ioSelf.__coordonnees_points[:,2] # Altitudes
-        
-        # Taille de la grille raster en nombre de lignes et colonnes
-        nbCol=ioSelf.__longitudes_croisements.shape[1] # nombre de colonnes
-        nbLignes=ioSelf.__latitudes_croisements.shape[0] # nombre de lignes
+        return _plus_proches(inSelf._index(),inLongitudes,inLatitudes,inK)
+    
+    def points_dans_rayon(inSelf,inLongitudes,inLatitudes,inRayon): # return numpy array ou list
+        """
+        Retourne les rangs dans le segment des points du parcours à moins de inRayon mètres d'une position, ou la 
+        liste de ces rangs pour des tableaux de positions (voir _points_dans_rayon)
+        ENTREES :
+            inLongitudes, inLatitudes : float ou tableaux de float # positions en degrés
+            inRayon : float # rayon en mètres
+        """
+        return _points_dans_rayon(inSelf._index(),inLongitudes,inLatitudes,inRayon)
+    
+    def resume(inSelf): # return dict
+        """
+        Retourne l'ensemble des caractéristiques du segment, calculées en un seul parcours de ses colonnes
+        et mémorisées jusqu'à la prochaine modification des points. Seuls les points du parcours (voir 
+        _natures_parcours) sont pris en compte : nom, nbre_points (du parcours), longueur2D et longueur3D (km), altMini et altMaxi (m), denivele_ascendant et 
+        denivele_descendant (m), duree (str), duree_secondes (float), vitesse_moyenne (km/h).
+        Chaque valeur est celle que renvoie le service de même nom (None si elle ne peut être calculée), sauf nbre_points : 
+        le service nbre_points compte tous les points du segment, waypoints compris, et non les seuls points du parcours
+        """
+        if 'resume' not in inSelf.__cache:
+            totaux=inSelf._totaux()
+            if totaux is None: # totaux calculés sur tout le segment (mémorisés en mode incrémental pour les ajouts suivants)
+                totaux=_totaux_colonnes(*inSelf._colonnes_parcours())
+                if inSelf.__incremental and inSelf._natures_parcours()==(NATURE_TRACE,):
+                    inSelf.__cache['totaux']=totaux
+            inSelf.__cache['resume']=_resume_totaux(totaux)
+        resume=dict(inSelf.__cache['resume']) # copie : le résumé mémorisé ne peut pas être modifié par l'appelant
+        resume['nom']=inSelf.__nom
+        return resume
 
-        # Interpolation des altitudes
-        grilleInterpolee= griddata((x,y),z,(ioSelf.__longitudes_croisements,ioSelf.__latitudes_croisements),method=inMethod) # création d'un tableau des altitudes interpolées
-        
-        # Redisposition du tableau des altitudes interpolées qui est créé à l'envers 
-        # la 1ère ligne est écrite à la position de la dernière ligne
-        ioSelf.__altitudes_interpolees=sp.empty((nbLignes,nbCol)) # création d'un tableau scipy vide de même taille que la grille 
-                                                              # interpolée et comme attribut de la classe Relief
-        # Boucle qui parcours le tableau de la grille interpolée et réécrit dans le tableau vide créé 
-        # les lignes dans leur vraie position (nbignes-1-numligne) #-1 parce que le indices du tableau commençent par 0
-        for numLigne in range(nbLignes):
-                ioSelf.__altitudes_interpolees[numLigne,:]=grilleInterpolee[nbLignes-1-numLigne,:]                                                                          
-        
-        # =============================================================================
-        #         Création du fichier physique de la grille raster interpolée 
-        #                avec le format sélectionné (inFormat)
-        # =============================================================================
-        
-        # Récupération du dossier dans lequel se trouve le fichier python pour y stocker le fichier physique
-        dossierCourant=os.getcwd()
-        
-        # Instructions conditionnelles selon le format (inFormat) choisi
-        
-        # Instructions pour le format GeoTiff
-        if inFormat=='GeoTiff':
-            # Définition du nom du fichier GeoTiff à écrire
-            nomSortieFichier=os.path.join(dossierCourant,ioSelf.__nom+'.tif') # Le fichier a le même nom que celui donné à la classe Relief
-            # Appel à la bibliothèque Gdal pour l'écriture du fichier GeoTiff
-            # 1- Appel au Driver GeoTiff de la bibliothèque Gdal
-            driver=gdal.GetDriverByName("GTiff") 
-            # 2- Récupération du type de donnees du tableau réécrit des altitudes interpolées
-            typeDonneesGrille=gdal_array.NumericTypeCodeToGDALTypeCode(ioSelf.__altitudes_interpolees.dtype)  
-            # 3- Création de la nouvelle couche GeoTiff avec ses attributs (nom, nbCol, nbLignes, nombre de bandes (1) et type de données)
-            dataset=driver.Create(nomSortieFichier,nbCol,nbLignes,1,typeDonneesGrille) 
-            # 4- Ajout des informations de transformation géométrique (longitude et Latitude du point Haut Gauche, largeur du pixel orienté E-O et N-S, Paramètres de rotation (0))
-            dataset.SetGeoTransform((min(x),ioSelf.__taille_pixel,0,max(y),0,-ioSelf.__taille_pixel)) 
-            # 5- Ajout des informations de projection
-            # Appel à la bibliothèque osr pour récupérer un SRS définie en l'ocurrence le système WGS84
-            wgs84=osr.SpatialReference() 
-            wgs84.SetWellKnownGeogCS("WGS84")
-            dataset.SetProjection(wgs84.ExportToWkt())
-            # 6- Ecriture des altitudes inteprolées dans le fichier GeoTiff créé
-            dataset.GetRasterBand(1).WriteArray(ioSelf.__altitudes_interpolees)
-            # 7- Fermeture du fichier
-            dataset=None
+class SegmentColonnaire(Segment):
+    """
+    ROLE : Définir un segment dont les points sont stockés en colonnes contiguës (tableaux numpy) : 
+           longitudes, latitudes et élévations en float64, instants de relevé en int64 
+           (millisecondes depuis le 01/01/1970 UTC, TEMPS_ABSENT si l'heure est absente), 
+           natures en int8 et rangs des traces et des tronçons en int32 (voir Segment.types).
+           Un million de points occupe ainsi 41 Mo (4 colonnes de 8 octets, 1 de 1 octet et 2 de 4 octets par point) 
+           au lieu de plusieurs centaines de Mo d'objets Point.
+           L'accès à un point renvoie un objet PointVue : les services de la classe Segment sont inchangés.
+           Tous les services de la classe list sont redéfinis sur les colonnes (la liste héritée reste vide) ; 
+           un point est recherché (in, index, count, remove) par ses caractéristiques et non par son identité.
+    ATTRIBUTS :
+        __longitudes : numpy array float64
+        __latitudes : numpy array float64
+        __elevations : numpy array float64
+        __temps : numpy array int64
+        __natures : numpy array int8
+        __traces : numpy array int32
+        __troncons : numpy array int32
+        __nbre : int (nombre de points ; les tableaux peuvent être plus longs pour réserver de la place aux ajouts)
+        __partage : bool (True si les colonnes sont des tableaux reçus de l'appelant, recopiés avant toute écriture)
+    SERVICES :
+        def __init__(outSelf,inNom='Randonnée',inIncremental=False)
+        def __len__(inSelf) : int
+        def __getitem__(inSelf,inRang) : PointVue ou SegmentColonnaire
+        def __iter__(inSelf)
+        def __reversed__(inSelf)
+        def __setitem__(ioSelf,inRang,inPoint)
+        def __delitem__(ioSelf,inRang)
+        def __iadd__(ioSelf,inPoints) : SegmentColonnaire
+        def __contains__(inSelf,inPoint) : bool
+        def index(inSelf,inPoint,inDebut=0,inFin=sys.maxsize) : int
+        def count(inSelf,inPoint) : int
+        def __eq__(inSelf,inAutre), __ne__(inSelf,inAutre) : bool
+        def __add__(inSelf,inPoints), __mul__(inSelf,inNombre) : SegmentColonnaire
+        def __radd__(inSelf,inPoints) : list
+        def __imul__(ioSelf,inNombre) : SegmentColonnaire
+        def copy(inSelf), __copy__(inSelf), __deepcopy__(inSelf,inMemo) : SegmentColonnaire
+        def __reduce__(inSelf) : tuple
+        def lire_fichier_GPX(ioSelf,inNomFichierGPX,inFlux=True,inChamps=CHAMPS_GPX)
+        def append(ioSelf,inPoint)
+        def extend(ioSelf,inPoints)
+        def extend_colonnes(ioSelf,inLongitudes,inLatitudes,inElevations,inTemps,inNatures=None,inTraces=None,inTroncons=None)
+        def insert(ioSelf,inRang,inPoint)
+        def pop(ioSelf,inRang=-1) : Point
+        def remove(ioSelf,inPoint)
+        def sort(ioSelf,key=None,reverse=False)
+        def clear(ioSelf)
+        def reverse(ioSelf)
+        def colonnes(inSelf) : tuple de numpy array
+        def types(inSelf) : tuple de numpy array
+    """
+    
+    def __init__(outSelf,inNom='Randonnée',inIncremental=False):
+        """
+        Initialisation de la Classe SegmentColonnaire avec les ENTREES inNom (Randonnée par défaut) : nom du segment
+        et inIncremental (False par défaut) : mode incrémental (voir classe Segment)
+        """
+        # initialisation de la classe Segment dont hérite la classe SegmentColonnaire
+        Segment.__init__(outSelf,inNom,inIncremental)
+        outSelf.__remplir(np.empty(0),np.empty(0),np.empty(0),np.empty(0,dtype=np.int64))
+    
+    def __remplir(ioSelf,inLongitudes,inLatitudes,inElevations,inTemps,inNatures=None,inTraces=None,inTroncons=None,
+                  inPartage=False):
+        """
+        PROCEDURE remplaçant le contenu des colonnes du segment (sans copie des tableaux). 
+        Sans colonnes de types, les points sont ceux du premier tronçon d'une trace.
+        inPartage vaut True si les tableaux appartiennent à l'appelant : ils ne sont recopiés qu'avant la première 
+        écriture (voir __detacher)
+        """
+        ioSelf.__longitudes=np.asarray(inLongitudes,dtype=np.float64)
+        ioSelf.__latitudes=np.asarray(inLatitudes,dtype=np.float64)
+        ioSelf.__elevations=np.asarray(inElevations,dtype=np.float64)
+        ioSelf.__temps=np.asarray(inTemps,dtype=np.int64)
+        ioSelf.__nbre=len(ioSelf.__longitudes)
+        ioSelf.__natures,ioSelf.__traces,ioSelf.__troncons=_types_par_defaut(ioSelf.__nbre,inNatures,inTraces,inTroncons)
+        ioSelf.__partage=inPartage
+        ioSelf._invalider()
+    
+    def __detacher(ioSelf):
+        """
+        PROCEDURE recopiant les colonnes reçues de l'appelant (vues sur un fichier projeté, colonnes d'un autre segment)
+        avant leur première modification : le segment ne modifie jamais des tableaux qui ne lui appartiennent pas
+        """
+        if not ioSelf.__partage:
+            return
+        (ioSelf.__longitudes,ioSelf.__latitudes,ioSelf.__elevations,ioSelf.__temps,
+         ioSelf.__natures,ioSelf.__traces,ioSelf.__troncons)=[np.array(colonne,copy=True) for colonne in 
+                                                              (ioSelf.__longitudes,ioSelf.__latitudes,ioSelf.__elevations,
+                                                               ioSelf.__temps,ioSelf.__natures,ioSelf.__traces,
+                                                               ioSelf.__troncons)]
+        ioSelf.__partage=False
+    
+    def __reserver(ioSelf,inNbre):
+        """
+        PROCEDURE garantissant que les colonnes peuvent contenir inNbre points. 
+        La capacité est doublée à chaque agrandissement : l'ajout d'un point coûte en moyenne O(1)
+        """
+        capacite=len(ioSelf.__longitudes)
+        if inNbre<=capacite:
+            return
+        capacite=max(inNbre,2*capacite,16)
+        colonnes=[]
+        for colonne in (ioSelf.__longitudes,ioSelf.__latitudes,ioSelf.__elevations,ioSelf.__temps,
+                        ioSelf.__natures,ioSelf.__traces,ioSelf.__troncons):
+            nouvelle=np.empty(capacite,dtype=colonne.dtype) # nouvelle colonne agrandie
+            nouvelle[:ioSelf.__nbre]=colonne[:ioSelf.__nbre] # recopie des points existants
+            colonnes.append(nouvelle)
+        (ioSelf.__longitudes,ioSelf.__latitudes,ioSelf.__elevations,ioSelf.__temps,
+         ioSelf.__natures,ioSelf.__traces,ioSelf.__troncons)=colonnes
+        ioSelf.__partage=False # les colonnes agrandies appartiennent au segment
+    
+    def __ecrire(ioSelf,inRang,inPoint):
+        """
+        PROCEDURE écrivant les caractéristiques de l'objet Point inPoint au rang inRang des colonnes
+        """
+        ioSelf.__detacher()
+        ioSelf.__longitudes[inRang]=inPoint.longitude()
+        ioSelf.__latitudes[inRang]=inPoint.latitude()
+        ioSelf.__elevations[inRang]=inPoint.elevation()
+        ioSelf.__temps[inRang]=_temps_du_point(inPoint)
+        ioSelf.__natures[inRang]=inPoint.nature()
+        ioSelf.__traces[inRang]=inPoint.trace()
+        ioSelf.__troncons[inRang]=inPoint.troncon()
+        ioSelf._invalider()
+    
+    def __len__(inSelf): # return int
+        """
+        Retourne le nombre de points du segment
+        """
+        return inSelf.__nbre
+    
+    def __getitem__(inSelf,inRang): # return PointVue ou SegmentColonnaire
+        """
+        Retourne le point de rang inRang (objet PointVue) ou, pour une tranche ou un masque booléen (numpy array, 
+        voir Segment.simplifier), un nouvel objet SegmentColonnaire
+        """
+        if isinstance(inRang,slice) or (isinstance(inRang,np.ndarray) and inRang.dtype==bool):
+            extrait=SegmentColonnaire(inSelf.nom(),inSelf.incremental())
+            extrait.__remplir(*[colonne[inRang].copy() for colonne in inSelf.colonnes()+inSelf.types()])
+            return extrait
+        return PointVue(inSelf,inSelf.__rang(inRang))
+    
+    def __iter__(inSelf):
+        """
+        Parcours des points du segment (objets PointVue)
+        """
+        for rang in range(inSelf.__nbre):
+            yield PointVue(inSelf,rang)
+    
+    def __rang(inSelf,inRang): # return int
+        """
+        Retourne le rang positif correspondant à inRang (éventuellement négatif) ; IndexError s'il est hors du segment
+        """
+        rang=int(inRang)
+        if rang<0:
+            rang+=inSelf.__nbre
+        if not 0<=rang<inSelf.__nbre:
+            raise IndexError('rang de point hors du segment')
+        return rang
+    
+    def __setitem__(ioSelf,inRang,inPoint):
+        """
+        PROCEDURE remplaçant le point de rang inRang par l'objet Point inPoint
+        """
+        if isinstance(inRang,slice):
+            raise TypeError("SegmentColonnaire : le remplacement d'une tranche de points n'est pas géré")
+        ioSelf.__ecrire(ioSelf.__rang(inRang),inPoint)
+    
+    def __delitem__(ioSelf,inRang):
+        """
+        PROCEDURE supprimant le point de rang inRang (ou la tranche de points inRang)
+        """
+        if not isinstance(inRang,slice):
+            inRang=ioSelf.__rang(inRang)
+        ioSelf.__remplir(*[np.delete(colonne,inRang) for colonne in ioSelf.colonnes()+ioSelf.types()])
+    
+    def __iadd__(ioSelf,inPoints): # return SegmentColonnaire
+        """
+        Opérateur += : ajout des points inPoints à la fin du segment
+        """
+        ioSelf.extend(inPoints)
+        return ioSelf
+    
+    def __reversed__(inSelf):
+        """
+        Parcours des points du segment (objets PointVue) du dernier au premier
+        """
+        for rang in range(inSelf.__nbre-1,-1,-1):
+            yield PointVue(inSelf,rang)
+    
+    def __masque_point(inSelf,inPoint): # return numpy array
+        """
+        Retourne le masque des points du segment ayant les caractéristiques de l'objet Point inPoint. Les points étant 
+        stockés en colonnes, un point appartient au segment s'il a les mêmes valeurs (et non s'il est le même objet)
+        """
+        longitudes,latitudes,elevations,temps=inSelf.colonnes()
+        natures,traces,troncons=inSelf.types()
+        elevation=inPoint.elevation()
+        masque=(longitudes==inPoint.longitude())&(latitudes==inPoint.latitude())&(temps==_temps_du_point(inPoint))
+        masque&=np.isnan(elevations) if elevation!=elevation else elevations==elevation # altitude absente : NaN
+        masque&=(natures==inPoint.nature())&(traces==inPoint.trace())&(troncons==inPoint.troncon())
+        return masque
+    
+    def __contains__(inSelf,inPoint): # return bool
+        """
+        Opérateur in : True si un point du segment a les caractéristiques de l'objet Point inPoint
+        """
+        return isinstance(inPoint,Point) and bool(inSelf.__masque_point(inPoint).any())
+    
+    def index(inSelf,inPoint,inDebut=0,inFin=sys.maxsize): # return int
+        """
+        Retourne le rang du premier point (entre les rangs inDebut et inFin) ayant les caractéristiques de l'objet 
+        Point inPoint ; ValueError si aucun
+        """
+        if isinstance(inPoint,Point):
+            debut,fin,_=slice(inDebut,inFin).indices(inSelf.__nbre)
+            rangs=np.flatnonzero(inSelf.__masque_point(inPoint)[debut:fin])
+            if len(rangs):
+                return debut+int(rangs[0])
+        raise ValueError("point absent du segment")
+    
+    def count(inSelf,inPoint): # return int
+        """
+        Retourne le nombre de points du segment ayant les caractéristiques de l'objet Point inPoint
+        """
+        return int(inSelf.__masque_point(inPoint).sum()) if isinstance(inPoint,Point) else 0
+    
+    def __eq__(inSelf,inAutre): # return bool
+        """
+        Opérateur == : True si inAutre (SegmentColonnaire ou séquence d'objets Point) a les mêmes points, dans le même ordre
+        """
+        if not isinstance(inAutre,list):
+            return NotImplemented
+        if len(inAutre)!=inSelf.__nbre:
+            return False
+        if isinstance(inAutre,SegmentColonnaire):
+            colonnes=inAutre.colonnes()+inAutre.types()
+        elif all(isinstance(point,Point) for point in inAutre):
+            colonnes=_colonnes_des_points(inAutre)+_types_des_points(inAutre)
+        else:
+            return False
+        return all(np.array_equal(colonne,autre,equal_nan=colonne.dtype.kind=='f') 
+                   for colonne,autre in zip(inSelf.colonnes()+inSelf.types(),colonnes))
+    
+    def __ne__(inSelf,inAutre): # return bool
+        """
+        Opérateur != (voir __eq__)
+        """
+        egal=inSelf.__eq__(inAutre)
+        return egal if egal is NotImplemented else not egal
+    
+    def __add__(inSelf,inPoints): # return SegmentColonnaire
+        """
+        Opérateur + : nouveau segment formé des points du segment suivis des points inPoints
+        """
+        somme=inSelf[:]
+        somme.extend(inPoints)
+        return somme
+    
+    def __radd__(inSelf,inPoints): # return list
+        """
+        Opérateur + quand le segment est à droite d'une liste : liste des points inPoints suivis des points du segment
+        """
+        return list(inPoints)+list(inSelf)
+    
+    def __mul__(inSelf,inNombre): # return SegmentColonnaire
+        """
+        Opérateur * : nouveau segment formé des points du segment répétés inNombre fois
+        """
+        produit=SegmentColonnaire(inSelf.nom(),inSelf.incremental())
+        produit.extend_colonnes(*[np.tile(colonne,max(operator.index(inNombre),0)) for colonne in inSelf.colonnes()+inSelf.types()])
+        return produit
+    
+    __rmul__=__mul__
+    
+    def __imul__(ioSelf,inNombre): # return SegmentColonnaire
+        """
+        Opérateur *= : répétition des points du segment
+        """
+        ioSelf.__remplir(*[np.tile(colonne,max(operator.index(inNombre),0)) for colonne in ioSelf.colonnes()+ioSelf.types()])
+        return ioSelf
+    
+    def copy(inSelf): # return SegmentColonnaire
+        """
+        Retourne une copie du segment (colonnes recopiées)
+        """
+        return inSelf[:]
+    
+    def __copy__(inSelf): # return SegmentColonnaire
+        """
+        Copie par copy.copy : les colonnes sont recopiées (voir copy)
+        """
+        return inSelf[:]
+    
+    def __deepcopy__(inSelf,inMemo): # return SegmentColonnaire
+        """
+        Copie par copy.deepcopy : les colonnes sont recopiées (voir copy)
+        """
+        return inSelf[:]
+    
+    def __reduce__(inSelf): # return tuple
+        """
+        Sérialisation (pickle) : le segment est reconstruit à partir de ses colonnes (voir _reconstruire_segment_colonnaire)
+        """
+        return (_reconstruire_segment_colonnaire,(inSelf.nom(),inSelf.incremental(),inSelf.colonnes()+inSelf.types()))
+    
+    def lire_fichier_GPX(ioSelf,inNomFichierGPX,inFlux=True,inChamps=CHAMPS_GPX):
+        """
+        PROCEDURE permettant de lire un fichier GPX et de charger ses Points dans les colonnes du segment.
         
-        # Instructions pour le format ASCII
-        elif inFormat=='ASCII' :
-            # Définition du nom du fichier GeoTiff à écrire
-            nomSortie=os.path.join(dossierCourant,ioSelf.__nom+'.asc') # Le fichier a le même nom que celui donné à la classe Relief
-            # 1- Création du fichier en ériture avec une extenion .asc
-            fichASC = open(nomSortie, "w")
-            # 2- Définition de l'entête du fichier ASCII
-            # Basé sur le type de format ASCII lu par ArcGIS (http://resources.esri.com/help/9.3/arcgisdesktop/com/gp_toolref/spatial_analyst_tools/esri_ascii_raster_format.htm) 
-            ASC_ENTETE = 'ncols %s \n' %nbCol \
-                        +'nrows %s \n' %nbLignes \
-                        +'xllcorner %s \n' %min(x) \
-                        +'yllcorner %s \n' %min(y) \
-                        +'cellsize %s \n' %ioSelf.__taille_pixel
-                        
-            # 3- Ecriture de l'entête dans le fichier
-            fichASC.write(ASC_ENTETE)
-           
-            # 4- Ecriture du corps du fichier ASCII
-            # Altitudes interpolées séparées par un espace et disposées ligne par ligne
-            for numLigne in range(nbLignes): # Parcours des lignes du tableau des altitudes interpolées
-                for numCol in range(nbCol): # Parcours des colonnes du tableau des altitudes interpolées
-                    valeurAltitude=ioSelf.__altitudes_interpolees[numLigne,numCol] # Récupération de la valeur d'altitude pour une ligne et une colonne donnée
-                    # Ecriture de la valeur d'altitude avec un espace dans le fichier ASCII jusqu'à la dernière colonne de la ligne
-                    if numCol < nbLignes-1 :
-                        fichASC.write(str(valeurAltitude)+" ")
-                    # Ecriture de la valeur d'altitude dans le fichier ASCII avec un espace et un saut de ligne s'il s'agit de la 
-                    # dernière colonne de la ligne
-                    elif numCol == nbLignes-1 :
-                        fichASC.write(str(valeurAltitude)+" ")
-                        fichASC.write("\n")
-            # 5- Fermeture du fichier ASCII
-            fichASC.close()
+        ENTREES:
+            inNomFichierGPX : str # Chemin d'accès au fichier GPX à lire
+            inFlux : Variable booléenne. Par défaut True : le fichier est lu au fil de l'eau directement dans les colonnes 
+                     (fonction _lire_colonnes_GPX), colonnes des types comprises. Si False, lecture par la bibliothèque 
+                     gpxpy (Segment.lire_fichier_GPX)
+            inChamps : Champs gpxpy analysés en lecture gpxpy (voir Segment.lire_fichier_GPX)
+        """
+        if not inFlux:
+            Segment.lire_fichier_GPX(ioSelf,inNomFichierGPX,inChamps=inChamps)
+            return
+        ioSelf.extend_colonnes(*_lire_colonnes_GPX(inNomFichierGPX,inTypes=True))
+    
+    def append(ioSelf,inPoint):
+        """
+        PROCEDURE ajoutant l'objet Point inPoint à la fin du segment
+        """
+        totaux=ioSelf._totaux()
+        ioSelf.__reserver(ioSelf.__nbre+1)
+        ioSelf.__ecrire(ioSelf.__nbre,inPoint)
+        ioSelf.__nbre+=1
+        if ioSelf.incremental():
+            rang=ioSelf.__nbre-1
+            ioSelf._prolonger_totaux(totaux,[colonne[rang:] for colonne in ioSelf.colonnes()],ioSelf.types()[0][rang:])
+    
+    def extend(ioSelf,inPoints):
+        """
+        PROCEDURE ajoutant les objets Points de inPoints à la fin du segment
+        """
+        if isinstance(inPoints,SegmentColonnaire):
+            # Ajout direct des colonnes (recopiées pour ne pas partager le stockage de inPoints)
+            ioSelf.extend_colonnes(*[colonne.copy() for colonne in inPoints.colonnes()+inPoints.types()])
+            return
+        for point in inPoints:
+            ioSelf.append(point)
+    
+    def extend_colonnes(ioSelf,inLongitudes,inLatitudes,inElevations,inTemps,inNatures=None,inTraces=None,inTroncons=None):
+        """
+        PROCEDURE ajoutant à la fin du segment des points donnés directement en colonnes. Dans un segment vide, les 
+        tableaux sont repris sans recopie : ils ne sont recopiés qu'avant la première modification du segment et ne 
+        sont donc jamais modifiés par lui
+        ENTREES :
+            inLongitudes, inLatitudes, inElevations : tableaux de float
+            inTemps : tableau d'int64 (millisecondes depuis le 01/01/1970 UTC, TEMPS_ABSENT si absent)
+            inNatures, inTraces, inTroncons : tableaux d'entiers (voir Segment.types). Par défaut None : 
+                                              points du premier tronçon d'une trace
+        """
+        nbre=len(inLongitudes)
+        totaux=ioSelf._totaux()
+        debut=ioSelf.__nbre
+        natures,traces,troncons=_types_par_defaut(nbre,inNatures,inTraces,inTroncons)
+        if debut==0:
+            # Segment vide : les tableaux lus sont repris tels quels, sans recopie tant que le segment n'est pas modifié
+            ioSelf.__remplir(inLongitudes,inLatitudes,inElevations,inTemps,natures,traces,troncons,inPartage=True)
+        else:
+            ioSelf.__reserver(debut+nbre)
+            ioSelf.__detacher()
+            fin=debut+nbre
+            ioSelf.__longitudes[debut:fin]=inLongitudes
+            ioSelf.__latitudes[debut:fin]=inLatitudes
+            ioSelf.__elevations[debut:fin]=inElevations
+            ioSelf.__temps[debut:fin]=inTemps
+            ioSelf.__natures[debut:fin]=natures
+            ioSelf.__traces[debut:fin]=traces
+            ioSelf.__troncons[debut:fin]=troncons
+            ioSelf.__nbre=fin
+            ioSelf._invalider()
+        if ioSelf.incremental():
+            ioSelf._prolonger_totaux(totaux,[colonne[debut:] for colonne in ioSelf.colonnes()],ioSelf.types()[0][debut:])
+    
+    def insert(ioSelf,inRang,inPoint):
+        """
+        PROCEDURE insérant l'objet Point inPoint avant le rang inRang
+        """
+        rang=min(max(inRang+ioSelf.__nbre if inRang<0 else inRang,0),ioSelf.__nbre)
+        ioSelf.__remplir(*[np.insert(colonne,rang,valeur) for colonne,valeur in 
+                           zip(ioSelf.colonnes()+ioSelf.types(),(inPoint.longitude(),inPoint.latitude(),
+                                                                 inPoint.elevation(),_temps_du_point(inPoint),
+                                                                 inPoint.nature(),inPoint.trace(),inPoint.troncon()))])
+    
+    def pop(ioSelf,inRang=-1): # return Point
+        """
+        Retire le point de rang inRang (par défaut le dernier) et le retourne sous forme d'objet Point
+        """
+        vue=ioSelf[inRang]
+        point=Point(vue.longitude(),vue.latitude(),vue.elevation(),vue.instant(),vue.nature(),vue.trace(),vue.troncon())
+        del ioSelf[inRang]
+        return point
+    
+    def remove(ioSelf,inPoint):
+        """
+        PROCEDURE retirant le premier point ayant les caractéristiques de l'objet Point inPoint ; ValueError si aucun
+        """
+        del ioSelf[ioSelf.index(inPoint)]
+    
+    def sort(ioSelf,key=None,reverse=False):
+        """
+        PROCEDURE triant les points du segment (voir list.sort : la clé key est appliquée aux objets PointVue)
+        """
+        vues=list(ioSelf)
+        ordre=sorted(range(ioSelf.__nbre),key=vues.__getitem__ if key is None else lambda rang: key(vues[rang]),
+                     reverse=reverse)
+        ioSelf.__remplir(*[colonne[ordre] for colonne in ioSelf.colonnes()+ioSelf.types()])
+    
+    def clear(ioSelf):
+        """
+        PROCEDURE supprimant tous les points du segment
+        """
+        if ioSelf.__partage: # les colonnes reçues de l'appelant sont abandonnées, et non réutilisées pour les ajouts suivants
+            ioSelf.__remplir(np.empty(0),np.empty(0),np.empty(0),np.empty(0,dtype=np.int64))
+        ioSelf.__nbre=0
+        ioSelf._invalider()
+    
+    def reverse(ioSelf):
+        """
+        PROCEDURE inversant l'ordre des points du segment
+        """
+        ioSelf.__remplir(*[colonne[::-1].copy() for colonne in ioSelf.colonnes()+ioSelf.types()])
+    
+    def colonnes(inSelf): # return tuple de numpy array
+        """
+        Retourne les colonnes (longitudes, latitudes, élévations, temps) du segment, limitées à ses points.
+        Les tableaux renvoyés sont des vues sur le stockage du segment : ils ne doivent pas être modifiés.
+        """
+        nbre=inSelf.__nbre
+        return (inSelf.__longitudes[:nbre],inSelf.__latitudes[:nbre],inSelf.__elevations[:nbre],inSelf.__temps[:nbre])
+    
+    def types(inSelf): # return tuple de numpy array
+        """
+        Retourne les colonnes (natures, traces, tronçons) du segment (voir Segment.types), vues sur son stockage
+        """
+        nbre=inSelf.__nbre
+        return (inSelf.__natures[:nbre],inSelf.__traces[:nbre],inSelf.__troncons[:nbre])
+
+class Relief(object):
+    """
+    ROLE : Génère un Modèle Numérique de Terrain Raster en format (ASII ou TIF) et 
+           Affiche en 2D et 3D le Relief d'une zone géographique par interpolation 
+           de points (longitude, latitude, elevation) provenant de traces GPX de cette zone.
+    
+    ATTRIBUTS :
+        __nom : str 
+        __taille_pixel : float
+        __manifeste : dict (fichiers GPX chargés : chemin => (taille, date de modification, tableau des coordonnées))
+        __filtre : tuple (emprise et fenêtre de temps d'intérêt, pas de rééchantillonnage des points du manifeste)
+        __index : tuple (tableau des coordonnées indexé, index spatial de ses points ; construit à la première recherche)
+        __coordonnees_points : scipy array (Tableau de n lignes et 3 colonnes correspoondant aux longitudes, latitudes et altitudes 
+                               des points provenant de traces GPX
+        __altitudes_interpolees : scipy array (Tableau des altitudes interpolées)
+        __longitudes_croisements : scipy array (Longitudes aux croisements de la grille d'interpolation)
+        __latitudes_croisements : scipy array (Latitudes aux croisements de la grille d'interpolation)
+    
+    SERVICES :
+        __init__(outSelf,inNom='Relief_Randonnee',inTaillePixel=0.001) 
+        __str__(inSelf) : str
+        __repr__(inSelf) : str
+        lire_dossier_GPX(outSelf,inNomDossierGPX,inNbProcessus=1,inCache=None,inEmprise=None,inFenetreTemps=None,inCatalogue=None,
+                         inPasReechantillonnage=None)
+        actualiser_dossier_GPX(ioSelf,inNomDossierGPX,inNbProcessus=1,inCache=None,inEmprise=None,inFenetreTemps=None,
+                               inCatalogue=None,inPasReechantillonnage=None) : dict
+        lire_dossier_GPX_async(outSelf,inNomDossierGPX,inNbProcessus=1,inNbLectures=8,inOctetsMax=64*1024*1024,
+                               inEmprise=None,inFenetreTemps=None) : coroutine
+        lire_catalogue(outSelf,inCatalogue,inEmprise=None,inFenetreTemps=None,inActivite=None,inNbProcessus=1,inCache=None) : list
+        lire_traces_binaires(outSelf,inFichierBinaire,inEmprise=None,inFenetreTemps=None)
+        eclaircir_points(ioSelf,inTailleCellule=None,inMethode='moyenne') : int
+        plus_proches_points(inSelf,inLongitudes,inLatitudes,inK=1) : tuple de numpy array
+        points_dans_rayon(inSelf,inLongitudes,inLatitudes,inRayon) : numpy array ou list
+        generer_mnt(outSelf,inMethod,inFormat) 
+        afficher_relief(inSelf,inSave)
+    
+    """
+    def __init__(outSelf,inNom='Relief_Randonnee',inTaillePixel=0.001):
+        """
+        Initialisation de la classe Relief 
+        ENTREES : 
+            inNom : (par défaut Relief_Randonnée) nom à attribuer à la grille Raster (MNT) à générer et 
+                    l'affichage 3D qui sera éventuellement sauvegardée.
+            inTaillePixel : Taille des cellules de la grille Raster (MNT) qui sera générée par interpolation. 
+                            Par défaut 0.001°(100m)
+        """
+        object.__init__(outSelf) # Initialisation de la classe object dont hérite la classe Relief
+        outSelf.__nom=str(inNom) # Ajout d'un attribut nom pour la Classe Relief
+        outSelf.__taille_pixel=float(inTaillePixel)
+        outSelf.__manifeste={} # fichiers GPX chargés : chemin => (taille, date de modification, tableau des coordonnées)
+        outSelf.__filtre=(None,None,None) # emprise et fenêtre de temps d'intérêt, pas de rééchantillonnage des points du manifeste
+        outSelf.__index=None # index spatial des points chargés, construit à la première recherche
         
-    def afficher_relief(inSelf,inSave=True):
+    def __str__(inSelf): # return str
         """
-        PROCEDURE permettant d'afficher en 2D et 3D avec la bibliothèque Matplotlib la grille raster résultante de l'interpolation 
-        des altitudes des points stockés dans l'atrribut __coordonnees_points. 
+        Chaîne d'affichage standard de la classe Relief
+        """
+        return inSelf.__nom
+    
+    def __repr__(inSelf): # return str
+        """
+        Chaîne d'affichage de débogage
+        """
+        return str(inSelf.__dict__)
+    
+    def lire_dossier_GPX(outSelf,inNomDossierGPX,inNbProcessus=1,inCache=None,inEmprise=None,inFenetreTemps=None,
+                         inCatalogue=None,inPasReechantillonnage=None):
+        """
+        PROCEDURE permettant de lire un par un, des fichiers GPX contenus dans un dossier, éventuellement compressés 
+        ou regroupés dans des archives zip (voir _lister_fichiers_GPX), sans les décompresser sur disque
+        (lecture au fil de l'eau, fonction _lire_coordonnees_GPX) et de charger les points qu'ils contiennent 
+        dans l'attribut __coordonnees_points de type tableau (numpy.array). Les points sans altitude sont ignorés.
+        Les fichiers lus sont enregistrés dans le manifeste du relief (voir actualiser_dossier_GPX).
         
-        ENTREE 
-            inSave : Variable booléenne. Si sa valeur est True (par défaut) les affichages 2D et 3D de la grille raster sont 
-                     sauvegardées en fichiers physiques au format JPEG à la racine de ce fichier.
+        ENTREES:
+            inNomDossierGPX : # str Chemin d'accès à un répertoire contenant un ou plusieurs fichiers GPX
+            inNbProcessus : # int Nombre de processus lisant les fichiers en parallèle. Par défaut 1 (lecture dans le 
+                            processus courant) ; None pour autant de processus que de processeurs.
+                            L'ordre des points est le même quel que soit le nombre de processus.
+            inCache : # CacheTraces Cache disque des points déjà lus (par défaut None : pas de cache). 
+                      Seuls les fichiers absents du cache ou modifiés sont analysés, puis mis en cache.
+                      Le cache n'est pas utilisé avec une fenêtre de temps ni avec un rééchantillonnage.
+            inEmprise : # tuple (lonMin, latMin, lonMax, latMax) Zone d'intérêt en degrés (par défaut None : pas de filtre).
+                        Les points hors de la zone sont abandonnés au fil de la lecture, et la lecture d'un fichier 
+                        s'arrête dès son en-tête si l'emprise qu'il déclare (balise bounds) ne recoupe pas la zone.
+            inFenetreTemps : # tuple (debut, fin) Période d'intérêt en secondes depuis le 01/01/1970 UTC (par défaut None : 
+                             pas de filtre ; une borne None n'est pas filtrée). Les points sans heure sont abandonnés.
+            inCatalogue : # Catalogue Index des fichiers (par défaut None) : les fichiers dont la fiche, à jour, montre 
+                          qu'ils ne recoupent pas la zone ou la période ne sont pas ouverts.
+            inPasReechantillonnage : # float Pas en mètres (par défaut None : pas de rééchantillonnage). Les traces de 
+                                     chaque fichier sont rééchantillonnées à ce pas avant l'interpolation (voir 
+                                     Segment.reechantillonner) : la densité des points le long des traces ne dépend 
+                                     plus de la vitesse de déplacement. La zone et la période sont filtrées ensuite.
+        """ 
+        outSelf.__manifeste={} # tous les fichiers du dossier sont lus
+        outSelf.actualiser_dossier_GPX(inNomDossierGPX,inNbProcessus,inCache,inEmprise,inFenetreTemps,inCatalogue,
+                                       inPasReechantillonnage)
+    
+    def actualiser_dossier_GPX(ioSelf,inNomDossierGPX,inNbProcessus=1,inCache=None,inEmprise=None,inFenetreTemps=None,
+                               inCatalogue=None,inPasReechantillonnage=None): # return dict
         """
+        PROCEDURE (et FONCTION) mettant à jour les points du relief d'après le contenu actuel d'un dossier GPX : 
+        le dossier est comparé au manifeste des fichiers déjà chargés (taille et date de modification), 
+        seuls les fichiers ajoutés ou modifiés sont lus et les points des fichiers supprimés sont retirés.
+        Le coût de l'actualisation est ainsi proportionnel aux nouvelles données et non à la taille du dossier.
+        Retourne le dictionnaire des listes de fichiers 'ajoutes', 'modifies' et 'supprimes'.
+        Si la zone ou la période d'intérêt ou le pas de rééchantillonnage changent, tous les fichiers sont relus.
         
-        # Récupération de listes longitudes (indice 0), latitudes (indice 1) et altitudes requises pour les tracés avec Matplotlib
-        x=inSelf.__coordonnees_points[:,0] # Longitudes
-        y=inSelf.__coordonnees_points[:,1] # Latitudes
-        z=inSelf.__coordonnees_points[:,2] # Altitudes
+        ENTREES: voir lire_dossier_GPX
+        """
+        filtre=(None if inEmprise is None else tuple(inEmprise),None if inFenetreTemps is None else tuple(inFenetreTemps),
+                inPasReechantillonnage)
+        if filtre!=ioSelf.__filtre:
+            ioSelf.__manifeste={} # les points chargés l'ont été pour une autre zone, période ou un autre pas
+            ioSelf.__filtre=filtre
+        # liste triée des fichiers GPX contenus dans le dossier d'entrée (l'ordre des points ne dépend pas du système)
+        lstFichiers=_lister_fichiers_GPX(inNomDossierGPX)
         
-        # =============================================================================
-        #         Affichage 2D & 3D
-        # =============================================================================
+        # Comparaison du dossier avec le manifeste : fichier => (taille, date de modification, tableau des coordonnées)
+        dicoEtats={fichier:_etat_fichier(fichier) for fichier in lstFichiers}
+        dicoChangements={'ajoutes':[fichier for fichier in lstFichiers if fichier not in ioSelf.__manifeste],
+                         'modifies':[fichier for fichier in lstFichiers if fichier in ioSelf.__manifeste 
+                                     and ioSelf.__manifeste[fichier][:2]!=dicoEtats[fichier]],
+                         'supprimes':sorted(fichier for fichier in ioSelf.__manifeste if fichier not in dicoEtats)}
         
-        # Définition d'une liste de 11 palettes de couleur de Matplotlib 
-        # pour le choix de la palette de couleur à attribuer aux affichages 2D et 3D
-        lstPalettes=["viridis","gray","magma","BuPu","inferno","GnBu","plasma","winter","RdYlGn","Spectral","cool"]
-        numPalette=random.randint(0,10) # Ce numéro aléatoire compris entre 0 et 10 va permettre de changer la palette de couleur 
-                                        # à chaque exécution de cette méthode (afficher_relief)
+        # Lecture des seuls fichiers ajoutés ou modifiés
+        lstALire=sorted(dicoChangements['ajoutes']+dicoChangements['modifies'])
+        dicoTableaux=_lire_fichiers_coordonnees(lstALire,inNbProcessus,inCache,*filtre[:2],inCatalogue,filtre[2])
         
-        # Changement de la police par défaut (et de sa Taille) des figures avec Maptplotlib
-        plt.rcParams["font.family"] = "Arial"
-        plt.rcParams["font.size"] = 12
+        # Mise à jour du manifeste
+        for fichier in dicoChangements['supprimes']:
+            del ioSelf.__manifeste[fichier]
+        for fichier in lstALire:
+            ioSelf.__manifeste[fichier]=dicoEtats[fichier]+(dicoTableaux[fichier],)
         
-        # Création d'une nouvelle figure
-        fig=plt.figure() 
+        # Création d'un attribut de type tableau (numpy.array) de type float à 3 colonnes (longitudes, latitudes et altitudes)
+        # par mise bout à bout des tableaux des fichiers du manifeste
+        ioSelf.__coordonnees_points=_concatener_coordonnees([ioSelf.__manifeste[fichier][2] for fichier in lstFichiers])
+        return dicoChangements
+    
+    async def lire_dossier_GPX_async(outSelf,inNomDossierGPX,inNbProcessus=1,inNbLectures=8,inOctetsMax=64*1024*1024,
+                                     inEmprise=None,inFenetreTemps=None):
+        """
+        PROCEDURE (coroutine asyncio) équivalente à lire_dossier_GPX, pour les dossiers sur un support lent (partage 
+        réseau) : le contenu des fichiers est lu par plusieurs lectures simultanées pendant que les fichiers déjà lus 
+        sont analysés, au lieu d'alterner lecture bloquante et analyse. Usage : await relief.lire_dossier_GPX_async(dossier)
+        Les fichiers sont pris dans l'ordre : un fichier n'est lu que si le contenu brut des fichiers lus et pas encore 
+        analysés, ajouté au sien, ne dépasse pas inOctetsMax (un fichier plus gros est lu seul).
         
-        # Affichage 2D
-        plt.subplot(121) # Création d'une grille de 1 ligne et 2 colonnes; l'affichage 2D sera représentée à la 1ère colonne
-        plt.xlabel('Longitudes',fontweight='bold',labelpad=10,fontsize=10) # Personnalisation de l'axe des X (longitudes)     
-        plt.ylabel('Latitudes',fontweight='bold',labelpad=10,fontsize=10)  # Personnalisation de l'axe des Y (latitudes)
-        plt.title('Affichage 2D de %s'%inSelf.__nom,fontweight='bold',fontsize=10) # Titre du tracé
-        plt.xlim(min(x),max(x)) # Définition des limites horizontales du tracé (axe X)
-        plt.ylim(min(y),max(y)) # Définition des limites verticales du tracé (axe Y)
-        plt.plot(x,y,'k.',markersize=0.8) # Tracé des points de coordonnées (x,y) marqués en noir avec une taille de 0,8
-        # Ajout de la grille des altitudes interpolées au tracé des points
-        plt.imshow(inSelf.__altitudes_interpolees,extent=(min(x),max(x),min(y),max(y)),cmap=lstPalettes[numPalette])
-        plt.colorbar() # Affichage de la palette de couleur utilisée
+        ENTREES:
+            inNomDossierGPX : # str Chemin d'accès à un répertoire contenant un ou plusieurs fichiers GPX
+            inNbProcessus : # int Nombre de processus d'analyse. Par défaut 1 (analyse dans un fil d'exécution du 
+                            processus courant) ; None pour autant de processus que de processeurs.
+            inNbLectures : # int Nombre de lectures de fichiers simultanées. Par défaut 8
+            inOctetsMax : # int Nombre maximal d'octets lus en attente d'analyse ou en cours d'analyse. Par défaut 64 Mo
+            inEmprise, inFenetreTemps : voir lire_dossier_GPX
+        """
+        filtre=(None if inEmprise is None else tuple(inEmprise),None if inFenetreTemps is None else tuple(inFenetreTemps))
+        boucle=asyncio.get_running_loop()
+        condition=asyncio.Condition() # signale la libération d'octets après chaque analyse
+        octetsEnCours=0
         
-        # Affichage 3D
-        affichage3D = fig.add_subplot(122, projection='3d') # laffichage 3D sera représentée à la 2ème colonne de la grille créée
+        async def traiter(inFichier,inOctets):
+            # Lecture puis analyse d'un fichier, dont les inOctets réservés sont libérés à la fin de l'analyse
+            nonlocal octetsEnCours
+            try:
+                contenu=await boucle.run_in_executor(lecteurs,_lire_octets_GPX,inFichier)
+                return await boucle.run_in_executor(analyseurs,_analyser_octets_GPX,inFichier,contenu,*filtre)
+            finally:
+                async with condition:
+                    octetsEnCours-=inOctets
+                    condition.notify_all()
+        
+        # Analyse dans un fil d'exécution si un seul processus est demandé : la boucle asyncio n'est jamais bloquée
+        with ThreadPoolExecutor(max_workers=inNbLectures) as lecteurs, \
+             (ThreadPoolExecutor(max_workers=1) if inNbProcessus==1 else ProcessPoolExecutor(max_workers=inNbProcessus)) as analyseurs:
+            lstFichiers=await boucle.run_in_executor(lecteurs,_lister_fichiers_GPX,inNomDossierGPX)
+            lstEtats=await asyncio.gather(*(boucle.run_in_executor(lecteurs,_etat_fichier,fichier) for fichier in lstFichiers))
+            lstTaches=[]
+            for fichier,etat in zip(lstFichiers,lstEtats):
+                octets=min(etat[0],inOctetsMax) # taille du contenu brut gardé en mémoire jusqu'à son analyse
+                async with condition:
+                    await condition.wait_for(lambda: octetsEnCours+octets<=inOctetsMax)
+                    octetsEnCours+=octets
+                lstTaches.append(asyncio.ensure_future(traiter(fichier,octets)))
+            lstTableaux=await asyncio.gather(*lstTaches)
+        
+        # Même manifeste et même tableau des points que lire_dossier_GPX
+        outSelf.__filtre=filtre+(None,)
+        outSelf.__manifeste={fichier:etat+(tableau,) for fichier,etat,tableau in zip(lstFichiers,lstEtats,lstTableaux)}
+        outSelf.__coordonnees_points=_concatener_coordonnees(lstTableaux)
+    
+    def lire_catalogue(outSelf,inCatalogue,inEmprise=None,inFenetreTemps=None,inActivite=None,inNbProcessus=1,inCache=None): # return list
+        """
+        PROCEDURE (et FONCTION) chargeant les points des seuls fichiers GPX d'un catalogue pouvant contribuer à une 
+        zone et/ou une période (voir Catalogue.rechercher) : les autres fichiers de l'archive ne sont pas ouverts.
+        Le catalogue doit être à jour (Catalogue.indexer). Les fichiers lus remplacent le manifeste du relief.
+        Retourne la liste des fichiers lus.
+        
+        ENTREES:
+            inCatalogue : # Catalogue Index des fichiers GPX de l'archive
+            inEmprise : # tuple (lonMin, latMin, lonMax, latMax) Zone recherchée en degrés (None : pas de filtre)
+            inFenetreTemps : # tuple (debut, fin) Période recherchée en secondes depuis le 01/01/1970 UTC (None : pas de filtre)
+            inActivite : # str Type d'activité recherché (None : pas de filtre)
+            inNbProcessus, inCache : voir lire_dossier_GPX
+        """
+        lstFichiers=inCatalogue.rechercher(inEmprise,inFenetreTemps,inActivite)
+        dicoTableaux=_lire_fichiers_coordonnees(lstFichiers,inNbProcessus,inCache)
+        outSelf.__manifeste={}
+        outSelf.__filtre=(None,None,None) # les traces retenues sont chargées en entier
+        for fichier in lstFichiers:
+            outSelf.__manifeste[fichier]=_etat_fichier(fichier)+(dicoTableaux[fichier],)
+        outSelf.__coordonnees_points=_concatener_coordonnees([dicoTableaux[fichier] for fichier in lstFichiers])
+        return lstFichiers
+    
+    def lire_traces_binaires(outSelf,inFichierBinaire,inEmprise=None,inFenetreTemps=None):
+        """
+        PROCEDURE chargeant les points d'un fichier de traces binaires (voir classe TracesBinaires) : le fichier est 
+        projeté en mémoire et, si tous ses points ont une altitude, l'attribut __coordonnees_points est une vue sur ses 
+        colonnes, sans lecture ni recopie. Le manifeste du relief est vidé.
+        
+        ENTREES:
+            inFichierBinaire : # str Chemin d'accès au fichier de traces binaires
+            inEmprise, inFenetreTemps : Zone et période d'intérêt (voir lire_dossier_GPX et TracesBinaires.coordonnees)
+        """
+        outSelf.__manifeste={}
+        outSelf.__filtre=(None,None,None)
+        # Le fichier est fermé aussitôt : une vue sans recopie garde seule la projection jusqu'à sa libération
+        with TracesBinaires(inFichierBinaire) as traces:
+            outSelf.__coordonnees_points=traces.coordonnees(inEmprise,inFenetreTemps)
+    
+    def eclaircir_points(ioSelf,inTailleCellule=None,inMethode='moyenne'): # return int
+        """
+        FONCTION fusionnant les points chargés qui tombent dans une même cellule d'une grille fine, pour que 
+        l'interpolation (generer_mnt) dépende de la surface couverte et non du nombre de passages sur un même chemin.
+        Les points d'une cellule sont remplacés par un point unique placé à leur barycentre. Retourne le nombre de 
+        points supprimés. L'éclaircissement est à refaire après chaque lecture ou actualisation des traces.
+        
+        ENTREES:
+            inTailleCellule : # float Côté des cellules en degrés. Par défaut None : le dixième de la taille des pixels du MNT
+            inMethode : # str Altitude du point fusionné : 'moyenne' (par défaut), 'mediane' ou 'dernier' (altitude du 
+                        dernier point chargé dans la cellule, soit celui du fichier lu le plus tard)
+        """
+        if inMethode not in ('moyenne','mediane','dernier'):
+            raise ValueError("méthode d'éclaircissement inconnue : "+str(inMethode))
+        tailleCellule=ioSelf.__taille_pixel/10 if inTailleCellule is None else float(inTailleCellule)
+        nbrePoints=len(ioSelf.__coordonnees_points)
+        ioSelf.__coordonnees_points=_eclaircir_coordonnees(ioSelf.__coordonnees_points,tailleCellule,inMethode)
+        return nbrePoints-len(ioSelf.__coordonnees_points)
+    
+    def __index_spatial(inSelf): # return tuple
+        """
+        Retourne l'index spatial des points chargés (voir _index_spatial), construit à la première recherche et 
+        reconstruit si le tableau des points a été remplacé (lecture, actualisation ou éclaircissement)
+        """
+        if inSelf.__index is None or inSelf.__index[0] is not inSelf.__coordonnees_points:
+            coordonnees=inSelf.__coordonnees_points
+            inSelf.__index=(coordonnees,_index_spatial(coordonnees[:,0],coordonnees[:,1],np.arange(len(coordonnees))))
+        return inSelf.__index[1]
+    
+    def plus_proches_points(inSelf,inLongitudes,inLatitudes,inK=1): # return tuple
+        """
+        FONCTION recherchant les inK points chargés les plus proches d'une ou plusieurs positions (voir 
+        Segment.plus_proches_points). Retourne (distances en mètres, rangs des points dans le tableau des coordonnées)
+        
+        ENTREES:
+            inLongitudes, inLatitudes : # float ou tableaux de float Positions en degrés
+            inK : # int Nombre de points recherchés par position (par défaut 1)
+        """
+        return _plus_proches(inSelf.__index_spatial(),inLongitudes,inLatitudes,inK)
+    
+    def points_dans_rayon(inSelf,inLongitudes,inLatitudes,inRayon): # return numpy array ou list
+        """
+        FONCTION renvoyant les rangs des points chargés à moins de inRayon mètres d'une position, ou la liste de ces 
+        rangs pour des tableaux de positions (voir Segment.points_dans_rayon)
+        
+        ENTREES:
+            inLongitudes, inLatitudes : # float ou tableaux de float Positions en degrés
+            inRayon : # float Rayon en mètres
+        """
+        return _points_dans_rayon(inSelf.__index_spatial(),inLongitudes,inLatitudes,inRayon)
+    
+    def generer_mnt(ioSelf,inMethod='nearest',inFormat='GeoTiff'):
+        """
+        PROCEDURE qui permet d'interpoler les altitudes des points stockés dans l'atrribut __coordonnees_points
+        pour créer une grille raster en GeoTiff ou ASCII exploitable sous logiciel SIG. Elle fait appel à la méthode 
+        griddata de 
+        
+        ENTREES :
+            inMethod = Méthode d'interpolation. Par défaut la méthode du plus proche voisiin ('nearest'); 
+                       Autre option l'interpolation linéaire ('linear')
+            inFormat = Format de création de la grille raster (MNT). Par défaut du GeoTiff ('GeoTiff'). Autre option ASCII ('ASCII')
+        """
+        # Création de la grille d'interpolation de données
+        # 1-Calcul des coordonnées (longitudes et latitudes) aux croisements de la grille (de pas l'attribut __taille_pixel)
+        xi=sp.arange(min(ioSelf.__coordonnees_points[:,0]),max(ioSelf.__coordonnees_points[:,0]),ioSelf.__taille_pixel) # Calcul des longitudes
+        yi=sp.arange(min(ioSelf.__coordonnees_points[:,1]),max(ioSelf.__coordonnees_points[:,1]),ioSelf.__taille_pixel) # Calcul des latitudes
+        # 2-Création de la grille proprement dite avec les coordonnées correspondantes
+        ioSelf.__longitudes_croisements,ioSelf.__latitudes_croisements = sp.meshgrid(xi,yi) # Récupération des coordonnées de la grille en tant qu'attributs de la classe Relief
+        
+        # Récupération de listes de longitudes (indice 0), latitudes (indice 1) et altitudes (indice 2) requises pour l'interpolation
+        x=ioSelf.__coordonnees_points[:,0] # Longitudes
+        y=ioSelf.__coordonnees_points[:,1] # Latitudes
+        z=ioSelf.__coordonnees_points[:,2] # Altitudes
+        
+        # Taille de la grille raster en nombre de lignes et colonnes
+        nbCol=ioSelf.__longitudes_croisements.shape[1] # nombre de colonnes
+        nbLignes=ioSelf.__latitudes_croisements.shape[0] # nombre de lignes
+
+        # Interpolation des altitudes
+        grilleInterpolee= griddata((x,y),z,(ioSelf.__longitudes_croisements,ioSelf.__latitudes_croisements),method=inMethod) # création d'un tableau des altitudes interpolées
+        
+        # Redisposition du tableau des altitudes interpolées qui est créé à l'envers 
+        # la 1ère ligne est écrite à la position de la dernière ligne
+        ioSelf.__altitudes_interpolees=sp.empty((nbLignes,nbCol)) # création d'un tableau scipy vide de même taille que la grille 
+                                                              # interpolée et comme attribut de la classe Relief
+        # Boucle qui parcours le tableau de la grille interpolée et réécrit dans le tableau vide créé 
+        # les lignes dans leur vraie position (nbignes-1-numligne) #-1 parce que le indices du tableau commençent par 0
+        for numLigne in range(nbLignes):
+                ioSelf.__altitudes_interpolees[numLigne,:]=grilleInterpolee[nbLignes-1-numLigne,:]                                                                          
+        
+        # =============================================================================
+        #         Création du fichier physique de la grille raster interpolée 
+        #                avec le format sélectionné (inFormat)
+        # =============================================================================
+        
+        # Récupération du dossier dans lequel se trouve le fichier python pour y stocker le fichier physique
+        dossierCourant=os.getcwd()
+        
+        # Instructions conditionnelles selon le format (inFormat) choisi
+        
+        # Instructions pour le format GeoTiff
+        if inFormat=='GeoTiff':
+            # Définition du nom du fichier GeoTiff à écrire
+            nomSortieFichier=os.path.join(dossierCourant,ioSelf.__nom+'.tif') # Le fichier a le même nom que celui donné à la classe Relief
+            # Appel à la bibliothèque Gdal pour l'écriture du fichier GeoTiff
+            # 1- Appel au Driver GeoTiff de la bibliothèque Gdal
+            driver=gdal.GetDriverByName("GTiff") 
+            # 2- Récupération du type de donnees du tableau réécrit des altitudes interpolées
+            typeDonneesGrille=gdal_array.NumericTypeCodeToGDALTypeCode(ioSelf.__altitudes_interpolees.dtype)  
+            # 3- Création de la nouvelle couche GeoTiff avec ses attributs (nom, nbCol, nbLignes, nombre de bandes (1) et type de données)
+            dataset=driver.Create(nomSortieFichier,nbCol,nbLignes,1,typeDonneesGrille) 
+            # 4- Ajout des informations de transformation géométrique (longitude et Latitude du point Haut Gauche, largeur du pixel orienté E-O et N-S, Paramètres de rotation (0))
+            dataset.SetGeoTransform((min(x),ioSelf.__taille_pixel,0,max(y),0,-ioSelf.__taille_pixel)) 
+            # 5- Ajout des informations de projection
+            # Appel à la bibliothèque osr pour récupérer un SRS définie en l'ocurrence le système WGS84
+            wgs84=osr.SpatialReference() 
+            wgs84.SetWellKnownGeogCS("WGS84")
+            dataset.SetProjection(wgs84.ExportToWkt())
+            # 6- Ecriture des altitudes inteprolées dans le fichier GeoTiff créé
+            dataset.GetRasterBand(1).WriteArray(ioSelf.__altitudes_interpolees)
+            # 7- Fermeture du fichier
+            dataset=None
+        
+        # Instructions pour le format ASCII
+        elif inFormat=='ASCII' :
+            # Définition du nom du fichier GeoTiff à écrire
+            nomSortie=os.path.join(dossierCourant,ioSelf.__nom+'.asc') # Le fichier a le même nom que celui donné à la classe Relief
+            # 1- Création du fichier en ériture avec une extenion .asc
+            fichASC = open(nomSortie, "w")
+            # 2- Définition de l'entête du fichier ASCII
+            # Basé sur le type de format ASCII lu par ArcGIS (http://resources.esri.com/help/9.3/arcgisdesktop/com/gp_toolref/spatial_analyst_tools/esri_ascii_raster_format.htm) 
+            ASC_ENTETE = 'ncols %s \n' %nbCol \
+                        +'nrows %s \n' %nbLignes \
+                        +'xllcorner %s \n' %min(x) \
+                        +'yllcorner %s \n' %min(y) \
+                        +'cellsize %s \n' %ioSelf.__taille_pixel
+                        
+            # 3- Ecriture de l'entête dans le fichier
+            fichASC.write(ASC_ENTETE)
+           
+            # 4- Ecriture du corps du fichier ASCII
+            # Altitudes interpolées séparées par un espace et disposées ligne par ligne
+            for numLigne in range(nbLignes): # Parcours des lignes du tableau des altitudes interpolées
+                for numCol in range(nbCol): # Parcours des colonnes du tableau des altitudes interpolées
+                    valeurAltitude=ioSelf.__altitudes_interpolees[numLigne,numCol] # Récupération de la valeur d'altitude pour une ligne et une colonne donnée
+                    # Ecriture de la valeur d'altitude avec un espace dans le fichier ASCII jusqu'à la dernière colonne de la ligne
+                    if numCol < nbLignes-1 :
+                        fichASC.write(str(valeurAltitude)+" ")
+                    # Ecriture de la valeur d'altitude dans le fichier ASCII avec un espace et un saut de ligne s'il s'agit de la 
+                    # dernière colonne de la ligne
+                    elif numCol == nbLignes-1 :
+                        fichASC.write(str(valeurAltitude)+" ")
+                        fichASC.write("\n")
+            # 5- Fermeture du fichier ASCII
+            fichASC.close()
+        
+    def afficher_relief(inSelf,inSave=True):
+        """
+        PROCEDURE permettant d'afficher en 2D et 3D avec la bibliothèque Matplotlib la grille raster résultante de l'interpolation 
+        des altitudes des points stockés dans l'atrribut __coordonnees_points. 
+        
+        ENTREE 
+            inSave : Variable booléenne. Si sa valeur est True (par défaut) les affichages 2D et 3D de la grille raster sont 
+                     sauvegardées en fichiers physiques au format JPEG à la racine de ce fichier.
+        """
+        
+        # Récupération de listes longitudes (indice 0), latitudes (indice 1) et altitudes requises pour les tracés avec Matplotlib
+        x=inSelf.__coordonnees_points[:,0] # Longitudes
+        y=inSelf.__coordonnees_points[:,1] # Latitudes
+        z=inSelf.__coordonnees_points[:,2] # Altitudes
+        
+        # =============================================================================
+        #         Affichage 2D & 3D
+        # =============================================================================
+        
+        # Définition d'une liste de 11 palettes de couleur de Matplotlib 
+        # pour le choix de la palette de couleur à attribuer aux affichages 2D et 3D
+        lstPalettes=["viridis","gray","magma","BuPu","inferno","GnBu","plasma","winter","RdYlGn","Spectral","cool"]
+        numPalette=random.randint(0,10) # Ce numéro aléatoire compris entre 0 et 10 va permettre de changer la palette de couleur 
+                                        # à chaque exécution de cette méthode (afficher_relief)
+        
+        # Changement de la police par défaut (et de sa Taille) des figures avec Maptplotlib
+        plt.rcParams["font.family"] = "Arial"
+        plt.rcParams["font.size"] = 12
+        
+        # Création d'une nouvelle figure
+        fig=plt.figure() 
+        
+        # Affichage 2D
+        plt.subplot(121) # Création d'une grille de 1 ligne et 2 colonnes; l'affichage 2D sera représentée à la 1ère colonne
+        plt.xlabel('Longitudes',fontweight='bold',labelpad=10,fontsize=10) # Personnalisation de l'axe des X (longitudes)     
+        plt.ylabel('Latitudes',fontweight='bold',labelpad=10,fontsize=10)  # Personnalisation de l'axe des Y (latitudes)
+        plt.title('Affichage 2D de %s'%inSelf.__nom,fontweight='bold',fontsize=10) # Titre du tracé
+        plt.xlim(min(x),max(x)) # Définition des limites horizontales du tracé (axe X)
+        plt.ylim(min(y),max(y)) # Définition des limites verticales du tracé (axe Y)
+        plt.plot(x,y,'k.',markersize=0.8) # Tracé des points de coordonnées (x,y) marqués en noir avec une taille de 0,8
+        # Ajout de la grille des altitudes interpolées au tracé des points
+        plt.imshow(inSelf.__altitudes_interpolees,extent=(min(x),max(x),min(y),max(y)),cmap=lstPalettes[numPalette])
+        plt.colorbar() # Affichage de la palette de couleur utilisée
+        
+        # Affichage 3D
+        affichage3D = fig.add_subplot(122, projection='3d') # laffichage 3D sera représentée à la 2ème colonne de la grille créée
         affichage3D.set_title('Affichage 3D de %s'%inSelf.__nom,fontweight='bold',fontsize=10) # Titre du tracé
         affichage3D.set_xlabel('Longitudes',fontweight='bold',labelpad=10,fontsize=10) # Personnalisation de l'axe des X (longitudes)
         affichage3D.set_ylabel('Latitudes',fontweight='bold',labelpad=10,fontsize=10) # Personnalisation de l'axe des Y (latitudes)
@@ -638,7 +1819,1523 @@ class Relief(object):
             # 3- Sauvegarde des affichages en fichier image
             plt.savefig(nomFigure,dpi=300)
 
+class CacheTraces(object):
+    """
+    ROLE : Cache disque des tableaux de coordonnées (longitudes, latitudes, altitudes) lus dans des fichiers GPX.
+           Chaque fichier GPX a une entrée au format numpy compressé (.npz) dans le dossier du cache, nommée d'après 
+           son chemin et valable tant que sa taille, sa date de modification ou à défaut son empreinte (contenu) 
+           sont inchangées. Au-delà de la taille maximale, les entrées utilisées le moins récemment sont supprimées.
+    ATTRIBUTS :
+        __dossier : str
+        __taille_maxi : int (octets)
+    SERVICES :
+        __init__(outSelf,inDossierCache,inTailleMaxi=512*1024*1024)
+        __str__(inSelf) : str
+        __repr__(inSelf) : str
+        lire(inSelf,inFichierGPX) : numpy array ou None
+        ecrire(ioSelf,inFichierGPX,inCoordonnees,inEmpreinte=None)
+        evincer(ioSelf)
+        taille(inSelf) : int
+    """
+    VERSION = 1 # version du format des entrées : une entrée d'une autre version est ignorée
+    
+    def __init__(outSelf,inDossierCache,inTailleMaxi=512*1024*1024):
+        """
+        Initialisation de la classe CacheTraces
+        ENTREES :
+            inDossierCache : str # Chemin du dossier du cache (créé s'il n'existe pas), par exemple à côté du dossier GPX
+            inTailleMaxi : int # Taille maximale du cache en octets (par défaut 512 Mo)
+        """
+        object.__init__(outSelf)
+        outSelf.__dossier=str(inDossierCache)
+        outSelf.__taille_maxi=int(inTailleMaxi)
+        if not os.path.isdir(outSelf.__dossier):
+            os.makedirs(outSelf.__dossier)
+    
+    def __str__(inSelf): # return str
+        """
+        Chaîne d'affichage standard de la classe CacheTraces
+        """
+        return "Cache : " + inSelf.__dossier
+    
+    def __repr__(inSelf): # return str
+        """
+        Chaîne d'affichage de débogage
+        """
+        return str(inSelf.__dict__)
+    
+    def __entree(inSelf,inFichierGPX): # return str
+        """
+        Retourne le chemin de l'entrée du cache correspondant au fichier GPX (nommée d'après son chemin absolu)
+        """
+        cle=hashlib.sha1(os.path.abspath(inFichierGPX).encode('utf-8')).hexdigest()
+        return os.path.join(inSelf.__dossier,cle+'.npz')
+    
+    def lire(inSelf,inFichierGPX): # return numpy array
+        """
+        Retourne le tableau des coordonnées du fichier GPX s'il est en cache et à jour, None sinon
+        ENTREE : 
+            inFichierGPX : str # Chemin d'accès au fichier GPX
+        """
+        entree=inSelf.__entree(inFichierGPX)
+        if not os.path.isfile(entree):
+            return None
+        try:
+            with np.load(entree) as contenu:
+                version,taille,dateModif=(int(valeur) for valeur in contenu['entete'])
+                empreinte=str(contenu['empreinte'])
+                coordonnees=contenu['coordonnees']
+        except (OSError,ValueError,KeyError):
+            return None # entrée illisible : le fichier sera relu
+        if version!=CacheTraces.VERSION:
+            return None
+        etat=_etat_fichier(inFichierGPX)
+        if (taille,dateModif)!=etat:
+            # Fichier touché : l'entrée reste valable si son contenu n'a pas changé
+            if taille!=etat[0] or _empreinte_fichier(inFichierGPX)!=empreinte:
+                return None
+            inSelf.ecrire(inFichierGPX,coordonnees,empreinte)
+        os.utime(entree,None) # date d'utilisation de l'entrée, pour l'éviction des moins récemment utilisées
+        return coordonnees
+    
+    def ecrire(ioSelf,inFichierGPX,inCoordonnees,inEmpreinte=None):
+        """
+        PROCEDURE mettant en cache le tableau des coordonnées lu dans le fichier GPX. 
+        La taille du cache n'est pas contrôlée ici : appeler evincer après une série d'écritures
+        ENTREES :
+            inFichierGPX : str # Chemin d'accès au fichier GPX
+            inCoordonnees : numpy array # Tableau (n lignes, 3 colonnes) des coordonnées de ses points
+            inEmpreinte : str # Empreinte du contenu du fichier si elle est déjà connue
+        """
+        etat=_etat_fichier(inFichierGPX)
+        if inEmpreinte is None:
+            inEmpreinte=_empreinte_fichier(inFichierGPX)
+        # Ecriture dans un fichier temporaire puis renommage : une entrée n'est jamais lue à moitié écrite
+        descripteur,temporaire=tempfile.mkstemp(suffix='.tmp',dir=ioSelf.__dossier)
+        with os.fdopen(descripteur,'wb') as fichier:
+            np.savez_compressed(fichier,coordonnees=inCoordonnees,empreinte=np.array(inEmpreinte),
+                                entete=np.array((CacheTraces.VERSION,)+etat,dtype=np.int64))
+        os.replace(temporaire,ioSelf.__entree(inFichierGPX))
+    
+    def taille(inSelf): # return int
+        """
+        Retourne la taille occupée par les entrées du cache en octets
+        """
+        return sum(os.path.getsize(entree) for entree in glob.glob(os.path.join(inSelf.__dossier,'*.npz')))
+    
+    def evincer(ioSelf):
+        """
+        PROCEDURE supprimant les entrées utilisées le moins récemment tant que le cache dépasse sa taille maximale
+        """
+        lstEntrees=[(os.path.getmtime(entree),os.path.getsize(entree),entree) 
+                    for entree in glob.glob(os.path.join(ioSelf.__dossier,'*.npz'))]
+        taille=sum(tailleEntree for _,tailleEntree,_ in lstEntrees)
+        for _,tailleEntree,entree in sorted(lstEntrees):
+            if taille<=ioSelf.__taille_maxi:
+                break
+            os.remove(entree)
+            taille-=tailleEntree
+
+class Catalogue(object):
+    """
+    ROLE : Index local (base SQLite) des métadonnées des fichiers GPX d'une archive (dossier et sous-dossiers) : 
+           emprise (longitudes et latitudes mini et maxi), nombre de points, période de relevé, type d'activité et 
+           empreinte du contenu. Permet de retrouver les fichiers pouvant contribuer à une zone ou à une période 
+           sans les ouvrir (voir Relief.lire_catalogue).
+    ATTRIBUTS :
+        __fichier : str (chemin de la base SQLite)
+        __connexion : sqlite3.Connection
+    SERVICES :
+        __init__(outSelf,inFichierCatalogue)
+        __str__(inSelf) : str
+        __repr__(inSelf) : str
+        indexer(ioSelf,inDossierRacine,inNbProcessus=1,inIgnorerCasse=False) : dict
+        rechercher(inSelf,inEmprise=None,inFenetreTemps=None,inActivite=None) : list
+        fiche(inSelf,inFichierGPX) : dict ou None
+        peut_contribuer(inSelf,inFichierGPX,inEmprise=None,inFenetreTemps=None) : bool
+        nbre_fichiers(inSelf) : int
+        fermer(ioSelf)
+    """
+    COLONNES = ('chemin','taille','date_modif','empreinte','nbre_points','lon_min','lat_min','lon_max','lat_max',
+                'debut','fin','activite') # colonnes de la table des fichiers
+    
+    def __init__(outSelf,inFichierCatalogue):
+        """
+        Initialisation de la classe Catalogue
+        ENTREE :
+            inFichierCatalogue : str # Chemin de la base SQLite (créée si elle n'existe pas)
+        """
+        object.__init__(outSelf)
+        outSelf.__fichier=str(inFichierCatalogue)
+        outSelf.__connexion=sqlite3.connect(outSelf.__fichier)
+        with outSelf.__connexion:
+            outSelf.__connexion.execute('CREATE TABLE IF NOT EXISTS fichiers (chemin TEXT PRIMARY KEY, taille INTEGER, '
+                                        'date_modif INTEGER, empreinte TEXT, nbre_points INTEGER, lon_min REAL, '
+                                        'lat_min REAL, lon_max REAL, lat_max REAL, debut REAL, fin REAL, activite TEXT)')
+            outSelf.__connexion.execute('CREATE INDEX IF NOT EXISTS fichiers_emprise '
+                                        'ON fichiers (lon_min, lon_max, lat_min, lat_max)')
+            outSelf.__connexion.execute('CREATE INDEX IF NOT EXISTS fichiers_periode ON fichiers (debut, fin)')
+    
+    def __str__(inSelf): # return str
+        """
+        Chaîne d'affichage standard de la classe Catalogue
+        """
+        return "Catalogue : " + inSelf.__fichier
+    
+    def __repr__(inSelf): # return str
+        """
+        Chaîne d'affichage de débogage
+        """
+        return str(inSelf.__dict__)
+    
+    def indexer(ioSelf,inDossierRacine,inNbProcessus=1,inIgnorerCasse=False): # return dict
+        """
+        PROCEDURE (et FONCTION) mettant à jour le catalogue d'après les fichiers GPX d'un dossier et de tous ses 
+        sous-dossiers (fichiers compressés et archives zip compris, voir _lister_fichiers_GPX) : seuls les fichiers nouveaux ou dont la taille ou la date de modification ont changé sont lus 
+        (fonction _decrire_fichier_GPX), et les fichiers disparus du dossier sont retirés du catalogue.
+        Retourne le dictionnaire des listes de fichiers 'ajoutes', 'modifies' et 'supprimes'.
+        ENTREES :
+            inDossierRacine : str # Chemin du dossier racine de l'archive GPX
+            inNbProcessus : int # Nombre de processus de lecture (None : autant que de processeurs)
+            inIgnorerCasse : bool # si True, les noms en majuscules (nom.GPX) sont aussi indexés. Par défaut False, 
+                             comme Relief.lire_dossier_GPX : un même dossier donne les mêmes fichiers
+        """
+        # Parcours récursif du dossier : chemins absolus des fichiers GPX, triés
+        racine=os.path.abspath(inDossierRacine)
+        lstFichiers=_lister_fichiers_GPX(racine,inRecursif=True,inIgnorerCasse=inIgnorerCasse)
+        
+        # Comparaison avec les fiches du catalogue situées sous ce dossier
+        dicoConnus={chemin:(taille,dateModif) for chemin,taille,dateModif in ioSelf.__connexion.execute(
+            'SELECT chemin, taille, date_modif FROM fichiers') if chemin.startswith(os.path.join(racine,''))}
+        ensFichiers=set(lstFichiers)
+        dicoChangements={'ajoutes':[],'modifies':[],
+                         'supprimes':sorted(chemin for chemin in dicoConnus if chemin not in ensFichiers)}
+        for fichier in lstFichiers:
+            if fichier not in dicoConnus:
+                dicoChangements['ajoutes'].append(fichier)
+            elif dicoConnus[fichier]!=_etat_fichier(fichier):
+                dicoChangements['modifies'].append(fichier)
+        
+        # Lecture des seuls fichiers ajoutés ou modifiés (éventuellement en parallèle)
+        lstALire=sorted(dicoChangements['ajoutes']+dicoChangements['modifies'])
+        if inNbProcessus==1 or len(lstALire)<2:
+            lstFiches=[_decrire_fichier_GPX(fichier) for fichier in lstALire]
+        else:
+            with ProcessPoolExecutor(max_workers=inNbProcessus) as executeur:
+                lstFiches=list(executeur.map(_decrire_fichier_GPX,lstALire))
+        
+        # Mise à jour du catalogue en une seule transaction
+        requete='INSERT OR REPLACE INTO fichiers VALUES ('+', '.join('?'*len(Catalogue.COLONNES))+')'
+        with ioSelf.__connexion:
+            ioSelf.__connexion.executemany('DELETE FROM fichiers WHERE chemin = ?',
+                                           [(chemin,) for chemin in dicoChangements['supprimes']])
+            ioSelf.__connexion.executemany(requete,[(fichier,)+tuple(dicoFiche[colonne] for colonne in Catalogue.COLONNES[1:])
+                                                    for fichier,dicoFiche in zip(lstALire,lstFiches)])
+        return dicoChangements
+    
+    def rechercher(inSelf,inEmprise=None,inFenetreTemps=None,inActivite=None): # return list
+        """
+        FONCTION retournant la liste triée des chemins des fichiers du catalogue pouvant contribuer à une zone et/ou 
+        une période : fichiers dont l'emprise intersecte la zone et dont la période de relevé recoupe la fenêtre de 
+        temps. Un fichier sans point (ou sans heure, si une fenêtre de temps est donnée) n'est jamais retenu.
+        ENTREES :
+            inEmprise : tuple (lonMin, latMin, lonMax, latMax) # Zone recherchée en degrés (None : pas de filtre)
+            inFenetreTemps : tuple (debut, fin) # Période recherchée en secondes depuis le 01/01/1970 UTC ; 
+                             une borne None n'est pas filtrée (None : pas de filtre)
+            inActivite : str # Type d'activité recherché, par exemple 'hiking' (None : pas de filtre)
+        """
+        lstConditions,lstValeurs=['nbre_points > 0'],[]
+        if inEmprise is not None:
+            lonMin,latMin,lonMax,latMax=inEmprise
+            lstConditions.append('lon_max >= ? AND lon_min <= ? AND lat_max >= ? AND lat_min <= ?')
+            lstValeurs.extend((lonMin,lonMax,latMin,latMax))
+        if inFenetreTemps is not None:
+            debut,fin=inFenetreTemps
+            lstConditions.append('debut IS NOT NULL')
+            if debut is not None:
+                lstConditions.append('fin >= ?')
+                lstValeurs.append(debut)
+            if fin is not None:
+                lstConditions.append('debut <= ?')
+                lstValeurs.append(fin)
+        if inActivite is not None:
+            lstConditions.append('activite = ?')
+            lstValeurs.append(inActivite)
+        requete='SELECT chemin FROM fichiers WHERE '+' AND '.join(lstConditions)+' ORDER BY chemin'
+        return [chemin for chemin, in inSelf.__connexion.execute(requete,lstValeurs)]
+    
+    def fiche(inSelf,inFichierGPX): # return dict
+        """
+        Retourne la fiche (dictionnaire colonne => valeur) d'un fichier GPX du catalogue, None s'il n'y est pas
+        ENTREE : 
+            inFichierGPX : str # Chemin d'accès au fichier GPX
+        """
+        ligne=inSelf.__connexion.execute('SELECT * FROM fichiers WHERE chemin = ?',
+                                         (os.path.abspath(inFichierGPX),)).fetchone()
+        return None if ligne is None else dict(zip(Catalogue.COLONNES,ligne))
+    
+    def peut_contribuer(inSelf,inFichierGPX,inEmprise=None,inFenetreTemps=None): # return bool
+        """
+        FONCTION indiquant si un fichier GPX peut avoir des points dans une zone et/ou une période (voir rechercher). 
+        Retourne True si le fichier est absent du catalogue ou si sa fiche n'est plus à jour : il faut alors le lire
+        ENTREES : 
+            inFichierGPX : str # Chemin d'accès au fichier GPX
+            inEmprise, inFenetreTemps : voir rechercher
+        """
+        dicoFiche=inSelf.fiche(inFichierGPX)
+        if dicoFiche is None or (dicoFiche['taille'],dicoFiche['date_modif'])!=_etat_fichier(inFichierGPX):
+            return True
+        if dicoFiche['nbre_points']==0:
+            return False
+        if inEmprise is not None and _hors_emprise([dicoFiche[colonne] for colonne in ('lon_min','lat_min','lon_max','lat_max')],
+                                                   inEmprise):
+            return False
+        if inFenetreTemps is not None and (dicoFiche['debut'] is None or 
+                                           _hors_fenetre_temps(dicoFiche['debut'],dicoFiche['fin'],inFenetreTemps)):
+            return False
+        return True
+    
+    def nbre_fichiers(inSelf): # return int
+        """
+        Retourne le nombre de fichiers GPX du catalogue
+        """
+        return inSelf.__connexion.execute('SELECT COUNT(*) FROM fichiers').fetchone()[0]
+    
+    def fermer(ioSelf):
+        """
+        PROCEDURE fermant la connexion à la base SQLite du catalogue
+        """
+        ioSelf.__connexion.close()
+
+class TracesBinaires(object):
+    """
+    ROLE : Conteneur binaire de traces, converties depuis des fichiers GPX (une trace par fichier) pour ne plus avoir 
+           à analyser le XML. Le fichier est projeté en mémoire (mmap) : ses colonnes sont des vues numpy, sans recopie, 
+           et seules les pages utilisées sont lues sur le disque. Structure du fichier (little-endian) :
+             - en-tête (ENTETE) : signature, version, nombre de traces, nombre de points, nombre de points sans altitude,
+               nombre de points de route, emprise (longitudes et latitudes mini et maxi), période (instants de début 
+               et de fin en secondes depuis le 01/01/1970 UTC) et taille du bloc des noms
+             - rangs des premiers points des traces, suivis du nombre de points (uint64)
+             - colonnes des longitudes, latitudes, élévations (float64, NaN si absente), temps (int64, millisecondes 
+               depuis le 01/01/1970 UTC, TEMPS_ABSENT si absent), natures (int8), rangs des traces et des tronçons 
+               (int32, voir Segment.types) de tous les points, trace après trace. Chaque colonne est complétée par des 
+               zéros jusqu'à un multiple de 8 octets
+             - noms des traces (UTF-8, séparés par des retours à la ligne)
+    ATTRIBUTS :
+        __fichier : str
+        __projection : mmap.mmap (projection privée : une modification des colonnes n'atteint pas le fichier ; None après close)
+        __entete : dict
+        __rangs : numpy array
+        __colonnes : tuple de numpy array
+        __types : tuple de numpy array
+        __noms : list de str
+    SERVICES :
+        __init__(outSelf,inFichierBinaire)
+        __str__(inSelf) : str
+        __repr__(inSelf) : str
+        convertir_GPX(inClasse,inFichiersGPX,inFichierBinaire,inNbProcessus=1) : TracesBinaires
+        nbre_traces(inSelf) : int
+        nbre_points(inSelf) : int
+        noms(inSelf) : list
+        emprise(inSelf) : tuple ou None
+        periode(inSelf) : tuple ou None
+        colonnes(inSelf,inRang=None) : tuple de numpy array
+        types(inSelf,inRang=None) : tuple de numpy array
+        segment(inSelf,inRang) : SegmentColonnaire
+        coordonnees(inSelf,inEmprise=None,inFenetreTemps=None) : numpy array
+        close(ioSelf)
+        __enter__(inSelf) : TracesBinaires
+        __exit__(ioSelf,*inExceptions)
+    """
+    SIGNATURE = b'PYGPXREL'
+    VERSION = 2 # version du format : un fichier d'une autre version est refusé
+    ENTETE = struct.Struct('<8sIIQQQ6dQ') # signature, version, traces, points, points sans altitude, points de route, emprise, période, noms
+    TYPES = ('<f8','<f8','<f8','<i8','<i1','<i4','<i4') # types des colonnes : longitudes, latitudes, élévations, temps, natures, traces, tronçons
+    
+    def __init__(outSelf,inFichierBinaire):
+        """
+        Initialisation de la classe TracesBinaires : projection en mémoire d'un fichier de traces binaires, 
+        libérée par close (ou en fin de bloc with : with TracesBinaires(fichier) as traces: ...)
+        ENTREE :
+            inFichierBinaire : str # Chemin du fichier (voir convertir_GPX pour le créer)
+        """
+        object.__init__(outSelf)
+        outSelf.__fichier=str(inFichierBinaire)
+        with open(outSelf.__fichier,'rb') as fichier:
+            outSelf.__projection=mmap.mmap(fichier.fileno(),0,access=mmap.ACCESS_COPY)
+        projection=outSelf.__projection
+        if len(projection)<TracesBinaires.ENTETE.size:
+            outSelf.close()
+            raise ValueError(outSelf.__fichier+" : fichier de traces binaires invalide")
+        (signature,version,nbreTraces,nbrePoints,nbreSansAltitude,nbreRoutes,lonMin,latMin,lonMax,latMax,
+         debut,fin,tailleNoms)=TracesBinaires.ENTETE.unpack_from(projection,0)
+        if signature!=TracesBinaires.SIGNATURE or version!=TracesBinaires.VERSION:
+            outSelf.close()
+            raise ValueError(outSelf.__fichier+" : fichier de traces binaires invalide ou d'une autre version")
+        outSelf.__entete={'nbre_traces':nbreTraces,'nbre_points':nbrePoints,'nbre_sans_altitude':nbreSansAltitude,
+                          'nbre_routes':nbreRoutes,'emprise':(lonMin,latMin,lonMax,latMax),'periode':(debut,fin)}
+        
+        # Vues numpy sur les blocs du fichier projeté
+        outSelf.__rangs=np.frombuffer(projection,dtype='<u8',count=nbreTraces+1,offset=TracesBinaires.ENTETE.size)
+        debutBloc=TracesBinaires.ENTETE.size+outSelf.__rangs.nbytes
+        lstColonnes=[]
+        for typeColonne in TracesBinaires.TYPES:
+            lstColonnes.append(np.frombuffer(projection,dtype=typeColonne,count=nbrePoints,offset=debutBloc))
+            debutBloc+=_taille_bloc(nbrePoints,typeColonne)
+        outSelf.__colonnes=tuple(lstColonnes[:4])
+        outSelf.__types=tuple(lstColonnes[4:])
+        debutNoms=debutBloc
+        outSelf.__noms=projection[debutNoms:debutNoms+tailleNoms].decode('utf-8').split('\n') if nbreTraces else []
+    
+    def __str__(inSelf): # return str
+        """
+        Chaîne d'affichage standard de la classe TracesBinaires
+        """
+        return "Traces binaires : " + inSelf.__fichier
+    
+    def __repr__(inSelf): # return str
+        """
+        Chaîne d'affichage de débogage
+        """
+        return str(inSelf.__entete)
+    
+    def __enter__(inSelf): # return TracesBinaires
+        """
+        Entrée d'un bloc with : retourne l'objet lui-même
+        """
+        return inSelf
+    
+    def __exit__(ioSelf,*inExceptions):
+        """
+        Sortie d'un bloc with : libération de la projection (voir close)
+        """
+        ioSelf.close()
+    
+    def close(ioSelf):
+        """
+        PROCEDURE libérant la projection en mémoire du fichier et son descripteur (nécessaire sous Windows pour 
+        remplacer le fichier). Les colonnes, segments et coordonnées déjà obtenus sans recopie restent utilisables : 
+        la projection n'est alors libérée qu'avec la dernière de ces vues. Les colonnes ne sont plus accessibles 
+        par l'objet après close ; un second appel est sans effet
+        """
+        projection=ioSelf.__dict__.get('_TracesBinaires__projection')
+        if projection is None:
+            return
+        ioSelf.__projection=None
+        ioSelf.__rangs=ioSelf.__colonnes=ioSelf.__types=None # vues de l'objet sur la projection
+        try:
+            projection.close()
+        except BufferError: # des vues renvoyées à l'appelant gardent la projection jusqu'à leur libération
+            pass
+    
+    def __verifier_ouverture(inSelf):
+        """
+        PROCEDURE levant ValueError si la projection a été libérée (voir close)
+        """
+        if inSelf.__projection is None:
+            raise ValueError(inSelf.__fichier+" : traces binaires fermées")
+    
+    @classmethod
+    def convertir_GPX(inClasse,inFichiersGPX,inFichierBinaire,inNbProcessus=1): # return TracesBinaires
+        """
+        FONCTION (méthode de classe) convertissant des fichiers GPX en un fichier de traces binaires, une trace par 
+        fichier GPX (lecture au fil de l'eau, fonction _lire_colonnes_GPX), et retournant l'objet TracesBinaires 
+        correspondant (à libérer par close, ou dans un bloc with). Le fichier est écrit trace après trace : la mémoire 
+        consommée ne dépend pas du nombre de traces.
+        ENTREES :
+            inFichiersGPX : liste de str # Chemins des fichiers GPX, ou chemin d'un dossier (voir _lister_fichiers_GPX)
+            inFichierBinaire : str # Chemin du fichier de traces binaires à créer (remplacé s'il existe : sous Windows, 
+                                   # les objets TracesBinaires ouverts sur ce fichier doivent d'abord être fermés)
+            inNbProcessus : int # Nombre de processus de lecture (None : autant que de processeurs)
+        """
+        if isinstance(inFichiersGPX,str):
+            inFichiersGPX=_lister_fichiers_GPX(inFichiersGPX)
+        lstFichiers=list(inFichiersGPX)
+        lstNoms=[os.path.basename(fichier) for fichier in lstFichiers]
+        if inNbProcessus==1 or len(lstFichiers)<2:
+            _ecrire_traces_binaires(inFichierBinaire,lstNoms,map(_lire_colonnes_GPX,lstFichiers,repeat(None),
+                                                                 repeat(None),repeat(True)))
+        else:
+            with ProcessPoolExecutor(max_workers=inNbProcessus) as executeur:
+                _ecrire_traces_binaires(inFichierBinaire,lstNoms,executeur.map(_lire_colonnes_GPX,lstFichiers,repeat(None),
+                                                                               repeat(None),repeat(True)))
+        return inClasse(inFichierBinaire)
+    
+    def nbre_traces(inSelf): # return int
+        """
+        Retourne le nombre de traces du fichier
+        """
+        return inSelf.__entete['nbre_traces']
+    
+    def nbre_points(inSelf): # return int
+        """
+        Retourne le nombre total de points du fichier
+        """
+        return inSelf.__entete['nbre_points']
+    
+    def noms(inSelf): # return list
+        """
+        Retourne la liste des noms des traces (noms des fichiers GPX d'origine)
+        """
+        return list(inSelf.__noms)
+    
+    def emprise(inSelf): # return tuple
+        """
+        Retourne l'emprise (lonMin, latMin, lonMax, latMax) des points du fichier, None s'il n'a aucun point
+        """
+        return inSelf.__entete['emprise'] if inSelf.__entete['nbre_points'] else None
+    
+    def periode(inSelf): # return tuple
+        """
+        Retourne la période de relevé (debut, fin) en secondes depuis le 01/01/1970 UTC, None si aucun point n'a d'heure
+        """
+        debut,fin=inSelf.__entete['periode']
+        return None if np.isnan(debut) else (debut,fin)
+    
+    def colonnes(inSelf,inRang=None): # return tuple de numpy array
+        """
+        Retourne les colonnes (longitudes, latitudes, élévations, temps) de la trace de rang inRang, ou de tous les 
+        points si inRang vaut None : vues sur le fichier projeté, sans recopie
+        """
+        inSelf.__verifier_ouverture()
+        if inRang is None:
+            return inSelf.__colonnes
+        rang=range(inSelf.__entete['nbre_traces'])[inRang] # IndexError si le rang est hors du fichier
+        debut,fin=int(inSelf.__rangs[rang]),int(inSelf.__rangs[rang+1])
+        return tuple(colonne[debut:fin] for colonne in inSelf.__colonnes)
+    
+    def types(inSelf,inRang=None): # return tuple de numpy array
+        """
+        Retourne les colonnes des types (natures, traces, tronçons, voir Segment.types) de la trace de rang inRang, 
+        ou de tous les points si inRang vaut None : vues sur le fichier projeté, sans recopie
+        """
+        inSelf.__verifier_ouverture()
+        if inRang is None:
+            return inSelf.__types
+        rang=range(inSelf.__entete['nbre_traces'])[inRang]
+        debut,fin=int(inSelf.__rangs[rang]),int(inSelf.__rangs[rang+1])
+        return tuple(colonne[debut:fin] for colonne in inSelf.__types)
+    
+    def segment(inSelf,inRang): # return SegmentColonnaire
+        """
+        Retourne la trace de rang inRang sous forme de SegmentColonnaire dont les colonnes sont des vues sur le 
+        fichier projeté (sans recopie tant que le segment n'est pas agrandi)
+        """
+        rang=range(inSelf.__entete['nbre_traces'])[inRang]
+        objetSegment=SegmentColonnaire(inSelf.__noms[rang])
+        objetSegment.extend_colonnes(*(inSelf.colonnes(rang)+inSelf.types(rang)))
+        return objetSegment
+    
+    def coordonnees(inSelf,inEmprise=None,inFenetreTemps=None): # return numpy array
+        """
+        Retourne le tableau (n lignes, 3 colonnes : longitudes, latitudes, altitudes) des points de trace et waypoints 
+        ayant une altitude, comme Relief.lire_dossier_GPX. Si tous les points sont retenus, c'est une vue sur les trois 
+        premières colonnes consécutives du fichier (pas entre colonnes = taille d'une colonne), sans recopie
+        ENTREES :
+            inEmprise : tuple (lonMin, latMin, lonMax, latMax) # si fourni, seuls les points de cette zone sont retenus
+            inFenetreTemps : tuple (debut, fin) # si fourni, seuls les points relevés dans cette période (secondes depuis 
+                             le 01/01/1970 UTC) sont retenus
+            Si l'emprise ou la période de l'en-tête ne les recoupent pas, les colonnes ne sont pas lues
+        """
+        inSelf.__verifier_ouverture()
+        nbrePoints=inSelf.__entete['nbre_points']
+        if (nbrePoints==0 or (inEmprise is not None and _hors_emprise(inSelf.__entete['emprise'],inEmprise)) or 
+                (inFenetreTemps is not None and (inSelf.periode() is None or 
+                                                 _hors_fenetre_temps(*inSelf.periode(),inFenetreTemps)))):
+            return np.empty((0,3))
+        longitudes,latitudes,elevations,temps=inSelf.__colonnes
+        if (inSelf.__entete['nbre_sans_altitude']==0 and inSelf.__entete['nbre_routes']==0 and 
+                inEmprise is None and inFenetreTemps is None):
+            return np.lib.stride_tricks.as_strided(longitudes,shape=(nbrePoints,3),strides=(8,8*nbrePoints),
+                                                   writeable=False)
+        renseignes=~np.isnan(elevations)
+        if inSelf.__entete['nbre_routes']:
+            renseignes&=np.isin(inSelf.__types[0],NATURES_RELIEF)
+        if inEmprise is not None:
+            renseignes&=_masque_emprise(longitudes,latitudes,inEmprise)
+        if inFenetreTemps is not None:
+            renseignes&=_masque_fenetre_temps(temps,inFenetreTemps)
+        return np.column_stack((longitudes[renseignes],latitudes[renseignes],elevations[renseignes]))
+
+# Noyaux de calcul vectoriel (numpy) utilisés par les Classes Segment et SegmentColonnaire
+def _ecarts_2D (inLongitudes,inLatitudes) : # return numpy array
+    """
+    ROLE : renvoie les distances 2D (en mètres) entre points successifs, calculées sur l'ensemble des tableaux
+           avec la même approximation équirectangulaire que Point.distance2D
+    ENTREES inLongitudes, inLatitudes : numpy array # coordonnées des points en degrés
+    """
+    # Le rayon d'un méridien est toujours égal au rayon terrestre
+    deltaY=(inLatitudes[:-1]-inLatitudes[1:])/180*pi*RAYON_TERRE
+    # Le rayon d'un parallèle dépend de sa latitude (poles=>0, équateur=>maxi)
+    latMoyenne=((inLatitudes[:-1]+inLatitudes[1:])/2)/180*pi
+    deltaX=(inLongitudes[:-1]-inLongitudes[1:])/180*pi*RAYON_TERRE*np.cos(latMoyenne)
+    return np.sqrt(deltaX*deltaX+deltaY*deltaY)
+
+def _ecarts_haversine (inLongitudes,inLatitudes) : # return numpy array
+    """
+    ROLE : renvoie les distances 2D (en mètres) entre points successifs calculées par la formule de haversine
+           (distance du grand cercle, exacte sur la sphère de rayon RAYON_TERRE)
+    ENTREES inLongitudes, inLatitudes : numpy array # coordonnées des points en degrés
+    """
+    lon=np.radians(inLongitudes)
+    lat=np.radians(inLatitudes)
+    a=np.sin(np.diff(lat)/2)**2+np.cos(lat[:-1])*np.cos(lat[1:])*np.sin(np.diff(lon)/2)**2
+    return 2*RAYON_TERRE*np.arcsin(np.sqrt(a))
+
+def _ecarts_3D (inEcarts2D,inElevations) : # return numpy array
+    """
+    ROLE : renvoie les distances 3D (en mètres) entre points successifs à partir de leurs distances 2D 
+           et des écarts d'altitude
+    ENTREES inEcarts2D : numpy array # distances 2D entre points successifs (longueur n-1)
+            inElevations : numpy array # altitudes des points (longueur n)
+    """
+    deltaZ=np.diff(inElevations)
+    return np.sqrt(inEcarts2D*inEcarts2D+deltaZ*deltaZ)
+
+def _cumul (inEcarts) : # return numpy array
+    """
+    ROLE : renvoie les sommes cumulées des écarts entre points successifs, en partant de 0 au premier point
+    ENTREE inEcarts : numpy array # écarts entre points successifs (longueur n-1)
+    """
+    cumul=np.zeros(len(inEcarts)+1)
+    np.cumsum(inEcarts,out=cumul[1:])
+    return cumul
+
+def _ecart_2D (inLon1,inLat1,inLon2,inLat2) : # return float
+    """
+    ROLE : version scalaire de _ecarts_2D : distance 2D (en mètres) entre deux points
+    ENTREES inLon1, inLat1, inLon2, inLat2 : float # coordonnées des deux points en degrés
+    """
+    deltaY=(inLat1-inLat2)/180*pi*RAYON_TERRE
+    latMoyenne=((inLat1+inLat2)/2)/180*pi
+    deltaX=(inLon1-inLon2)/180*pi*RAYON_TERRE*cos(latMoyenne)
+    return sqrt(deltaX*deltaX+deltaY*deltaY)
+
+def _totaux_colonnes (inLongitudes,inLatitudes,inElevations,inTemps) : # return dict
+    """
+    ROLE : calcule en un seul parcours des colonnes d'un segment ses totaux bruts : nbre_points, longueur2D et 
+           longueur3D (m), altMini et altMaxi (None si aucune altitude), denivele_ascendant et denivele_descendant (m),
+           temps_premier et temps_dernier (ms), dernier (longitude, latitude, élévation du dernier point ou None)
+    ENTREES inLongitudes, inLatitudes, inElevations : numpy array float64
+            inTemps : numpy array int64 # instants de relevé en millisecondes
+    """
+    ecarts2D=_ecarts_2D(inLongitudes,inLatitudes) # distances 2D entre points successifs
+    ecartsZ=np.diff(inElevations) # écarts d'altitude entre points successifs
+    elevations=inElevations[~np.isnan(inElevations)] # altitudes renseignées
+    nbre=len(inLongitudes)
+    return {'nbre_points':nbre,
+            'longueur2D':float(ecarts2D.sum()),
+            'longueur3D':float(np.sqrt(ecarts2D*ecarts2D+ecartsZ*ecartsZ).sum()),
+            'altMini':float(elevations.min()) if len(elevations) else None,
+            'altMaxi':float(elevations.max()) if len(elevations) else None,
+            'denivele_ascendant':float(ecartsZ[ecartsZ>0].sum()),
+            'denivele_descendant':float(ecartsZ[ecartsZ<0].sum()),
+            'temps_premier':int(inTemps[0]) if nbre else TEMPS_ABSENT,
+            'temps_dernier':int(inTemps[-1]) if nbre else TEMPS_ABSENT,
+            'dernier':(float(inLongitudes[-1]),float(inLatitudes[-1]),float(inElevations[-1])) if nbre else None}
+
+def _ajouter_aux_totaux (ioTotaux,inLon,inLat,inEle,inTemps) :
+    """
+    ROLE : met à jour en O(1) les totaux ioTotaux (voir _totaux_colonnes) avec un point ajouté en fin de segment
+    ENTREES inLon, inLat, inEle : float ; inTemps : int # caractéristiques du point ajouté
+    """
+    inLon,inLat,inEle=float(inLon),float(inLat),float(inEle)
+    if ioTotaux['nbre_points']:
+        lonPrecedente,latPrecedente,elePrecedente=ioTotaux['dernier']
+        ecart2D=_ecart_2D(lonPrecedente,latPrecedente,inLon,inLat)
+        ecartZ=inEle-elePrecedente
+        ioTotaux['longueur2D']+=ecart2D
+        ioTotaux['longueur3D']+=sqrt(ecart2D*ecart2D+ecartZ*ecartZ)
+        if ecartZ>0:
+            ioTotaux['denivele_ascendant']+=ecartZ
+        elif ecartZ<0:
+            ioTotaux['denivele_descendant']+=ecartZ
+    else:
+        ioTotaux['temps_premier']=int(inTemps)
+    if inEle==inEle: # altitude renseignée (non NaN)
+        if ioTotaux['altMini'] is None or inEle<ioTotaux['altMini']:
+            ioTotaux['altMini']=inEle
+        if ioTotaux['altMaxi'] is None or inEle>ioTotaux['altMaxi']:
+            ioTotaux['altMaxi']=inEle
+    ioTotaux['temps_dernier']=int(inTemps)
+    ioTotaux['dernier']=(inLon,inLat,inEle)
+    ioTotaux['nbre_points']+=1
+
+def _fusionner_totaux (ioTotaux,inLongitudes,inLatitudes,inElevations,inTemps) :
+    """
+    ROLE : met à jour les totaux ioTotaux (voir _totaux_colonnes) avec des points ajoutés en fin de segment,
+           le calcul vectoriel ne portant que sur les points ajoutés (précédés du dernier point déjà compté)
+    ENTREES inLongitudes, inLatitudes, inElevations, inTemps : numpy array # colonnes des points ajoutés
+    """
+    if not ioTotaux['nbre_points']:
+        ioTotaux.update(_totaux_colonnes(inLongitudes,inLatitudes,inElevations,inTemps))
+        return
+    # Les points ajoutés sont précédés du dernier point déjà compté pour prendre en compte la jonction
+    lon,lat,ele=ioTotaux['dernier']
+    suite=_totaux_colonnes(np.r_[lon,inLongitudes],np.r_[lat,inLatitudes],np.r_[ele,inElevations],
+                           np.r_[ioTotaux['temps_dernier'],inTemps].astype(np.int64))
+    for cle in ('longueur2D','longueur3D','denivele_ascendant','denivele_descendant'):
+        ioTotaux[cle]+=suite[cle]
+    for cle,extreme in (('altMini',min),('altMaxi',max)):
+        valeurs=[valeur for valeur in (ioTotaux[cle],suite[cle]) if valeur is not None]
+        ioTotaux[cle]=extreme(valeurs) if valeurs else None
+    ioTotaux['nbre_points']+=suite['nbre_points']-1
+    ioTotaux['temps_dernier']=suite['temps_dernier']
+    ioTotaux['dernier']=suite['dernier']
+
+def _resume_totaux (inTotaux) : # return dict
+    """
+    ROLE : met en forme les totaux d'un segment (voir _totaux_colonnes) en résumé (voir Segment.resume), 
+           arrondis comme les services correspondants de la classe Segment
+    ENTREE inTotaux : dict
+    """
+    duree=None
+    if inTotaux['nbre_points'] and TEMPS_ABSENT not in (inTotaux['temps_premier'],inTotaux['temps_dernier']):
+        duree=(inTotaux['temps_dernier']-inTotaux['temps_premier'])/1000.
+    longueur2D=inTotaux['longueur2D']
+    return {'nbre_points':inTotaux['nbre_points'],
+            'longueur2D':round(longueur2D*0.001,2), # conversion en km et arrondissement à 2 chiffres après la virgule
+            'longueur3D':round(inTotaux['longueur3D']*0.001,2),
+            'altMini':None if inTotaux['altMini'] is None else round(inTotaux['altMini'],2),
+            'altMaxi':None if inTotaux['altMaxi'] is None else round(inTotaux['altMaxi'],2),
+            'denivele_ascendant':round(inTotaux['denivele_ascendant'],2),
+            'denivele_descendant':round(inTotaux['denivele_descendant'],2),
+            'duree':None if duree is None else _instant_en_chaine(duree),
+            'duree_secondes':duree,
+            # vitesse moyenne en km/h (*0.001/3600) arrondie à 2 chiffres après virgule
+            'vitesse_moyenne':round((longueur2D*0.001)/(duree/3600),2) if duree else None}
+
+def _vitesses_colonnes (inLongitudes,inLatitudes,inElevations,inTemps,inHaversine=False,inTraces=None,inTroncons=None) : # return tuple de numpy array
+    """
+    ROLE : renvoie pour chaque intervalle entre points successifs sa distance (m), sa durée (s) et sa vitesse (km/h).
+           La distance est 3D si les deux points ont une altitude, 2D sinon ; durée et vitesse valent NaN si l'un 
+           des deux points n'a pas d'heure, si la durée est négative ou si l'intervalle relie deux tronçons (saut entre 
+           la fin d'un tronçon et le début du suivant, voir _bornes_troncons) ; la vitesse vaut 0 si la durée est nulle
+    ENTREES inLongitudes, inLatitudes, inElevations : numpy array float64
+            inTemps : numpy array int64 # instants de relevé en millisecondes
+            inHaversine : Variable booléenne. Si True, distances 2D calculées par la formule de haversine
+            inTraces, inTroncons : numpy array d'entiers # rangs des traces et des tronçons des points (None : un seul tronçon)
+    """
+    ecarts2D=_ecarts_haversine(inLongitudes,inLatitudes) if inHaversine else _ecarts_2D(inLongitudes,inLatitudes)
+    ecartsZ=np.diff(inElevations)
+    distances=np.sqrt(ecarts2D*ecarts2D+ecartsZ*ecartsZ)
+    sans3D=np.isnan(ecartsZ)
+    distances[sans3D]=ecarts2D[sans3D]
+    durees=np.diff(inTemps)/1000.
+    # intervalles inexploitables : point sans heure ou retour en arrière dans le temps (traces concaténées)
+    sansHeure=(inTemps[:-1]==TEMPS_ABSENT)|(inTemps[1:]==TEMPS_ABSENT)|(durees<0)
+    if inTraces is not None: # intervalles entre deux tronçons : le saut n'est ni un mouvement ni un arrêt
+        sansHeure|=(np.diff(inTraces)!=0)|(np.diff(inTroncons)!=0)
+    durees[sansHeure]=np.nan
+    vitesses=np.zeros(len(durees))
+    positives=durees>0
+    vitesses[positives]=distances[positives]/durees[positives]*3.6 # m/s => km/h
+    vitesses[sansHeure]=np.nan
+    return distances,durees,vitesses
+
+def _donnees_mouvement (inDistances,inDurees,inVitesses,inSeuilArret) : # return dict
+    """
+    ROLE : répartit les intervalles entre points successifs (voir _vitesses_colonnes) en mouvement (vitesse 
+           supérieure à inSeuilArret) et en arrêt, et renvoie temps_mouvement et temps_arret (s), distance_mouvement 
+           et distance_arret (m) et vitesse_maxi (km/h, None si moins de 20 intervalles en mouvement). Les intervalles 
+           sans heure et ceux qui relient deux tronçons sont ignorés.
+           La vitesse maximale est filtrée comme dans gpxpy : les intervalles dont la distance s'écarte de plus 
+           de 1,5 écart-type de la moyenne sont écartés, puis les 5% de vitesses les plus élevées
+    ENTREES inDistances, inDurees, inVitesses : numpy array float64 # longueur n-1
+            inSeuilArret : float # vitesse (km/h) en dessous de laquelle (ou à laquelle) le point est à l'arrêt
+    """
+    dates=~np.isnan(inDurees)
+    mouvement=dates&(inVitesses>inSeuilArret)
+    arret=dates&~mouvement
+    vitesseMaxi=None
+    distances=inDistances[mouvement]
+    if len(distances)>=20:
+        vitesses=inVitesses[mouvement]
+        retenues=vitesses[np.abs(distances-distances.mean())<=1.5*distances.std()]
+        if len(retenues):
+            rang=int(len(retenues)*0.95)
+            vitesseMaxi=float(np.partition(retenues,rang)[rang])
+    return {'temps_mouvement':float(inDurees[mouvement].sum()),
+            'temps_arret':float(inDurees[arret].sum()),
+            'distance_mouvement':float(distances.sum()),
+            'distance_arret':float(inDistances[arret].sum()),
+            'vitesse_maxi':vitesseMaxi}
+
+def _projection_locale (inLongitudes,inLatitudes,inLatReference=None) : # return tuple de numpy array
+    """
+    ROLE : renvoie les coordonnées planes (en mètres) des points, projetés par l'approximation équirectangulaire 
+           de _ecarts_2D autour d'une latitude de référence (projection valable à l'échelle d'une trace)
+    ENTREES inLongitudes, inLatitudes : numpy array # coordonnées des points en degrés
+            inLatReference : float # latitude de référence en degrés (par défaut None : latitude moyenne des points)
+    """
+    if inLatReference is None:
+        inLatReference=float(inLatitudes.mean()) if len(inLatitudes) else 0.
+    latReference=inLatReference/180*pi
+    return np.radians(inLongitudes)*RAYON_TERRE*cos(latReference),np.radians(inLatitudes)*RAYON_TERRE
+
+def _masque_douglas_peucker (inX,inY,inTolerance,inDebuts,inFins) : # return numpy array
+    """
+    ROLE : renvoie le masque (numpy array de booléens) des points conservés par l'algorithme de Douglas-Peucker 
+           appliqué à chaque polyligne [inDebuts[i], inFins[i]] : les extrémités sont conservées et, tant que le point 
+           le plus éloigné du segment joignant les extrémités d'une portion en est à plus de inTolerance, il est 
+           conservé et la portion est coupée en deux. Les portions à traiter sont empilées (pas de récursivité ni de 
+           recopie des points) et les distances d'une portion calculées en un seul calcul vectoriel
+    ENTREES inX, inY : numpy array # coordonnées planes des points en mètres (voir _projection_locale)
+            inTolerance : float # écart maximal (en mètres) entre la polyligne simplifiée et les points écartés
+            inDebuts, inFins : séquences d'int # rangs du premier et du dernier point de chaque polyligne
+    """
+    conserves=np.zeros(len(inX),dtype=bool)
+    conserves[inDebuts]=True
+    conserves[inFins]=True
+    tolerance2=inTolerance*inTolerance
+    pile=[(int(debut),int(fin)) for debut,fin in zip(inDebuts,inFins)]
+    while pile:
+        debut,fin=pile.pop()
+        if fin-debut<2:
+            continue
+        x=inX[debut+1:fin]-inX[debut]
+        y=inY[debut+1:fin]-inY[debut]
+        dx=inX[fin]-inX[debut]
+        dy=inY[fin]-inY[debut]
+        longueur2=dx*dx+dy*dy
+        if longueur2>0: # distance au segment [debut,fin] : projection bornée à ses extrémités
+            t=np.clip((x*dx+y*dy)/longueur2,0.,1.)
+            x=x-t*dx
+            y=y-t*dy
+        distances2=x*x+y*y # extrémités confondues (boucle) : distance au point de départ
+        rang=int(np.argmax(distances2))
+        if distances2[rang]>tolerance2:
+            milieu=debut+1+rang
+            conserves[milieu]=True
+            pile.append((debut,milieu))
+            pile.append((milieu,fin))
+    return conserves
+
+def _bornes_troncons (inTraces,inTroncons) : # return tuple de numpy array
+    """
+    ROLE : renvoie les rangs du premier et du dernier point de chaque tronçon de points consécutifs de même trace 
+           et de même tronçon
+    ENTREES inTraces, inTroncons : numpy array d'entiers # rangs des traces et des tronçons des points (voir Segment.types)
+    """
+    coupures=np.flatnonzero((np.diff(inTraces)!=0)|(np.diff(inTroncons)!=0))+1 # un tronçon commence à chaque changement
+    return np.r_[0,coupures],np.r_[coupures-1,len(inTraces)-1]
+
+def _reechantillonner_troncon (inLongitudes,inLatitudes,inElevations,inTemps,inPas,inParTemps=False) : # return tuple de numpy array
+    """
+    ROLE : renvoie les colonnes (longitudes, latitudes, élévations, temps) des points d'un tronçon rééchantillonné 
+           à pas constant, de son premier à son dernier point (inclus) : les colonnes sont interpolées linéairement 
+           (np.interp) en fonction de la distance 2D cumulée depuis le premier point, ou de l'instant de relevé. 
+           Les élévations et les temps sont interpolés entre les seuls points qui en ont (NaN et TEMPS_ABSENT si 
+           aucun) ; par le temps, les points sans heure sont ignorés
+    ENTREES inLongitudes, inLatitudes, inElevations : numpy array float64
+            inTemps : numpy array int64 # instants de relevé en millisecondes
+            inPas : float # écart entre points successifs : en mètres, ou en secondes si inParTemps
+            inParTemps : bool # si True, rééchantillonnage dans le temps
+    """
+    if inParTemps:
+        dates=inTemps!=TEMPS_ABSENT
+        inLongitudes,inLatitudes,inElevations,inTemps=inLongitudes[dates],inLatitudes[dates],inElevations[dates],inTemps[dates]
+        abscisses=np.maximum.accumulate(inTemps/1000.) # abscisses croissantes même si l'horloge recule
+    else:
+        abscisses=_cumul(_ecarts_2D(inLongitudes,inLatitudes))
+    if not len(abscisses):
+        return np.empty(0),np.empty(0),np.empty(0),np.empty(0,dtype=np.int64)
+    nouvelles=np.r_[abscisses[0]+np.arange(0.,abscisses[-1]-abscisses[0],inPas),abscisses[-1]]
+    elevations=np.full(len(nouvelles),np.nan)
+    renseignees=~np.isnan(inElevations)
+    if renseignees.any():
+        elevations=np.interp(nouvelles,abscisses[renseignees],inElevations[renseignees])
+    temps=np.full(len(nouvelles),TEMPS_ABSENT,dtype=np.int64)
+    dates=inTemps!=TEMPS_ABSENT
+    if dates.any():
+        temps=np.round(np.interp(nouvelles,abscisses[dates],inTemps[dates].astype(np.float64))).astype(np.int64)
+    return np.interp(nouvelles,abscisses,inLongitudes),np.interp(nouvelles,abscisses,inLatitudes),elevations,temps
+
+def _reechantillonner_colonnes (inColonnes,inTypes,inNatures,inPas,inParTemps=False) : # return tuple de numpy array
+    """
+    ROLE : renvoie les sept colonnes (voir _lire_colonnes_GPX avec inTypes) de points dont ceux de natures inNatures 
+           sont rééchantillonnés tronçon par tronçon (voir _reechantillonner_troncon), suivis des autres points inchangés
+    ENTREES inColonnes : tuple (longitudes, latitudes, élévations, temps) de numpy array
+            inTypes : tuple (natures, traces, tronçons) de numpy array
+            inNatures : tuple d'int # natures des points rééchantillonnés
+            inPas, inParTemps : voir _reechantillonner_troncon
+    """
+    natures,traces,troncons=inTypes
+    parcours=np.isin(natures,inNatures)
+    rangs=np.flatnonzero(parcours)
+    colonnes=[colonne[rangs] for colonne in tuple(inColonnes)+tuple(inTypes)]
+    morceaux=[]
+    if len(rangs):
+        for debut,fin in zip(*_bornes_troncons(colonnes[5],colonnes[6])):
+            troncon=_reechantillonner_troncon(*[colonne[debut:fin+1] for colonne in colonnes[:4]],inPas,inParTemps)
+            nbre=len(troncon[0])
+            morceaux.append(troncon+tuple(np.full(nbre,colonne[debut],dtype=colonne.dtype) for colonne in colonnes[4:]))
+    morceaux.append(tuple(colonne[~parcours] for colonne in tuple(inColonnes)+tuple(inTypes)))
+    return tuple(np.concatenate(colonne) for colonne in zip(*morceaux))
+
+def _index_spatial (inLongitudes,inLatitudes,inRangs) : # return tuple (cKDTree, float, numpy array)
+    """
+    ROLE : construit l'index spatial (arbre kd, scipy.spatial.cKDTree) de points projetés en mètres autour de leur 
+           latitude moyenne (voir _projection_locale) et renvoie (arbre, latitude de référence de la projection, 
+           rangs des points suivis de -1, rang renvoyé pour un voisin manquant)
+    ENTREES inLongitudes, inLatitudes : numpy array # coordonnées des points indexés en degrés
+            inRangs : numpy array d'entiers # rangs des points indexés, renvoyés par les recherches
+    """
+    latReference=float(inLatitudes.mean()) if len(inLatitudes) else 0.
+    x,y=_projection_locale(inLongitudes,inLatitudes,latReference)
+    return cKDTree(np.column_stack((x,y))),latReference,np.append(inRangs,-1)
+
+def _plus_proches (inIndex,inLongitudes,inLatitudes,inK=1) : # return tuple
+    """
+    ROLE : renvoie (distances en mètres, rangs) des inK points indexés les plus proches de chaque position, 
+           de même forme que cKDTree.query : un scalaire par position si inK vaut 1, un tableau de inK sinon 
+           (rang -1 et distance inf s'il y a moins de inK points indexés)
+    ENTREES inIndex : tuple # index spatial (voir _index_spatial)
+            inLongitudes, inLatitudes : float ou tableaux de float # positions recherchées en degrés
+            inK : int # nombre de voisins recherchés
+    """
+    arbre,latReference,rangs=inIndex
+    x,y=_projection_locale(np.asarray(inLongitudes,dtype=np.float64),np.asarray(inLatitudes,dtype=np.float64),latReference)
+    distances,positions=arbre.query(np.stack((x,y),axis=-1),k=inK)
+    return distances,rangs[positions]
+
+def _points_dans_rayon (inIndex,inLongitudes,inLatitudes,inRayon) : # return numpy array ou list
+    """
+    ROLE : renvoie les rangs (numpy array triés) des points indexés à moins de inRayon mètres d'une position, 
+           ou la liste de ces tableaux pour des tableaux de positions (dans l'ordre des positions aplaties)
+    ENTREES inIndex : tuple # index spatial (voir _index_spatial)
+            inLongitudes, inLatitudes : float ou tableaux de float # positions recherchées en degrés
+            inRayon : float # rayon de recherche en mètres
+    """
+    arbre,latReference,rangs=inIndex
+    x,y=_projection_locale(np.asarray(inLongitudes,dtype=np.float64),np.asarray(inLatitudes,dtype=np.float64),latReference)
+    resultats=arbre.query_ball_point(np.stack((x,y),axis=-1),r=inRayon,return_sorted=True)
+    if np.ndim(x)==0:
+        return rangs[np.asarray(resultats,dtype=np.intp)]
+    return [rangs[np.asarray(positions,dtype=np.intp)] for positions in np.ravel(resultats)]
+
 # Fonctions privées appelées dans la Classe Segment
+def _lire_points_GPX (inFichierGPX,inConvertirHeures=True,ioEntete=None,inEmprise=None) : # générateur de tuples (float, float, float, float, int, int, int)
+    """
+    ROLE : lit un fichier GPX au fil de l'eau (analyse XML incrémentale iterparse) et renvoie, pour chaque 
+           point de trace (trkpt), point de route (rtept) ou waypoint (wpt) et dans l'ordre du document, le tuple 
+           (longitude, latitude, elevation, instant, nature, trace, tronçon). L'instant est exprimé en secondes 
+           depuis le 01/01/1970 (UTC). L'élévation et l'instant valent None s'ils sont absents du point.
+           La nature est celle de la balise (NATURES_POINTS), trace est le rang de la trace (trk) ou de la route (rte)
+           du point dans le fichier et tronçon le rang de son tronçon (trkseg) dans la trace (0 pour une route) ; 
+           tous deux valent -1 pour un waypoint.
+           Chaque point est libéré dès qu'il a été lu : la mémoire consommée reste constante quelle que soit 
+           la taille du fichier.
+    ENTREES inFichierGPX : str # Chemin d'accès au fichier GPX, éventuellement compressé ou membre d'une archive zip
+                               # (voir _ouvrir_fichier_GPX), ou objet fichier ouvert en lecture
+            inConvertirHeures : bool # si False, l'instant est renvoyé tel qu'écrit dans le fichier (str) 
+                                     # pour une conversion groupée (gpxfield.parse_times_to_epoch)
+            ioEntete : dict # si fourni, complété au fil de la lecture par 'activite' : type de la première 
+                            # trace (balise trk/type, par exemple 'hiking'), None si le fichier ne le précise pas, 
+                            # et 'bornes' : emprise (lonMin, latMin, lonMax, latMax) déclarée dans l'en-tête (balise 
+                            # bounds), None si le fichier ne la déclare pas
+            inEmprise : tuple (lonMin, latMin, lonMax, latMax) # si fourni, la lecture s'arrête dès l'en-tête quand 
+                        # l'emprise déclarée par le fichier (balise bounds) ne la recoupe pas. Les points ne sont pas filtrés
+    """
+    if ioEntete is None:
+        ioEntete={}
+    ioEntete.setdefault('activite',None)
+    ioEntete.setdefault('bornes',None)
+    # Un chemin est ouvert ici (décompression au fil de la lecture) et refermé en fin de lecture
+    fichier=_ouvrir_fichier_GPX(inFichierGPX) if isinstance(inFichierGPX,str) else inFichierGPX
+    try:
+        for point in _analyser_points_GPX(fichier,inConvertirHeures,ioEntete,inEmprise):
+            yield point
+    finally:
+        if fichier is not inFichierGPX:
+            fichier.close()
+
+def _analyser_points_GPX (inFichier,inConvertirHeures,ioEntete,inEmprise) : # générateur de tuples (float, float, float, float, int, int, int)
+    """
+    ROLE : analyse XML incrémentale d'un fichier GPX ouvert en lecture (voir _lire_points_GPX)
+    """
+    pile=[] # pile des éléments XML ouverts : le dernier est le parent de l'élément qui se ferme
+    rangTrace,rangTroncon,rangRoute=-1,-1,-1 # rangs de la trace, du tronçon et de la route en cours
+    for evenement,element in ElementTree.iterparse(inFichier,events=('start','end')):
+        if evenement=='start':
+            pile.append(element)
+            if element.tag.endswith(('trk','trkseg','rte')): # ouverture d'une trace, d'un tronçon ou d'une route
+                balise=element.tag.rpartition('}')[2]
+                if balise=='trkseg':
+                    rangTroncon+=1
+                elif balise=='trk':
+                    rangTrace+=1
+                    rangTroncon=-1
+                elif balise=='rte':
+                    rangRoute+=1
+            continue
+        pile.pop()
+        # Les balises sont préfixées par l'espace de noms GPX : {http://www.topografix.com/GPX/1/1}trkpt
+        balise=element.tag.rpartition('}')[2]
+        nature=NATURES_POINTS.get(balise)
+        if nature is None:
+            parent=pile[-1].tag.rpartition('}')[2] if pile else None
+            if balise=='type' and ioEntete['activite'] is None and parent=='trk' and element.text:
+                ioEntete['activite']=element.text.strip()
+            elif balise=='bounds' and parent in ('metadata','gpx'):
+                try:
+                    ioEntete['bornes']=tuple(float(element.get(attribut)) for attribut in ('minlon','minlat','maxlon','maxlat'))
+                except (TypeError,ValueError):
+                    continue # bornes incomplètes : ignorées
+                if inEmprise is not None and _hors_emprise(ioEntete['bornes'],inEmprise):
+                    return # aucun point du fichier ne peut être dans l'emprise
+            continue
+        ele=None
+        heure=None
+        for enfant in element: # Parcours des balises filles du point à la recherche de l'élévation et de l'heure
+            balise=enfant.tag.rpartition('}')[2]
+            if balise=='ele':
+                ele=enfant.text
+            elif balise=='time':
+                heure=enfant.text
+        if nature==NATURE_TRACE:
+            trace,troncon=rangTrace,rangTroncon
+        elif nature==NATURE_ROUTE:
+            trace,troncon=rangRoute,0
+        else:
+            trace,troncon=-1,-1
+        yield (float(element.get('lon')),float(element.get('lat')),
+               float(ele) if ele else None,_instant_GPX(heure) if inConvertirHeures else heure,nature,trace,troncon)
+        # Libération du point : on vide l'élément et on le détache de son parent (trkseg ou gpx)
+        element.clear()
+        if pile:
+            pile[-1].remove(element)
+
+def _lire_colonnes_GPX (inFichierGPX,ioEntete=None,inEmprise=None,inTypes=False,inFenetreTemps=None) : # return tuple de numpy array
+    """
+    ROLE : lit un fichier GPX au fil de l'eau (fonction _lire_points_GPX) et renvoie ses points en colonnes :
+           (longitudes, latitudes, élévations) en float64 (NaN si l'élévation est absente) 
+           et temps en int64 (millisecondes depuis le 01/01/1970 UTC, TEMPS_ABSENT si l'heure est absente)
+    ENTREES inFichierGPX : str # Chemin d'accès au fichier GPX (ou objet fichier ouvert en lecture)
+            ioEntete : dict # si fourni, complété par les informations d'en-tête (voir _lire_points_GPX)
+            inEmprise : tuple (lonMin, latMin, lonMax, latMax) # si fourni, seuls les points de cette emprise sont 
+                        # gardés, au fil de la lecture (et la lecture s'arrête si l'en-tête du fichier ne la recoupe pas)
+            inTypes : bool # si True, les colonnes des types des points (natures en int8, rangs des traces et des 
+                           # tronçons en int32, voir Segment.types) sont renvoyées à la suite des quatre premières
+            inFenetreTemps : tuple (debut, fin) # si fourni, seuls les points relevés dans cette période (voir 
+                             # _masque_fenetre_temps) sont gardés, au fil de la lecture : l'heure de chaque point 
+                             # est alors convertie dès sa lecture
+    """
+    # Les colonnes sont remplies dans des tableaux compacts (module array) puis partagées avec numpy sans recopie
+    longitudes,latitudes,elevations,heures=array('d'),array('d'),array('d'),[]
+    natures,traces,troncons=array('b'),array('i'),array('i')
+    if inEmprise is not None:
+        lonMin,latMin,lonMax,latMax=inEmprise
+    if inFenetreTemps is not None: # bornes en millisecondes, comparées comme dans _masque_fenetre_temps
+        debut,fin=(None if borne is None else borne*1000 for borne in inFenetreTemps)
+    for lon,lat,ele,heure,nature,trace,troncon in _lire_points_GPX(inFichierGPX,False,ioEntete,inEmprise):
+        if inEmprise is not None and not (lonMin<=lon<=lonMax and latMin<=lat<=latMax):
+            continue # point hors de l'emprise : abandonné dès sa lecture
+        if inFenetreTemps is not None:
+            instant=_instant_GPX(heure)
+            if instant is None or (debut is not None and round(instant*1000)<debut) or \
+               (fin is not None and round(instant*1000)>fin):
+                continue # point sans heure ou hors de la période : abandonné dès sa lecture
+        longitudes.append(lon)
+        latitudes.append(lat)
+        elevations.append(np.nan if ele is None else ele)
+        heures.append(heure.strip() if heure else None)
+        natures.append(nature)
+        traces.append(trace)
+        troncons.append(troncon)
+    # Conversion groupée des heures GPX en instants (secondes, NaN si absentes) puis en millisecondes
+    instants=np.frombuffer(gpxfield.parse_times_to_epoch(heures),dtype=np.float64)
+    temps=np.full(len(instants),TEMPS_ABSENT,dtype=np.int64)
+    renseignes=~np.isnan(instants)
+    temps[renseignes]=np.round(instants[renseignes]*1000)
+    colonnes=(np.frombuffer(longitudes,dtype=np.float64),np.frombuffer(latitudes,dtype=np.float64),
+              np.frombuffer(elevations,dtype=np.float64),temps)
+    if not inTypes:
+        return colonnes
+    return colonnes+(np.frombuffer(natures,dtype=np.int8),np.frombuffer(traces,dtype=np.intc),
+                     np.frombuffer(troncons,dtype=np.intc))
+
+def _ouvrir_fichier_GPX (inFichierGPX) : # return objet fichier
+    """
+    ROLE : ouvre un fichier GPX en lecture binaire. Un fichier compressé (extension .gz, .bz2 ou .xz) est décompressé 
+           au fil de la lecture, de même qu'un fichier GPX contenu dans une archive zip, désigné par le chemin 
+           archive.zip/membre.gpx (un membre compressé, archive.zip/membre.gpx.gz, est en plus décompressé d'après 
+           son extension) : rien n'est décompressé sur disque et la mémoire consommée reste bornée.
+    ENTREE inFichierGPX : str # Chemin d'accès au fichier GPX
+    """
+    decompresseur=DECOMPRESSEURS.get(os.path.splitext(inFichierGPX)[1].lower())
+    if _membre_zip(inFichierGPX) is not None:
+        fichier=_ouvrir_brut(inFichierGPX)
+        # membre compressé : le membre est fermé avec le fichier décompressé qui le référence
+        return fichier if decompresseur is None else decompresseur(fichier,'rb')
+    if decompresseur is not None:
+        return decompresseur(inFichierGPX,'rb')
+    return open(inFichierGPX,'rb')
+
+def _ouvrir_brut (inFichier) : # return objet fichier
+    """
+    ROLE : ouvre en lecture binaire le contenu brut d'un fichier : tel qu'écrit sur disque, ou extrait de l'archive 
+           pour un membre d'archive zip (archive.zip/membre), sans décompression d'après son extension
+    ENTREE inFichier : str # Chemin d'accès au fichier (ou archive.zip/membre)
+    """
+    membre=_membre_zip(inFichier)
+    if membre is None:
+        return open(inFichier,'rb')
+    archive,nom=membre
+    with zipfile.ZipFile(archive) as fichierZip:
+        return fichierZip.open(nom) # le membre ouvert garde l'archive ouverte jusqu'à sa fermeture
+
+def _membre_zip (inChemin) : # return tuple (str, str)
+    """
+    ROLE : renvoie le couple (chemin de l'archive, nom du membre) si inChemin désigne un fichier contenu dans une 
+           archive zip (chemin archive.zip/membre.gpx), None sinon
+    ENTREE inChemin : str # Chemin d'accès au fichier
+    """
+    rang=inChemin.lower().find('.zip/')
+    while rang!=-1:
+        if os.path.isfile(inChemin[:rang+4]):
+            return (inChemin[:rang+4],inChemin[rang+5:])
+        rang=inChemin.lower().find('.zip/',rang+1)
+    return None
+
+# Fonctions privées appelées dans la Classe TracesBinaires
+def _ecrire_traces_binaires (inFichierBinaire,inNoms,inColonnes) :
+    """
+    ROLE : écrit un fichier de traces binaires (voir classe TracesBinaires) à partir des colonnes de ses traces. 
+           Les longitudes sont écrites directement dans le fichier, les autres colonnes dans des fichiers temporaires 
+           recopiés à la suite ; l'en-tête est écrit en dernier. Le fichier est écrit sous un nom temporaire puis 
+           renommé : un fichier de traces n'est jamais lu à moitié écrit.
+    ENTREES inFichierBinaire : str # Chemin du fichier à écrire
+            inNoms : liste de str # Noms des traces
+            inColonnes : itérable de tuples (longitudes, latitudes, élévations, temps, natures, traces, tronçons) 
+                         # Colonnes des traces, dans l'ordre
+    """
+    rangs=np.zeros(len(inNoms)+1,dtype='<u8')
+    emprise=[np.inf,np.inf,-np.inf,-np.inf]
+    periode=[TEMPS_ABSENT,TEMPS_ABSENT]
+    nbreSansAltitude=0
+    nbreRoutes=0
+    dossier=os.path.dirname(os.path.abspath(inFichierBinaire))
+    descripteur,temporaire=tempfile.mkstemp(suffix='.tmp',dir=dossier)
+    try:
+        with os.fdopen(descripteur,'w+b') as fichier:
+            lstTemporaires=[tempfile.TemporaryFile(dir=dossier) for _ in TracesBinaires.TYPES[1:]]
+            fichier.seek(TracesBinaires.ENTETE.size+rangs.nbytes)
+            for rang,colonnes in enumerate(inColonnes):
+                for fichierColonne,colonne,typeColonne in zip([fichier]+lstTemporaires,colonnes,TracesBinaires.TYPES):
+                    fichierColonne.write(memoryview(np.ascontiguousarray(colonne,dtype=typeColonne)))
+                longitudes,latitudes,elevations,temps,natures,_,_=colonnes
+                rangs[rang+1]=rangs[rang]+len(longitudes)
+                nbreRoutes+=int(np.count_nonzero(natures==NATURE_ROUTE))
+                if len(longitudes):
+                    emprise=[min(emprise[0],longitudes.min()),min(emprise[1],latitudes.min()),
+                             max(emprise[2],longitudes.max()),max(emprise[3],latitudes.max())]
+                nbreSansAltitude+=int(np.count_nonzero(np.isnan(elevations)))
+                temps=temps[temps!=TEMPS_ABSENT]
+                if len(temps):
+                    periode=[temps.min() if periode[0]==TEMPS_ABSENT else min(periode[0],temps.min()),max(periode[1],temps.max())]
+            for fichierColonne,typeColonne in zip(lstTemporaires,TracesBinaires.TYPES[1:]):
+                fichierColonne.seek(0)
+                shutil.copyfileobj(fichierColonne,fichier,1024*1024)
+                fichierColonne.close()
+                fichier.write(bytes(_taille_bloc(int(rangs[-1]),typeColonne)-int(rangs[-1])*np.dtype(typeColonne).itemsize))
+            noms='\n'.join(inNoms).encode('utf-8')
+            fichier.write(noms)
+            if rangs[-1]==0:
+                emprise=[np.nan]*4
+            debut,fin=(np.nan,np.nan) if periode[0]==TEMPS_ABSENT else (periode[0]/1000.,periode[1]/1000.)
+            fichier.seek(0)
+            fichier.write(TracesBinaires.ENTETE.pack(TracesBinaires.SIGNATURE,TracesBinaires.VERSION,len(inNoms),
+                                                     int(rangs[-1]),nbreSansAltitude,nbreRoutes,*(emprise+[debut,fin,len(noms)])))
+            fichier.write(memoryview(rangs))
+        os.replace(temporaire,inFichierBinaire)
+    except BaseException:
+        os.remove(temporaire)
+        raise
+
+def _taille_bloc (inNbrePoints,inTypeColonne) : # return int
+    """
+    ROLE : renvoie la taille en octets du bloc d'une colonne dans un fichier de traces binaires : inNbrePoints 
+           valeurs de type inTypeColonne, complétées jusqu'à un multiple de 8 octets (les colonnes suivantes restent alignées)
+    """
+    return -(-inNbrePoints*np.dtype(inTypeColonne).itemsize//8)*8
+
+# Fonctions privées appelées dans la Classe Relief
+def _lister_fichiers_GPX (inNomDossier,inRecursif=False,inIgnorerCasse=False) : # return list
+    """
+    ROLE : renvoie la liste triée des fichiers GPX d'un dossier : fichiers dont le nom se termine par gpx, 
+           éventuellement compressés (nom.gpx.gz, nom.gpx.bz2, nom.gpx.xz), et fichiers GPX des archives zip du dossier, 
+           désignés par le chemin archive.zip/membre.gpx (voir _ouvrir_fichier_GPX)
+    ENTREES inNomDossier : str # Chemin d'accès au dossier
+            inRecursif : bool # si True, les sous-dossiers sont parcourus
+            inIgnorerCasse : bool # si True, les noms en majuscules (nom.GPX) sont aussi retenus
+    """
+    if inRecursif:
+        lstChemins=[os.path.join(dossier,nom) for dossier,_,lstNoms in os.walk(inNomDossier) for nom in lstNoms]
+    else:
+        lstChemins=[chemin for chemin in glob.glob(inNomDossier+'/*') if os.path.isfile(chemin)] # Appel à la bibliothèque glob
+    lstFichiers=[]
+    for chemin in lstChemins:
+        if _est_nom_GPX(os.path.basename(chemin),inIgnorerCasse):
+            lstFichiers.append(chemin)
+        elif chemin.lower().endswith('.zip') and zipfile.is_zipfile(chemin):
+            with zipfile.ZipFile(chemin) as fichierZip:
+                lstFichiers.extend(chemin+'/'+nom for nom in fichierZip.namelist() 
+                                   if not nom.endswith('/') and _est_nom_GPX(nom,inIgnorerCasse))
+    return sorted(lstFichiers)
+
+def _est_nom_GPX (inNom,inIgnorerCasse=False) : # return bool
+    """
+    ROLE : indique si un nom de fichier est celui d'un fichier GPX, éventuellement compressé
+    ENTREES inNom : str # Nom du fichier
+            inIgnorerCasse : bool # si True, la casse du nom est ignorée
+    """
+    racine,extension=os.path.splitext(inNom)
+    if extension.lower() in DECOMPRESSEURS:
+        inNom=racine
+    return (inNom.lower() if inIgnorerCasse else inNom).endswith('gpx')
+
+def _etat_fichier (inFichier) : # return tuple (int, int)
+    """
+    ROLE : renvoie la taille (octets) et la date de modification (nanosecondes) d'un fichier, qui permettent de savoir 
+           s'il a changé. Pour un membre d'archive zip : taille décompressée du membre et date de modification de l'archive
+    ENTREE inFichier : str # Chemin d'accès au fichier (ou archive.zip/membre.gpx)
+    """
+    membre=_membre_zip(inFichier)
+    if membre is None:
+        etat=os.stat(inFichier)
+        return (etat.st_size,etat.st_mtime_ns)
+    archive,nom=membre
+    with zipfile.ZipFile(archive) as fichierZip:
+        taille=fichierZip.getinfo(nom).file_size
+    return (taille,os.stat(archive).st_mtime_ns)
+
+def _lire_coordonnees_GPX (inFichierGPX,inEmprise=None,inFenetreTemps=None,inPasReechantillonnage=None) : # return numpy array
+    """
+    ROLE : lit un fichier GPX au fil de l'eau et renvoie le tableau (n lignes, 3 colonnes : longitudes, latitudes, 
+           altitudes) de ses points de trace et waypoints (NATURES_RELIEF) ayant une altitude. Fonction du module (et non méthode) pour pouvoir être 
+           exécutée dans un processus de lecture parallèle.
+    ENTREES inFichierGPX : str # Chemin d'accès au fichier GPX (ou objet fichier ouvert en lecture binaire)
+            inEmprise : tuple (lonMin, latMin, lonMax, latMax) # si fourni, seuls les points de cette emprise sont gardés
+            inFenetreTemps : tuple (debut, fin) # si fourni, seuls les points relevés dans cette période (secondes depuis 
+                             le 01/01/1970 UTC, une borne None n'est pas filtrée) sont gardés, au fil de la lecture
+            inPasReechantillonnage : float # si fourni, les points de trace sont rééchantillonnés à ce pas en mètres 
+                                     (voir _reechantillonner_colonnes) avant le filtrage par l'emprise et la période
+    """
+    if inPasReechantillonnage is None:
+        colonnes=_lire_colonnes_GPX(inFichierGPX,inEmprise=inEmprise,inTypes=True,inFenetreTemps=inFenetreTemps)
+    else: # tous les points sont lus : l'emprise et la période sont filtrées après le rééchantillonnage pour ne pas 
+          # relier les entrées et sorties de zone (les heures des points interpolés sont elles-mêmes interpolées)
+        colonnes=_lire_colonnes_GPX(inFichierGPX,inTypes=True)
+        colonnes=_reechantillonner_colonnes(colonnes[:4],colonnes[4:],(NATURE_TRACE,),inPasReechantillonnage)
+    longitudes,latitudes,elevations,temps,natures,_,_=colonnes
+    renseignes=~np.isnan(elevations)&np.isin(natures,NATURES_RELIEF) # points du relief ayant une altitude
+    if inPasReechantillonnage is not None and inEmprise is not None:
+        renseignes&=_masque_emprise(longitudes,latitudes,inEmprise)
+    if inPasReechantillonnage is not None and inFenetreTemps is not None:
+        renseignes&=_masque_fenetre_temps(temps,inFenetreTemps)
+    return np.column_stack((longitudes[renseignes],latitudes[renseignes],elevations[renseignes]))
+
+def _lire_octets_GPX (inFichierGPX) : # return bytes
+    """
+    ROLE : renvoie le contenu brut d'un fichier GPX (voir Relief.lire_dossier_GPX_async) : tel qu'écrit sur disque, 
+           compressé ou non, ou extrait de l'archive pour un membre d'archive zip (un membre compressé, 
+           archive.zip/membre.gpx.gz, reste compressé)
+    ENTREE inFichierGPX : str # Chemin d'accès au fichier GPX (ou archive.zip/membre.gpx)
+    """
+    with _ouvrir_brut(inFichierGPX) as fichier: # un membre compressé est décompressé à l'analyse (voir _analyser_octets_GPX)
+        return fichier.read()
+
+def _analyser_octets_GPX (inFichierGPX,inContenu,inEmprise=None,inFenetreTemps=None) : # return numpy array
+    """
+    ROLE : renvoie le tableau des coordonnées (voir _lire_coordonnees_GPX) d'un fichier GPX dont le contenu brut a 
+           déjà été lu (voir _lire_octets_GPX), décompressé au fil de l'analyse d'après l'extension du fichier.
+           Fonction du module (et non méthode) pour pouvoir être exécutée dans un processus d'analyse parallèle.
+    ENTREES inFichierGPX : str # Chemin d'accès au fichier GPX, dont l'extension indique la compression
+            inContenu : bytes # Contenu brut du fichier
+            inEmprise, inFenetreTemps : voir _lire_coordonnees_GPX
+    """
+    fichier=io.BytesIO(inContenu)
+    decompresseur=DECOMPRESSEURS.get(os.path.splitext(inFichierGPX)[1].lower())
+    if decompresseur is not None: # fichier ou membre d'archive zip compressé
+        fichier=decompresseur(fichier,'rb')
+    with fichier:
+        return _lire_coordonnees_GPX(fichier,inEmprise,inFenetreTemps)
+
+def _lire_fichiers_coordonnees (inFichiers,inNbProcessus=1,inCache=None,inEmprise=None,inFenetreTemps=None,
+                                inCatalogue=None,inPasReechantillonnage=None) : # return dict
+    """
+    ROLE : renvoie le dictionnaire fichier => tableau des coordonnées (voir _lire_coordonnees_GPX) d'une liste de 
+           fichiers GPX, repris du cache s'il est à jour, sinon lus (éventuellement en parallèle) puis mis en cache.
+           Avec une emprise et/ou une fenêtre de temps, seuls les points correspondants sont gardés ; les fichiers que 
+           le catalogue (s'il est à jour) exclut ne sont pas ouverts.
+    ENTREES inFichiers : liste de str # Chemins d'accès aux fichiers GPX
+            inNbProcessus : int # Nombre de processus de lecture (None : autant que de processeurs)
+            inCache : CacheTraces # Cache disque des points déjà lus (None : pas de cache). Le cache garde tous les 
+                      points des fichiers : il n'est pas utilisé avec une fenêtre de temps (les temps n'y sont pas gardés)
+            inEmprise : tuple (lonMin, latMin, lonMax, latMax) # Zone d'intérêt en degrés (None : pas de filtre)
+            inFenetreTemps : tuple (debut, fin) # Période d'intérêt en secondes depuis le 01/01/1970 UTC (None : pas de filtre)
+            inCatalogue : Catalogue # Index des métadonnées des fichiers (None : pas de catalogue)
+            inPasReechantillonnage : float # Pas en mètres du rééchantillonnage des traces (None : pas de 
+                                     rééchantillonnage). Le cache n'est pas utilisé avec un rééchantillonnage
+    """
+    # Fichiers exclus par le catalogue : aucun de leurs points ne peut être retenu
+    dicoTableaux={}
+    if inCatalogue is not None and (inEmprise is not None or inFenetreTemps is not None):
+        for fichier in inFichiers:
+            if not inCatalogue.peut_contribuer(fichier,inEmprise,inFenetreTemps):
+                dicoTableaux[fichier]=np.empty((0,3))
+    
+    # Récupération dans le cache des fichiers déjà lus
+    if inFenetreTemps is not None or inPasReechantillonnage is not None:
+        inCache=None
+    if inCache is not None:
+        for fichier in inFichiers:
+            tableau=inCache.lire(fichier) if fichier not in dicoTableaux else None
+            if tableau is not None:
+                dicoTableaux[fichier]=_filtrer_coordonnees(tableau,inEmprise)
+    lstALire=[fichier for fichier in inFichiers if fichier not in dicoTableaux]
+    
+    # Lecture des autres fichiers : chaque lecture renvoie un tableau compact (n lignes, 3 colonnes) des coordonnées de ses points
+    # Avec un cache, tous les points sont lus pour y être mis, puis filtrés ; sinon ils sont filtrés au fil de la lecture
+    emprise=inEmprise if inCache is None else None
+    if inNbProcessus==1 or len(lstALire)<2:
+        lstLus=[_lire_coordonnees_GPX(fichier,emprise,inFenetreTemps,inPasReechantillonnage) for fichier in lstALire]
+    else:
+        # Lecture parallèle : map renvoie les tableaux dans l'ordre de la liste des fichiers
+        with ProcessPoolExecutor(max_workers=inNbProcessus) as executeur:
+            lstLus=list(executeur.map(_lire_coordonnees_GPX,lstALire,repeat(emprise),repeat(inFenetreTemps),
+                                      repeat(inPasReechantillonnage)))
+    for fichier,tableau in zip(lstALire,lstLus):
+        if inCache is not None:
+            inCache.ecrire(fichier,tableau)
+            tableau=_filtrer_coordonnees(tableau,inEmprise)
+        dicoTableaux[fichier]=tableau
+    if inCache is not None and lstALire:
+        inCache.evincer() # le cache est ramené à sa taille maximale
+    return dicoTableaux
+
+def _filtrer_coordonnees (inCoordonnees,inEmprise) : # return numpy array
+    """
+    ROLE : renvoie les lignes d'un tableau de coordonnées (n lignes, 3 colonnes) situées dans l'emprise
+    ENTREES inCoordonnees : numpy array
+            inEmprise : tuple (lonMin, latMin, lonMax, latMax) # None : le tableau est renvoyé tel quel
+    """
+    if inEmprise is None:
+        return inCoordonnees
+    return inCoordonnees[_masque_emprise(inCoordonnees[:,0],inCoordonnees[:,1],inEmprise)]
+
+def _masque_emprise (inLongitudes,inLatitudes,inEmprise) : # return numpy array
+    """
+    ROLE : renvoie le masque (tableau de booléens) des points situés dans l'emprise (bornes comprises)
+    ENTREES inLongitudes, inLatitudes : numpy array
+            inEmprise : tuple (lonMin, latMin, lonMax, latMax)
+    """
+    lonMin,latMin,lonMax,latMax=inEmprise
+    return (inLongitudes>=lonMin)&(inLongitudes<=lonMax)&(inLatitudes>=latMin)&(inLatitudes<=latMax)
+
+def _masque_fenetre_temps (inTemps,inFenetreTemps) : # return numpy array
+    """
+    ROLE : renvoie le masque (tableau de booléens) des points relevés dans la fenêtre de temps (bornes comprises). 
+           Les points sans heure de relevé n'en font pas partie
+    ENTREES inTemps : numpy array # Temps en millisecondes (int64, TEMPS_ABSENT si absent)
+            inFenetreTemps : tuple (debut, fin) # en secondes depuis le 01/01/1970 UTC, une borne None n'est pas filtrée
+    """
+    debut,fin=inFenetreTemps
+    masque=inTemps!=TEMPS_ABSENT
+    if debut is not None:
+        masque&=inTemps>=debut*1000
+    if fin is not None:
+        masque&=inTemps<=fin*1000
+    return masque
+
+def _hors_emprise (inBornes,inEmprise) : # return bool
+    """
+    ROLE : indique si des bornes (lonMin, latMin, lonMax, latMax) ne recoupent pas l'emprise
+    """
+    return (inBornes[2]<inEmprise[0] or inBornes[0]>inEmprise[2] or 
+            inBornes[3]<inEmprise[1] or inBornes[1]>inEmprise[3])
+
+def _hors_fenetre_temps (inDebut,inFin,inFenetreTemps) : # return bool
+    """
+    ROLE : indique si une période (debut, fin, en secondes) ne recoupe pas la fenêtre de temps
+    """
+    debut,fin=inFenetreTemps
+    return (debut is not None and inFin<debut) or (fin is not None and inDebut>fin)
+
+def _empreinte_fichier (inFichier) : # return str
+    """
+    ROLE : renvoie l'empreinte (BLAKE2b, en hexadécimal) du contenu d'un fichier, lu par blocs. 
+           Un fichier compressé est pris tel quel, un membre d'archive zip est extrait (voir _ouvrir_brut).
+    ENTREE inFichier : str # Chemin d'accès au fichier (ou archive.zip/membre.gpx)
+    """
+    empreinte=hashlib.blake2b(digest_size=20)
+    with _ouvrir_brut(inFichier) as fichier:
+        for bloc in iter(lambda: fichier.read(1024*1024),b''):
+            empreinte.update(bloc)
+    return empreinte.hexdigest()
+
+def _decrire_fichier_GPX (inFichierGPX) : # return dict
+    """
+    ROLE : lit un fichier GPX au fil de l'eau et renvoie la fiche de ses métadonnées pour le Catalogue : 
+           taille et date de modification, empreinte, nombre de points, emprise (longitudes et latitudes mini et maxi,
+           None si le fichier n'a aucun point), période de relevé (instants de début et de fin en secondes depuis le 
+           01/01/1970 UTC, None si aucun point n'a d'heure) et type d'activité. Fonction du module (et non méthode) 
+           pour pouvoir être exécutée dans un processus de lecture parallèle.
+    ENTREE inFichierGPX : str # Chemin d'accès au fichier GPX
+    """
+    taille,dateModif=_etat_fichier(inFichierGPX)
+    dicoEntete={}
+    longitudes,latitudes,_,temps=_lire_colonnes_GPX(inFichierGPX,dicoEntete)
+    dicoFiche={'taille':taille,'date_modif':dateModif,'empreinte':_empreinte_fichier(inFichierGPX),
+               'nbre_points':len(longitudes),'lon_min':None,'lat_min':None,'lon_max':None,'lat_max':None,
+               'debut':None,'fin':None,'activite':dicoEntete['activite']}
+    if len(longitudes):
+        dicoFiche.update(lon_min=float(longitudes.min()),lat_min=float(latitudes.min()),
+                         lon_max=float(longitudes.max()),lat_max=float(latitudes.max()))
+    temps=temps[temps!=TEMPS_ABSENT]
+    if len(temps):
+        dicoFiche.update(debut=temps.min()/1000.,fin=temps.max()/1000.)
+    return dicoFiche
+
+def _concatener_coordonnees (inTableaux) : # return numpy array
+    """
+    ROLE : met bout à bout des tableaux de coordonnées (n lignes, 3 colonnes) dans un unique tableau 
+    ENTREE inTableaux : liste de numpy array
+    """
+    if not inTableaux:
+        return np.empty((0,3))
+    return np.concatenate(inTableaux)
+
+def _eclaircir_coordonnees (inCoordonnees,inTailleCellule,inMethode) : # return numpy array
+    """
+    ROLE : renvoie un tableau de coordonnées (n lignes, 3 colonnes) ayant un point par cellule occupée d'une grille 
+           régulière (voir Relief.eclaircir_points). Les points sont groupés par cellule en triant leur numéro de cellule,
+           sans boucle Python ; les cellules sont rangées dans l'ordre de leur numéro.
+    ENTREES inCoordonnees : numpy array
+            inTailleCellule : float # Côté des cellules en degrés
+            inMethode : str # 'moyenne', 'mediane' ou 'dernier'
+    """
+    if len(inCoordonnees)==0:
+        return np.empty((0,3))
+    longitudes,latitudes,altitudes=inCoordonnees[:,0],inCoordonnees[:,1],inCoordonnees[:,2]
+    
+    # Numéro de cellule de chaque point : colonne * nombre de lignes + ligne
+    colonnes=np.floor((longitudes-longitudes.min())/inTailleCellule).astype(np.int64)
+    lignes=np.floor((latitudes-latitudes.min())/inTailleCellule).astype(np.int64)
+    cellules=colonnes*(lignes.max()+1)+lignes
+    
+    # Tri par cellule (puis par altitude pour la médiane, par rang de chargement sinon : le tri est stable)
+    ordre=np.lexsort((altitudes,cellules)) if inMethode=='mediane' else np.argsort(cellules,kind='stable')
+    cellulesTriees=cellules[ordre]
+    debuts=np.flatnonzero(np.r_[True,cellulesTriees[1:]!=cellulesTriees[:-1]]) # premier point de chaque cellule
+    effectifs=np.diff(np.r_[debuts,len(ordre)])
+    
+    # Barycentre et altitude de chaque cellule
+    fusion=np.empty((len(debuts),3))
+    fusion[:,0]=np.add.reduceat(longitudes[ordre],debuts)/effectifs
+    fusion[:,1]=np.add.reduceat(latitudes[ordre],debuts)/effectifs
+    altitudesTriees=altitudes[ordre]
+    if inMethode=='moyenne':
+        fusion[:,2]=np.add.reduceat(altitudesTriees,debuts)/effectifs
+    elif inMethode=='mediane':
+        fusion[:,2]=(altitudesTriees[debuts+(effectifs-1)//2]+altitudesTriees[debuts+effectifs//2])/2
+    else:
+        fusion[:,2]=altitudesTriees[debuts+effectifs-1]
+    return fusion
+
+def _types_des_points (inPoints) : # return tuple de numpy array
+    """
+    ROLE : renvoie les colonnes (natures en int8, rangs des traces et des tronçons en int32) d'une séquence d'objets Point
+    ENTREE inPoints : séquence d'objets Point
+    """
+    nbre=len(inPoints)
+    return (np.fromiter((point.nature() for point in inPoints),dtype=np.int8,count=nbre),
+            np.fromiter((point.trace() for point in inPoints),dtype=np.int32,count=nbre),
+            np.fromiter((point.troncon() for point in inPoints),dtype=np.int32,count=nbre))
+
+def _types_par_defaut (inNbre,inNatures=None,inTraces=None,inTroncons=None) : # return tuple de numpy array
+    """
+    ROLE : renvoie les colonnes des types de inNbre points, les colonnes absentes (None) étant celles de points 
+           du premier tronçon d'une trace (NATURE_TRACE, trace 0, tronçon 0)
+    ENTREES inNbre : int # nombre de points
+            inNatures, inTraces, inTroncons : tableaux d'entiers ou None
+    """
+    return (np.full(inNbre,NATURE_TRACE,dtype=np.int8) if inNatures is None else np.asarray(inNatures,dtype=np.int8),
+            np.zeros(inNbre,dtype=np.int32) if inTraces is None else np.asarray(inTraces,dtype=np.int32),
+            np.zeros(inNbre,dtype=np.int32) if inTroncons is None else np.asarray(inTroncons,dtype=np.int32))
+
+def _colonnes_des_points (inPoints) : # return tuple de numpy array
+    """
+    ROLE : renvoie les caractéristiques d'une séquence d'objets Point en colonnes numpy : (longitudes, latitudes, 
+           élévations) en float64 et temps en int64 (millisecondes, voir _temps_du_point)
+    ENTREE inPoints : séquence d'objets Point
+    """
+    nbre=len(inPoints)
+    return (np.fromiter((point.longitude() for point in inPoints),dtype=np.float64,count=nbre),
+            np.fromiter((point.latitude() for point in inPoints),dtype=np.float64,count=nbre),
+            np.fromiter((point.elevation() for point in inPoints),dtype=np.float64,count=nbre),
+            np.fromiter((_temps_du_point(point) for point in inPoints),dtype=np.int64,count=nbre))
+
+def _reconstruire_segment_colonnaire (inNom,inIncremental,inColonnes) : # return SegmentColonnaire
+    """
+    ROLE : reconstruit un objet SegmentColonnaire sérialisé (voir SegmentColonnaire.__reduce__) à partir de ses colonnes
+    ENTREES inNom : str ; inIncremental : bool
+            inColonnes : tuple des sept colonnes du segment (voir _lire_colonnes_GPX avec inTypes)
+    """
+    segment=SegmentColonnaire(inNom,inIncremental)
+    segment.extend_colonnes(*inColonnes)
+    return segment
+
+def _temps_du_point (inPoint) : # return int
+    """
+    ROLE : renvoie l'instant de relevé d'un objet Point en millisecondes, tel que stocké dans la colonne 
+           des temps d'un SegmentColonnaire (TEMPS_ABSENT si le point n'a pas d'heure)
+    ENTREE inPoint : Point
+    """
+    instant=inPoint.instant()
+    if instant is None:
+        return TEMPS_ABSENT
+    return int(round(instant*1000))
+
+def _instant_GPX (inHeureGPX) : # return float
+    """
+    ROLE : renvoie le nombre de secondes écoulées depuis le 01/01/1970 (UTC) pour une heure 
+           GPX de la forme "2017-09-18T08:24:11Z" ; None si l'heure est absente ou invalide
+    ENTREE inHeureGPX : str # heure GPX au format ISO 8601
+    """
+    if not inHeureGPX:
+        return None
+    try:
+        return gpxfield.parse_time_to_epoch(inHeureGPX.strip()) # les fractions de seconde sont conservées
+    except GPXException:
+        return None
+
+def _instant_releve (inHeure) : # return float
+    """
+    ROLE : renvoie l'instant de relevé d'un point en secondes depuis le 01/01/1970 (UTC) ; None si l'heure est absente
+    ENTREE inHeure : float (déjà en secondes), datetime (UTC si sans fuseau), str "10:20:14" (heure sans date, comptée 
+                     depuis 0h0'0") ou heure GPX "2017-09-18T08:24:11Z", ou None
+    """
+    if inHeure is None or inHeure in ('None',''):
+        return None
+    if isinstance(inHeure,datetime):
+        return calendar.timegm(inHeure.utctimetuple())+inHeure.microsecond/1000000.
+    if isinstance(inHeure,str):
+        if 'T' in inHeure or '-' in inHeure:
+            return _instant_GPX(inHeure)
+        return _instant_en_secondes(inHeure)
+    return float(inHeure)
+
+def _instant_en_heure (inInstant) : # return str
+    """
+    ROLE : renvoie l'heure "10:20:14" (UTC) correspondant à l'instant inInstant ; None si l'instant est absent
+    ENTREE inInstant : float # secondes écoulées depuis le 01/01/1970 (UTC)
+    """
+    if inInstant is None:
+        return None
+    return time.strftime("%H:%M:%S",time.gmtime(inInstant))
+
 def _instant_en_secondes (inInstantEnChaine) : # return ...
     """
     ROLE : renvoie le nombre de secondes écoulées entre 0h0'0" et l'instant
@@ -15,22 +15,28 @@
 # limitations under the License.
 
 
-def parse(xml_or_file, parser=None, version = None):
+def parse(xml_or_file, parser=None, version = None, fields=None):
     """
     Parse xml (string) or file object. This is just an wrapper for
     GPXParser.parse() function.
 
-    parser may be 'lxml', 'minidom' or None (then it will be automatically
-    detected, lxml if possible).
+    parser may be 'lxml', 'minidom', 'expat' or None (then it will be
+    automatically detected, lxml if possible, otherwise expat).
 
-    xml_or_file must be the xml to parse or a file-object with the XML.
+    xml_or_file must be the xml to parse (str, bytes or a memory-mapped
+    file) or a file-object with the XML. Prefer bytes or binary files: they
+    are passed to the XML engine without decoding.
 
     version may be '1.0', '1.1' or None (then it will be read from the gpx
     xml node if possible, if not then version 1.0 will be used).
+
+    fields may be a list of the GPX field names to parse (for example
+    ['latitude', 'longitude', 'elevation', 'time']), the others are skipped.
+    None (default) parses every field.
     """
 
     from . import parser as mod_parser
 
-    parser = mod_parser.GPXParser(xml_or_file, parser=parser)
+    parser = mod_parser.GPXParser(xml_or_file, parser=parser, fields=fields)
 
     return parser.parse(version)
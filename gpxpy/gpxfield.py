@@ -14,8 +14,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import inspect as mod_inspect
 import datetime as mod_datetime
+import calendar as mod_calendar
+import array as mod_array
+import re as mod_re
 
 from . import utils as mod_utils
 
@@ -26,24 +28,101 @@ class GPXFieldTypeConverter:
         self.to_string = to_string
 
 
+# The usual GPX time shape: YYYY-MM-DDTHH:MM:SS, optional fractional seconds and optional Z:
+ISO_TIME_RE = mod_re.compile(r'^(\d{4})-(\d\d)-(\d\d)[T ](\d\d):(\d\d):(\d\d)(?:\.(\d+))?Z?$', mod_re.ASCII)
+
+EPOCH_ORDINAL = mod_datetime.date(1970, 1, 1).toordinal()
+
+
+def _parse_iso_time_fields(string):
+    """
+    Fast path for the common YYYY-MM-DDTHH:MM:SS(.fff)Z shape. Returns the
+    tuple (year, month, day, hour, minute, second, microsecond) or None if
+    the string has another shape.
+    """
+    match = ISO_TIME_RE.match(string)
+    if not match:
+        return None
+    year, month, day, hour, minute, second, fraction = match.groups()
+    microsecond = int((fraction + '00000')[:6]) if fraction else 0
+    return int(year), int(month), int(day), int(hour), int(minute), int(second), microsecond
+
+
 def parse_time(string):
     from . import gpx as mod_gpx
     if not string:
         return None
+    fields = _parse_iso_time_fields(string)
+    if fields:
+        try:
+            return mod_datetime.datetime(*fields)
+        except ValueError:
+            pass
+    # Unusual inputs, try all the DATE_FORMATS:
     if 'T' in string:
         string = string.replace('T', ' ')
     if 'Z' in string:
         string = string.replace('Z', '')
+    candidates = [string]
     if '.' in string:
-        string = string.split('.')[0]
-    for date_format in mod_gpx.DATE_FORMATS:
-        try:
-            return mod_datetime.datetime.strptime(string, date_format)
-        except ValueError:
-            pass
+        candidates.append(string.split('.')[0])
+    for candidate in candidates:
+        for date_format in mod_gpx.DATE_FORMATS:
+            try:
+                return mod_datetime.datetime.strptime(candidate, date_format)
+            except ValueError:
+                pass
     raise mod_gpx.GPXException('Invalid time: %s' % string)
 
 
+def parse_time_to_epoch(string):
+    """
+    Parse a GPX time into seconds since 1970-01-01 UTC (float, sub-second
+    precision is kept). Returns None for an empty string and throws
+    GPXException for an invalid time.
+    """
+    if not string:
+        return None
+    time = parse_time(string)
+    return mod_calendar.timegm(time.timetuple()) + time.microsecond / 1000000.
+
+
+def parse_times_to_epoch(strings, invalid=float('nan')):
+    """
+    Batch version of parse_time_to_epoch(). Returns an array.array('d') of
+    seconds since 1970-01-01 UTC (usable by numpy without copy), with the
+    invalid value for empty or invalid times.
+
+    Times of the usual shape are converted without building datetime
+    objects, and the number of days since the epoch is computed only once
+    per distinct date.
+    """
+    from . import gpx as mod_gpx
+    result = mod_array.array('d')
+    days = {}
+    for string in strings:
+        fields = _parse_iso_time_fields(string) if string else None
+        if fields:
+            date = fields[:3]
+            day_seconds = days.get(date)
+            if day_seconds is None:
+                try:
+                    day_seconds = (mod_datetime.date(*date).toordinal() - EPOCH_ORDINAL) * 86400
+                except ValueError:
+                    day_seconds = False
+                days[date] = day_seconds
+            hour, minute, second, microsecond = fields[3:]
+            if day_seconds is not False and hour < 24 and minute < 60 and second < 60:
+                result.append(day_seconds + hour * 3600 + minute * 60 + second + microsecond / 1000000.)
+                continue
+        try:
+            epoch = parse_time_to_epoch(string)
+        except mod_gpx.GPXException:
+            epoch = None
+        result.append(invalid if epoch is None else epoch)
+    return result
+
+
 # ----------------------------------------------------------------------------------------------------
 # Type converters used to convert from/to the string in the XML:
 # ----------------------------------------------------------------------------------------------------
@@ -125,6 +204,12 @@ class GPXField(AbstractGPXField):
             __node = parser.get_first_child(node, self.tag)
             result = parser.get_node_data(__node)
 
+        return self.convert(result)
+
+    def convert(self, result):
+        """
+        Converts the raw attribute value or node text (None if missing) into the field value.
+        """
         if result is None:
             if self.mandatory:
                 from . import gpx as mod_gpx
@@ -174,10 +259,12 @@ class GPXComplexField(AbstractGPXField):
                     result.append(gpx_fields_from_xml(self.classs, parser, child_node, version))
             return result
         else:
-            field_node = parser.get_first_child(node, self.tag)
-            if field_node is None:
-                return None
-            return gpx_fields_from_xml(self.classs, parser, field_node, version)
+            return self.from_node(parser, parser.get_first_child(node, self.tag), version)
+
+    def from_node(self, parser, field_node, version):
+        if field_node is None:
+            return None
+        return gpx_fields_from_xml(self.classs, parser, field_node, version)
 
     def to_xml(self, value, version):
         if self.is_list:
@@ -200,8 +287,9 @@ class GPXEmailField(AbstractGPXField):
         self.tag = tag or name
 
     def from_xml(self, parser, node, version):
-        email_node = parser.get_first_child(node, self.tag)
+        return self.from_node(parser, parser.get_first_child(node, self.tag), version)
 
+    def from_node(self, parser, email_node, version):
         if email_node is None:
             return None
 
@@ -241,7 +329,10 @@ class GPXExtensionsField(AbstractGPXField):
         if node is None:
             return result
 
-        extensions_node = parser.get_first_child(node, self.tag)
+        return self.from_node(parser, parser.get_first_child(node, self.tag), version)
+
+    def from_node(self, parser, extensions_node, version):
+        result = {}
 
         if extensions_node is None:
             return result
@@ -315,39 +406,153 @@ def gpx_fields_to_xml(instance, tag, version, custom_attributes=None):
     return body
 
 
-def gpx_fields_from_xml(class_or_instance, parser, node, version):
-    if mod_inspect.isclass(class_or_instance):
-        result = class_or_instance()
-    else:
-        result = class_or_instance
+# Kinds of steps in a field extraction plan:
+PLAN_ATTRIBUTE = 'attribute'  # attribute of the node
+PLAN_TEXT = 'text'            # text of the first child node with the tag
+PLAN_NODE = 'node'            # complex field built from the first child node with the tag
+PLAN_LIST = 'list'            # complex field built from every child node with the tag
+PLAN_GROUP = 'group'          # nested plan applied to the first child node with the tag
+PLAN_FIELD = 'field'          # any other field, which looks up its own nodes
 
-    fields = result.gpx_10_fields
-    if version == '1.1':
-        fields = result.gpx_11_fields
 
-    node_path = [ node ]
+class GPXFieldsPlan:
+    """
+    Extraction plan for one node level of a gpx_10_fields/gpx_11_fields list. Path markers ('link' ...
+    '/link') become nested plans, so that the fields of a node are read in one pass over its children.
 
+    A plan is streamable (see parser.ExpatParser) when each child tag has only one step, and
+    no step needs to look up its own nodes.
+    """
+    def __init__(self):
+        self.steps = []
+        self.first_tags = set()
+        self.list_tags = set()
+        self.attribute_steps = []
+        self.tag_steps = {}
+        self.streamable = True
+
+    def add_step(self, kind, tag, item):
+        self.steps.append((kind, tag, item))
+        if kind == PLAN_ATTRIBUTE:
+            self.attribute_steps.append(item)
+        elif kind == PLAN_FIELD:
+            self.streamable = False
+        else:
+            if kind == PLAN_LIST:
+                self.list_tags.add(tag)
+            else:
+                self.first_tags.add(tag)
+            if tag in self.tag_steps:
+                self.streamable = False
+            self.tag_steps[tag] = (kind, item)
+
+
+def compile_fields_plan(fields, projection=None):
+    """
+    Compiles a gpx_10_fields/gpx_11_fields list. If projection (a set of field names) is given, only
+    those fields are extracted, plus the container fields (complex lists and path groups) needed to
+    reach them.
+    """
+    root_plan = GPXFieldsPlan()
+    plans = [root_plan]
     for gpx_field in fields:
-        current_node = node_path[-1]
-        if isinstance (gpx_field, str):
+        plan = plans[-1]
+        if isinstance(gpx_field, str):
             if gpx_field.startswith('/'):
-                node_path.pop()
+                group_plan = plans.pop()
+                plans[-1].streamable = plans[-1].streamable and group_plan.streamable
             else:
-                if current_node is None:
-                    node_path.append(None)
-                else:
-                    node_path.append(parser.get_first_child(current_node, gpx_field))
+                group_plan = GPXFieldsPlan()
+                plan.add_step(PLAN_GROUP, gpx_field, group_plan)
+                plans.append(group_plan)
+        elif projection is not None and gpx_field.name not in projection and \
+                not (gpx_field.is_list and isinstance(gpx_field, GPXComplexField)):
+            continue
+        elif gpx_field.attribute:
+            plan.add_step(PLAN_ATTRIBUTE, None, gpx_field)
+        elif gpx_field.is_list and isinstance(gpx_field, GPXComplexField):
+            plan.add_step(PLAN_LIST, gpx_field.tag, gpx_field)
+        elif isinstance(gpx_field, GPXField) and isinstance(gpx_field.tag, str):
+            plan.add_step(PLAN_TEXT, gpx_field.tag, gpx_field)
+        elif isinstance(gpx_field, (GPXComplexField, GPXEmailField, GPXExtensionsField)):
+            plan.add_step(PLAN_NODE, gpx_field.tag, gpx_field)
         else:
-            if current_node is not None:
-                value = gpx_field.from_xml(parser, current_node, version)
-                setattr(result, gpx_field.name, value)
-            elif gpx_field.attribute:
-                value = gpx_field.from_xml(parser, node, version)
-                setattr(result, gpx_field.name, value)
+            plan.add_step(PLAN_FIELD, None, gpx_field)
+    while len(plans) > 1:
+        group_plan = plans.pop()
+        plans[-1].streamable = plans[-1].streamable and group_plan.streamable
+    return root_plan
+
+
+_fields_plans = {}
+
+
+def get_fields_plan(classs, version, projection=None):
+    """
+    Returns the (cached) extraction plan of the GPX fields of classs for this GPX version.
+    projection is None (all fields) or a frozenset of the field names to extract.
+    """
+    key = (classs, version == '1.1', projection)
+    plan = _fields_plans.get(key)
+    if plan is None:
+        fields = classs.gpx_11_fields if version == '1.1' else classs.gpx_10_fields
+        plan = _fields_plans[key] = compile_fields_plan(fields, projection)
+    return plan
+
+
+def gpx_fields_from_xml(class_or_instance, parser, node, version, projection=None):
+    if isinstance(class_or_instance, type):
+        result = class_or_instance()
+    else:
+        result = class_or_instance
+
+    plan = get_fields_plan(result.__class__, version, projection)
+    apply_fields_plan(plan, result, parser, node, node, version, projection)
 
     return result
 
 
+def apply_fields_plan(plan, result, parser, node, root_node, version, projection=None):
+    first_children = {}
+    list_children = {}
+    if plan.first_tags or plan.list_tags:
+        for child_node in parser.get_children(node):
+            name = parser.get_node_name(child_node)
+            if name in plan.list_tags:
+                list_children.setdefault(name, []).append(child_node)
+            if name in plan.first_tags and name not in first_children:
+                first_children[name] = child_node
+
+    for kind, tag, item in plan.steps:
+        if kind == PLAN_TEXT:
+            setattr(result, item.name, item.convert(parser.get_node_data(first_children.get(tag))))
+        elif kind == PLAN_ATTRIBUTE:
+            setattr(result, item.name, item.from_xml(parser, node, version))
+        elif kind == PLAN_LIST:
+            setattr(result, item.name, [gpx_fields_from_xml(item.classs, parser, child_node, version, projection)
+                                        for child_node in list_children.get(tag, ())])
+        elif kind == PLAN_NODE:
+            setattr(result, item.name, item.from_node(parser, first_children.get(tag), version))
+        elif kind == PLAN_GROUP:
+            group_node = first_children.get(tag)
+            if group_node is None:
+                apply_missing_group_plan(item, result, parser, root_node, version)
+            else:
+                apply_fields_plan(item, result, parser, group_node, root_node, version, projection)
+        else:
+            setattr(result, item.name, item.from_xml(parser, node, version))
+
+
+def apply_missing_group_plan(plan, result, parser, root_node, version):
+    # The group node is missing: only attribute fields are read, from the root node (as before the
+    # plans were introduced), the other fields keep their default values.
+    for kind, tag, item in plan.steps:
+        if kind == PLAN_ATTRIBUTE:
+            setattr(result, item.name, item.from_xml(parser, root_node, version))
+        elif kind == PLAN_GROUP:
+            apply_missing_group_plan(item, result, parser, root_node, version)
+
+
 def gpx_check_slots_and_default_values(classs):
     """
     Will fill the default values for this class. Instances will inherit those
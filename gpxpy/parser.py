@@ -17,7 +17,9 @@
 from __future__ import print_function
 
 import logging as mod_logging
+import mmap as mod_mmap
 import xml.dom.minidom as mod_minidom
+import xml.parsers.expat as mod_expat
 
 try:
     import lxml.etree as mod_etree
@@ -95,12 +97,15 @@ class LXMLParser:
         if not mod_etree:
             raise Exception('Cannot use LXMLParser without lxml installed')
 
-        if mod_utils.PYTHON_VERSION[0] == '3':
+        if mod_utils.PYTHON_VERSION[0] == '3' and isinstance(xml, str):
             # In python 3 all strings are unicode and for some reason lxml
             # don't like unicode strings with XMLs declared as UTF-8:
             self.xml = xml.encode('utf-8')
-        else:
+        elif isinstance(xml, (bytes, str)):
             self.xml = xml
+        else:
+            # Memory-mapped file or other buffer: lxml only parses bytes
+            self.xml = bytes(xml)
 
         self.dom = mod_etree.XML(self.xml)
         # get the namespace
@@ -152,22 +157,261 @@ class LXMLParser:
         return node.attrib.get(attribute)
 
 
+class ExpatNode:
+    """
+    Element kept by ExpatParser for the fields which need a node (attributes, small subtrees such
+    as bounds, email or extensions).
+    """
+    __slots__ = ('name', 'attributes', 'children', 'text')
+
+    def __init__(self, name, attributes):
+        self.name = name
+        self.attributes = attributes
+        self.children = []
+        self.text = None
+
+
+# Kinds of ExpatParser frames:
+FRAME_PLAN = 'plan'        # object (or path group) filled from the gpxfield extraction plan
+FRAME_TEXT = 'text'        # text of a simple field
+FRAME_CAPTURE = 'capture'  # subtree kept as ExpatNode's
+FRAME_SKIP = 'skip'        # subtree not needed by any field
+
+
+class ExpatFrame:
+    __slots__ = ('kind', 'plan', 'result', 'node', 'root_node', 'seen', 'item', 'parts', 'depth', 'nodes')
+
+    def __init__(self, kind, result=None, item=None):
+        self.kind = kind
+        self.result = result
+        self.item = item
+        self.depth = 0
+
+
+class ExpatParser:
+    """
+    Used when lxml is not available (or with parser='expat'). Uses the standard expat event parser and
+    fills the GPX objects while reading, following the gpxfield extraction plans, without building a DOM.
+    Only the small subtrees needed by complex fields are kept, as ExpatNode's.
+    """
+
+    def __init__(self, xml):
+        self.xml = xml
+        self.dom = None
+        self.version = None
+        self.projection = None
+        self.frames = []
+
+    def parse_gpx(self, gpx, version=None, projection=None):
+        self.version = version
+        self.projection = projection
+        self.frames = []
+        self.dom = None
+
+        # Without namespace processing, names are qualified names (ns3:TrackPointExtension) as with minidom:
+        parser = mod_expat.ParserCreate()
+        parser.buffer_text = True
+        parser.StartElementHandler = self.start_element
+        parser.EndElementHandler = self.end_element
+        parser.CharacterDataHandler = self.character_data
+        parser.CommentHandler = self.comment
+        self.gpx = gpx
+        parser.Parse(self.xml, True)
+
+        if self.dom is None:
+            raise mod_gpx.GPXException('Document must have a `gpx` root node.')
+
+        return gpx
+
+    def push_object(self, result, name, attributes):
+        plan = mod_gpxfield.get_fields_plan(result.__class__, self.version, self.projection)
+        node = ExpatNode(name, attributes)
+        if not plan.streamable:
+            frame = ExpatFrame(FRAME_CAPTURE, result)
+            frame.nodes = [node]
+            self.frames.append(frame)
+            return node
+        self.push_plan(plan, result, node, node)
+        return node
+
+    def push_plan(self, plan, result, node, root_node):
+        for item in plan.attribute_steps:
+            setattr(result, item.name, item.from_xml(self, node, self.version))
+        for kind, tag, item in plan.steps:
+            if kind == mod_gpxfield.PLAN_LIST:
+                setattr(result, item.name, [])
+        frame = ExpatFrame(FRAME_PLAN, result)
+        frame.plan = plan
+        frame.node = node
+        frame.root_node = root_node
+        frame.seen = set()
+        self.frames.append(frame)
+
+    def start_element(self, name, attributes):
+        if not self.frames:
+            if self.dom is not None or name != 'gpx':
+                self.frames.append(ExpatFrame(FRAME_SKIP))
+                return
+            if self.version is None:
+                self.version = attributes.get('version')
+            self.dom = self.push_object(self.gpx, name, attributes)
+            return
+
+        frame = self.frames[-1]
+        kind = frame.kind
+
+        if kind == FRAME_CAPTURE:
+            node = ExpatNode(name, attributes)
+            frame.nodes[-1].children.append(node)
+            frame.nodes.append(node)
+        elif kind == FRAME_PLAN:
+            plan = frame.plan
+            if name in plan.list_tags:
+                item = plan.tag_steps[name][1]
+                result = item.classs()
+                getattr(frame.result, item.name).append(result)
+                self.push_object(result, name, attributes)
+            elif name in plan.first_tags and name not in frame.seen:
+                frame.seen.add(name)
+                step_kind, item = plan.tag_steps[name]
+                if step_kind == mod_gpxfield.PLAN_TEXT:
+                    text_frame = ExpatFrame(FRAME_TEXT, frame.result, item)
+                    text_frame.parts = []
+                    self.frames.append(text_frame)
+                elif step_kind == mod_gpxfield.PLAN_GROUP:
+                    self.push_plan(item, frame.result, ExpatNode(name, attributes), frame.root_node)
+                else:
+                    capture_frame = ExpatFrame(FRAME_CAPTURE, frame.result, item)
+                    capture_frame.nodes = [ExpatNode(name, attributes)]
+                    self.frames.append(capture_frame)
+            else:
+                self.frames.append(ExpatFrame(FRAME_SKIP))
+        else:
+            # Only the text before the first child node is the node data (as with lxml):
+            if kind == FRAME_TEXT and frame.depth == 0:
+                frame.parts.append(None)
+            frame.depth += 1
+
+    def character_data(self, data):
+        frame = self.frames[-1] if self.frames else None
+        if frame is None:
+            return
+        if frame.kind == FRAME_TEXT:
+            if frame.depth == 0 and (not frame.parts or frame.parts[-1] is not None):
+                frame.parts.append(data)
+        elif frame.kind == FRAME_CAPTURE:
+            node = frame.nodes[-1]
+            if not node.children:
+                node.text = data if node.text is None else node.text + data
+
+    def comment(self, data):
+        # The node data is the text before the first child node, comments included
+        frame = self.frames[-1] if self.frames else None
+        if frame is not None and frame.kind == FRAME_TEXT and frame.depth == 0 and frame.parts:
+            frame.parts.append(None)
+
+    def end_element(self, name):
+        frame = self.frames[-1]
+        kind = frame.kind
+
+        if frame.depth:
+            frame.depth -= 1
+            return
+        if kind == FRAME_CAPTURE:
+            node = frame.nodes.pop()
+            if frame.nodes:
+                return
+
+        self.frames.pop()
+        version = self.version
+
+        if kind == FRAME_TEXT:
+            text = ''.join(part for part in frame.parts if part is not None) or None
+            setattr(frame.result, frame.item.name, frame.item.convert(text))
+        elif kind == FRAME_CAPTURE:
+            if frame.item is None:
+                mod_gpxfield.gpx_fields_from_xml(frame.result, self, node, version, self.projection)
+            else:
+                setattr(frame.result, frame.item.name, frame.item.from_node(self, node, version))
+        elif kind == FRAME_PLAN:
+            # Fields whose nodes were missing:
+            for step_kind, tag, item in frame.plan.steps:
+                if tag is None or tag in frame.seen:
+                    continue
+                if step_kind == mod_gpxfield.PLAN_TEXT:
+                    setattr(frame.result, item.name, item.convert(None))
+                elif step_kind == mod_gpxfield.PLAN_NODE:
+                    setattr(frame.result, item.name, item.from_node(self, None, version))
+                elif step_kind == mod_gpxfield.PLAN_GROUP:
+                    mod_gpxfield.apply_missing_group_plan(item, frame.result, self, frame.root_node, version)
+
+    def get_first_child(self, node=None, name=None):
+        if node is None:
+            return self.dom
+
+        for child_node in node.children:
+            if not name or child_node.name == name:
+                return child_node
+
+        return None
+
+    def get_node_name(self, node):
+        if node is None:
+            return None
+        return node.name
+
+    def get_children(self, node=None):
+        if node is None:
+            node = self.dom
+        return node.children
+
+    def get_node_data(self, node):
+        if node is None:
+            return None
+        return node.text
+
+    def get_node_attribute(self, node, attribute):
+        if node is None:
+            return None
+        return node.attributes.get(attribute)
+
+
 class GPXParser:
-    def __init__(self, xml_or_file=None, parser=None):
+    def __init__(self, xml_or_file=None, parser=None, fields=None):
         """
-        Parser may be lxml of minidom. If you set to None then lxml will be used if installed
-        otherwise minidom.
+        Parser may be lxml, minidom or expat. If you set to None then lxml will be used if installed
+        otherwise expat.
+
+        fields may be a list of GPX field names (for example ['latitude', 'longitude', 'elevation',
+        'time']): only those are parsed, the others (extensions included) are skipped and keep their
+        default values. Container fields (tracks, segments, points, ...) are always parsed.
+        None (default) parses every field.
         """
         self.init(xml_or_file)
         self.gpx = mod_gpx.GPX()
         self.xml_parser_type = parser
         self.xml_parser = None
+        self.fields = None if fields is None else frozenset(fields)
 
     def init(self, xml_or_file):
-        text = xml_or_file.read() if hasattr(xml_or_file, 'read') else xml_or_file
-        if text[:3] == "\xEF\xBB\xBF": #Remove utf-8 Byte Order Mark (BOM) if present
-            text = text[3:]
-        self.xml = mod_utils.make_str(text)
+        """
+        xml_or_file may be the XML as a string, as bytes (or any buffer, for example a memory-mapped
+        file), or a file object (text or binary). Bytes are passed as they are to the XML engine,
+        which decodes them (and skips a UTF-8 Byte Order Mark) itself: a binary file is read once,
+        and a memory-mapped file is not copied (except by lxml, which only parses bytes).
+        """
+        if isinstance(xml_or_file, (bytes, bytearray, memoryview, mod_mmap.mmap)):
+            text = xml_or_file
+        elif hasattr(xml_or_file, 'read'):
+            text = xml_or_file.read()
+        else:
+            text = xml_or_file
+        if isinstance(text, (bytes, bytearray, memoryview, mod_mmap.mmap)):
+            self.xml = text
+        else:
+            self.xml = mod_utils.make_str(text)
+            if self.xml[:1] == '\ufeff': #Remove Byte Order Mark (BOM) if present
+                self.xml = self.xml[1:]
         self.gpx = mod_gpx.GPX()
 
     def parse(self, version = None):
@@ -186,20 +430,26 @@ class GPXParser:
                 if mod_etree:
                     self.xml_parser = LXMLParser(self.xml)
                 else:
-                    self.xml_parser = XMLParser(self.xml)
+                    self.xml_parser = ExpatParser(self.xml)
             elif self.xml_parser_type == 'lxml':
                 self.xml_parser = LXMLParser(self.xml)
             elif self.xml_parser_type == 'minidom':
                 self.xml_parser = XMLParser(self.xml)
+            elif self.xml_parser_type == 'expat':
+                self.xml_parser = ExpatParser(self.xml)
             else:
                 raise mod_gpx.GPXException('Invalid parser type: %s' % self.xml_parser_type)
 
-            self.__parse_dom(version)
+            if isinstance(self.xml_parser, ExpatParser):
+                # No DOM: the GPX objects are filled while parsing
+                self.xml_parser.parse_gpx(self.gpx, version, self.fields)
+            else:
+                self.__parse_dom(version)
 
             return self.gpx
         except Exception as e:
             # The exception here can be a lxml or minidom exception.
-            mod_logging.debug('Error in:\n%s\n-----------\n' % self.xml)
+            mod_logging.debug('Error in:\n%s\n-----------\n', self.xml)
             mod_logging.exception(e)
 
             # The library should work in the same way regardless of the
@@ -220,4 +470,4 @@ class GPXParser:
         if version is None:
             version = self.xml_parser.get_node_attribute(node, 'version')
 
-        mod_gpxfield.gpx_fields_from_xml(self.gpx, self.xml_parser, node, version)
+        mod_gpxfield.gpx_fields_from_xml(self.gpx, self.xml_parser, node, version, self.fields)